@@ -0,0 +1,90 @@
+"""
+Compare building an ast directly while parsing with building the parse tree
+and converting it, and with the ast.parse of the running Python.
+
+Usage: python benchmarks/build_ast.py [file or directory ...]
+
+Only the files that both parsers accept are used, with the unicode_literals
+and print_function futures enabled so that the asts agree. Without arguments,
+the sources of the package itself are used. Needs Python 3.9 or newer.
+"""
+
+from __future__ import print_function
+
+import ast
+import os
+import sys
+import time
+
+from syntaxerrors import astbuilder, astconsts, batch, error, pyparse
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+RUNS = 3
+FLAGS = (astconsts.CO_FUTURE_UNICODE_LITERALS |
+         astconsts.CO_FUTURE_PRINT_FUNCTION)
+
+
+def direct(filename, source):
+    info = pyparse.CompileInfo(filename, "exec", FLAGS)
+    return pyparse.PythonParser(first_error_only=True).parse_to_ast(
+        source, info)
+
+def convert(filename, source):
+    info = pyparse.CompileInfo(filename, "exec", FLAGS)
+    tree = pyparse.PythonParser(first_error_only=True).parse_source(
+        source, info)
+    return astbuilder.tree_to_ast(tree, info)
+
+def host(filename, source):
+    return ast.parse(source, filename)
+
+def measure(sources, func):
+    best = None
+    for i in range(RUNS):
+        t1 = time.time()
+        for filename, source in sources:
+            func(filename, source)
+        t2 = time.time()
+        if best is None or t2 - t1 < best:
+            best = t2 - t1
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        for filename, source in sources:
+            func(filename, source)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = [os.path.dirname(os.path.abspath(pyparse.__file__))]
+    sources = []
+    for filename in batch.find_python_files(paths):
+        with open(filename, "rb") as f:
+            source = f.read()
+        try:
+            host(filename, source)
+            direct(filename, source)
+        except (SyntaxError, ValueError, error.SyntaxError,
+                error.MultipleSyntaxErrors):
+            continue
+        sources.append((filename, source))
+    size = sum([len(source) for _, source in sources])
+    print("%d files, %.1f KiB" % (len(sources), size / 1024.0))
+    for name, func in [("direct", direct),
+                       ("tree+convert", convert),
+                       ("ast.parse", host)]:
+        best, peak = measure(sources, func)
+        line = "%-14s %7.3fs %8.1f KiB/s" % (name, best, size / 1024.0 / best)
+        if peak is not None:
+            line += "   peak memory %8.1f KiB" % (peak / 1024.0, )
+        print(line)
+
+if __name__ == "__main__":
+    main(sys.argv)
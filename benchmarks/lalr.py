@@ -0,0 +1,110 @@
+"""
+Compare the LR driver on the LALR(1) tables (Parser(..., lalr=True)) with the
+DFA parser, on valid sources and on broken copies of them.
+
+Usage: python benchmarks/lalr.py [file or directory ...]
+
+Without arguments, the Python 2 style sources of the package itself are
+used. The sources are tokenized once up front, so only the parsers are
+timed. The broken sources get one random edit each (deleting a character or
+inserting a '(' or ':'), with a fixed seed; they are parsed with the error
+recovery, which prints its progress, so its output is discarded.
+"""
+
+from __future__ import print_function
+
+import os
+import random
+import sys
+import time
+
+from syntaxerrors import batch, error, lrparser, parser, pygram, pyparse
+from syntaxerrors import pytokenizer
+
+RUNS = 3
+SEED = 42
+
+
+class _Discard(object):
+    def write(self, data):
+        pass
+
+    def flush(self):
+        pass
+
+
+def tokenize(source):
+    lines = source.splitlines(True)
+    if lines and not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"
+    return pytokenizer.generate_tokens(lines, 0)
+
+def break_source(rng, source):
+    pos = rng.randrange(len(source))
+    kind = rng.randrange(3)
+    if kind == 0:
+        return source[:pos] + source[pos + 1:]
+    return source[:pos] + (b"(", b":")[kind - 1] + source[pos:]
+
+def parse_all(token_lists, **kwargs):
+    start = pygram.syms.file_input
+    for tokens in token_lists:
+        python_parser = pyparse.PythonParser(**kwargs)
+        python_parser.prepare(start)
+        try:
+            python_parser.add_tokens(tokens)
+        except parser.ParseError:
+            pass
+
+def measure(token_lists, **kwargs):
+    best = None
+    stdout = sys.stdout
+    sys.stdout = _Discard()
+    try:
+        for i in range(RUNS):
+            t1 = time.time()
+            parse_all(token_lists, **kwargs)
+            t2 = time.time()
+            if best is None or t2 - t1 < best:
+                best = t2 - t1
+    finally:
+        sys.stdout = stdout
+    return best
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = [os.path.dirname(os.path.abspath(pyparse.__file__))]
+    rng = random.Random(SEED)
+    valid = []
+    broken = []
+    for filename in batch.find_python_files(paths):
+        with open(filename, "rb") as f:
+            source = f.read()
+        if not source:
+            continue
+        try:
+            tokens = tokenize(source)
+            pyparse.PythonParser(build_tree=False, first_error_only=True,
+                                 ).parse_source(source, pyparse.CompileInfo(
+                                     filename, "exec"))
+            valid.append(tokens)
+            broken.append(tokenize(break_source(rng, source)))
+        except (error.SyntaxError, error.MultipleSyntaxErrors,
+                error.TokenError, error.TokenIndentationError):
+            continue
+    print("%d files, %d tokens" % (len(valid), sum(map(len, valid))))
+    t1 = time.time()
+    lrparser.get_tables(pygram.python_grammar)
+    print("building the LALR(1) tables: %.3fs" % (time.time() - t1, ))
+    for name, token_lists, kwargs in [
+            ("tree", valid, {}),
+            ("validate", valid, {"build_tree": False}),
+            ("recover", broken, {})]:
+        dfa = measure(token_lists, **kwargs)
+        lalr = measure(token_lists, lalr=True, **kwargs)
+        print("%-10s dfa %7.3fs   lalr %7.3fs   %+.0f%%" % (
+            name, dfa, lalr, (lalr / dfa - 1) * 100))
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,62 @@
+"""
+Compare the memory needed to keep parse trees around, and the time needed to
+build them, for the object tree, the tree with collapsed chains and the flat
+tree.
+
+Usage: python benchmarks/treesize.py [file or directory ...]
+
+Needs Python 3 for tracemalloc.
+"""
+
+from __future__ import print_function
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from syntaxerrors import batch, error, pyparse
+
+
+def parse_all(sources, **kwargs):
+    trees = []
+    for filename, source in sources:
+        info = pyparse.CompileInfo(filename, "exec")
+        try:
+            trees.append(pyparse.PythonParser(**kwargs).parse_source(
+                source, info))
+        except (error.SyntaxError, error.MultipleSyntaxErrors):
+            pass
+    return trees
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = [os.path.dirname(os.path.abspath(pyparse.__file__))]
+    sources = []
+    for filename in batch.find_python_files(paths):
+        with open(filename, "rb") as f:
+            sources.append((filename, f.read()))
+    size = sum([len(source) for _, source in sources])
+    print("%d files, %.1f KiB" % (len(sources), size / 1024.0))
+    for name, kwargs in [("tree", {}),
+                         ("collapsed", {"collapse_chains": True}),
+                         ("flat", {"flat_tree": True}),
+                         ("flat+buffer", {"flat_tree": True,
+                                          "compact_tokens": True})]:
+        t1 = time.time()
+        parse_all(sources, **kwargs)
+        t2 = time.time()
+        gc.collect()
+        tracemalloc.start()
+        trees = parse_all(sources, **kwargs)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print("%-12s %7.3fs   retained %9.1f KiB for %d trees" % (
+            name, t2 - t1, retained / 1024.0, len(trees)))
+        del trees
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,72 @@
+"""
+Compare building the parse tree with only checking the syntax.
+
+Usage: python benchmarks/validate.py [file or directory ...]
+
+Without arguments, the Python 2 style sources of the package itself are
+used. Reports the best time of a couple of runs and, on Python 3, the peak
+memory allocated while parsing.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+from syntaxerrors import batch, error, pyparse
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+RUNS = 3
+
+
+def parse_all(sources, **kwargs):
+    for filename, source in sources:
+        info = pyparse.CompileInfo(filename, "exec")
+        try:
+            pyparse.PythonParser(**kwargs).parse_source(source, info)
+        except (error.SyntaxError, error.MultipleSyntaxErrors):
+            pass
+
+def measure(sources, **kwargs):
+    best = None
+    for i in range(RUNS):
+        t1 = time.time()
+        parse_all(sources, **kwargs)
+        t2 = time.time()
+        if best is None or t2 - t1 < best:
+            best = t2 - t1
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        parse_all(sources, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = [os.path.dirname(os.path.abspath(pyparse.__file__))]
+    sources = []
+    for filename in batch.find_python_files(paths):
+        with open(filename, "rb") as f:
+            sources.append((filename, f.read()))
+    size = sum([len(source) for _, source in sources])
+    print("%d files, %.1f KiB" % (len(sources), size / 1024.0))
+    for name, kwargs in [("tree", {}),
+                         ("validate", {"build_tree": False}),
+                         ("first error", {"build_tree": False,
+                                          "first_error_only": True})]:
+        best, peak = measure(sources, **kwargs)
+        line = "%-12s %7.3fs %8.1f KiB/s" % (name, best, size / 1024.0 / best)
+        if peak is not None:
+            line += "   peak memory %8.1f KiB" % (peak / 1024.0, )
+        print(line)
+
+if __name__ == "__main__":
+    main(sys.argv)
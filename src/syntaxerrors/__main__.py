@@ -0,0 +1,5 @@
+import sys
+
+from syntaxerrors.batch import main
+
+sys.exit(main())
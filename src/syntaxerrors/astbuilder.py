@@ -0,0 +1,862 @@
+"""
+Build the tree of the ast module of the running Python while parsing.
+
+The parser calls an ASTBuilder for every token it shifts and every node it
+finishes (see BuilderStackEntry), so the ast nodes are built directly from the
+values of the children and no parse tree is ever allocated. tree_to_ast runs
+the same builder over an existing parse tree.
+
+The builder targets the ast of Python 3.9 and newer. Python 2 constructs that
+have no equivalent there (print and exec statements, backquotes, tuple
+parameters, raise with several arguments, ...) raise error.SyntaxError. String
+literals without a u prefix are bytes, unless unicode_literals is in effect.
+"""
+
+import ast
+import codecs
+import sys
+
+from syntaxerrors import astconsts, error, parser, pygram
+from syntaxerrors.tokenbuffer import TokenView
+
+_token_classes = (parser.Token, TokenView, parser.Terminal)
+
+LOAD = ast.Load()
+STORE = ast.Store()
+DEL = ast.Del()
+
+_binary_ops = {
+    u"|": ast.BitOr, u"^": ast.BitXor, u"&": ast.BitAnd,
+    u"<<": ast.LShift, u">>": ast.RShift,
+    u"+": ast.Add, u"-": ast.Sub,
+    u"*": ast.Mult, u"/": ast.Div, u"%": ast.Mod, u"//": ast.FloorDiv,
+    u"**": ast.Pow,
+}
+
+_augassign_ops = dict([(op + u"=", cls) for op, cls in _binary_ops.items()])
+
+_unary_ops = {u"+": ast.UAdd, u"-": ast.USub, u"~": ast.Invert}
+
+_compare_ops = {
+    u"<": ast.Lt, u">": ast.Gt, u"==": ast.Eq, u">=": ast.GtE,
+    u"<=": ast.LtE, u"<>": ast.NotEq, u"!=": ast.NotEq, u"in": ast.In,
+    u"is": ast.Is,
+}
+
+_constant_names = {u"None": None, u"True": True, u"False": False}
+
+# what the error messages call the expressions that can't be assigned to
+_expr_names = {
+    ast.Call: "function call", ast.Constant: "literal",
+    ast.Lambda: "lambda", ast.Yield: "yield expression",
+    ast.Compare: "comparison", ast.IfExp: "conditional expression",
+    ast.ListComp: "list comprehension", ast.SetComp: "set comprehension",
+    ast.DictComp: "dict comprehension", ast.Dict: "literal",
+    ast.Set: "literal", ast.GeneratorExp: "generator expression",
+}
+
+
+def is_token(value):
+    return isinstance(value, _token_classes)
+
+def _is_op(value, op):
+    return isinstance(value, _token_classes) and value.value == op
+
+def _pos(value):
+    if isinstance(value, ast.AST):
+        return value.lineno, value.col_offset
+    return value.lineno, value.column
+
+def _empty_arguments():
+    return ast.arguments(posonlyargs=[], args=[], vararg=None, kwonlyargs=[],
+                         kw_defaults=[], kwarg=None, defaults=[])
+
+def _fold_comprehensions(comprehension, rest):
+    # rest are the values of the list_iter/comp_iter, the conditions that
+    # directly follow belong to comprehension
+    result = [comprehension]
+    for value in rest:
+        if isinstance(value, ast.comprehension):
+            result.append(value)
+        else:
+            comprehension.ifs.append(value)
+    return result
+
+
+class ASTBuilder(object):
+    """Computes the values of the nodes of the parse tree, which are ast
+    nodes for statements and expressions and lists or tuples for the
+    helper symbols.
+
+    terminal is called with every token and returns its value, nonterminal
+    with the symbol id and the list of the values of the children. For
+    the symbols in passthrough the value of a single child is used directly,
+    without calling nonterminal.
+    """
+
+    def __init__(self, compile_info):
+        if sys.version_info < (3, 9):
+            raise NotImplementedError("building an ast needs Python >= 3.9")
+        self.compile_info = compile_info
+        # id(node) -> position of the outermost parenthesis around node, where
+        # the nodes that contain it start
+        self.parens = {}
+
+    def terminal(self, token):
+        return token
+
+    def nonterminal(self, symbol_id, children):
+        return _handlers[symbol_id - 256](self, children)
+
+    def build(self, node):
+        """Compute the value of the parser.Node node of a parse tree."""
+        if isinstance(node, parser.Terminal):
+            return self.terminal(node)
+        children = [self.build(node.get_child(i))
+                    for i in range(node.num_children())]
+        if len(children) == 1 and self.passthrough[node.type - 256]:
+            return children[0]
+        return self.nonterminal(node.type, children)
+
+    def _start(self, value):
+        if isinstance(value, ast.AST):
+            start = self.parens.get(id(value))
+            if start is not None:
+                return start
+            return value.lineno, value.col_offset
+        return value.lineno, value.column
+
+    def _at(self, node, value):
+        node.lineno, node.col_offset = self._start(value)
+        return node
+
+    def _is_bare_tuple(self, node):
+        # a tuple without parentheses starts where its first element starts
+        return (isinstance(node, ast.Tuple) and node.elts and
+                self._start(node) == self._start(node.elts[0]))
+
+    def error(self, msg, value):
+        lineno, column = _pos(value)
+        line = getattr(value, "line", None)
+        return error.SyntaxError(msg, lineno, column + 1, line,
+                                 self.compile_info.filename)
+
+    def set_context(self, node, ctx):
+        if isinstance(node, (ast.Name, ast.Attribute, ast.Subscript)):
+            if isinstance(node, ast.Name) and node.id == u"None":
+                raise self.error("cannot assign to None", node)
+            node.ctx = ctx
+        elif isinstance(node, (ast.Tuple, ast.List)):
+            node.ctx = ctx
+            for elt in node.elts:
+                self.set_context(elt, ctx)
+        else:
+            name = _expr_names.get(type(node), "operator")
+            if ctx is DEL:
+                raise self.error("can't delete %s" % (name, ), node)
+            raise self.error("can't assign to %s" % (name, ), node)
+        return node
+
+    def unsupported(self, what, value):
+        return self.error("%s can't be represented in this ast" % (what, ),
+                          value)
+
+    # ____________________________________________________________
+    # modules and statements
+
+    def handle_file_input(self, children):
+        body = []
+        for child in children:
+            if isinstance(child, list):
+                body.extend(child)
+        return ast.Module(body=body, type_ignores=[])
+
+    def handle_single_input(self, children):
+        child = children[0]
+        if is_token(child):
+            return ast.Interactive(body=[])
+        if not isinstance(child, list):
+            child = [child]
+        return ast.Interactive(body=child)
+
+    def handle_eval_input(self, children):
+        return ast.Expression(body=children[0])
+
+    def handle_stmt(self, children):
+        child = children[0]
+        if isinstance(child, list):
+            return child
+        return [child]
+
+    def handle_simple_stmt(self, children):
+        return [child for child in children if not is_token(child)]
+
+    def handle_expr_stmt(self, children):
+        if len(children) == 1:
+            return self._at(ast.Expr(value=children[0]), children[0])
+        if isinstance(children[1], ast.operator):
+            target = children[0]
+            if not isinstance(target, (ast.Name, ast.Attribute, ast.Subscript)):
+                raise self.error(
+                    "illegal expression for augmented assignment", target)
+            self.set_context(target, STORE)
+            return self._at(ast.AugAssign(target=target, op=children[1],
+                                     value=children[2]), target)
+        targets = children[:-1:2]
+        for target in targets:
+            if isinstance(target, ast.Yield):
+                raise self.error("assignment to yield expression not possible",
+                                 target)
+            self.set_context(target, STORE)
+        return self._at(ast.Assign(targets=targets, value=children[-1],
+                              type_comment=None), targets[0])
+
+    def handle_augassign(self, children):
+        return _augassign_ops[children[0].value]()
+
+    def handle_print_stmt(self, children):
+        raise self.unsupported("print statement", children[0])
+
+    def handle_exec_stmt(self, children):
+        raise self.unsupported("exec statement", children[0])
+
+    def handle_del_stmt(self, children):
+        target = children[1]
+        if self._is_bare_tuple(target):
+            targets = target.elts
+        else:
+            targets = [target]
+        for target in targets:
+            self.set_context(target, DEL)
+        return self._at(ast.Delete(targets=targets), children[0])
+
+    def handle_pass_stmt(self, children):
+        return self._at(ast.Pass(), children[0])
+
+    def handle_break_stmt(self, children):
+        return self._at(ast.Break(), children[0])
+
+    def handle_continue_stmt(self, children):
+        return self._at(ast.Continue(), children[0])
+
+    def handle_return_stmt(self, children):
+        value = children[1] if len(children) > 1 else None
+        return self._at(ast.Return(value=value), children[0])
+
+    def handle_yield_stmt(self, children):
+        return self._at(ast.Expr(value=children[0]), children[0])
+
+    def handle_raise_stmt(self, children):
+        if len(children) > 2:
+            raise self.unsupported("raise with several arguments",
+                                   children[2])
+        exc = children[1] if len(children) > 1 else None
+        return self._at(ast.Raise(exc=exc, cause=None), children[0])
+
+    def handle_import_name(self, children):
+        return self._at(ast.Import(names=children[1]), children[0])
+
+    def handle_import_from(self, children):
+        level = 0
+        i = 1
+        while _is_op(children[i], u".") or _is_op(children[i], u"..."):
+            level += len(children[i].value)
+            i += 1
+        module = None
+        if isinstance(children[i], list):
+            module = u".".join([token.value for token in children[i]])
+            i += 1
+        # skip 'import'
+        i += 1
+        if _is_op(children[i], u"*"):
+            names = [self._at(ast.alias(name=u"*", asname=None), children[i])]
+        elif _is_op(children[i], u"("):
+            names = children[i + 1]
+        else:
+            names = children[i]
+        return self._at(ast.ImportFrom(module=module, names=names, level=level),
+                   children[0])
+
+    def handle_import_as_name(self, children):
+        asname = children[2].value if len(children) > 1 else None
+        return self._at(ast.alias(name=children[0].value, asname=asname),
+                   children[0])
+
+    def handle_dotted_as_name(self, children):
+        tokens = children[0]
+        asname = children[2].value if len(children) > 1 else None
+        name = u".".join([token.value for token in tokens])
+        return self._at(ast.alias(name=name, asname=asname), tokens[0])
+
+    def handle_import_as_names(self, children):
+        return children[::2]
+
+    def handle_dotted_as_names(self, children):
+        return children[::2]
+
+    def handle_dotted_name(self, children):
+        return children[::2]
+
+    def handle_global_stmt(self, children):
+        names = [token.value for token in children[1::2]]
+        return self._at(ast.Global(names=names), children[0])
+
+    def handle_assert_stmt(self, children):
+        msg = children[3] if len(children) > 2 else None
+        return self._at(ast.Assert(test=children[1], msg=msg), children[0])
+
+    def handle_if_stmt(self, children):
+        end = len(children)
+        orelse = []
+        if end % 4 == 3:
+            orelse = children[-1]
+            end -= 3
+        for i in range(end - 4, -1, -4):
+            node = self._at(ast.If(test=children[i + 1], body=children[i + 3],
+                              orelse=orelse), children[i])
+            orelse = [node]
+        return node
+
+    def handle_while_stmt(self, children):
+        orelse = children[6] if len(children) > 4 else []
+        return self._at(ast.While(test=children[1], body=children[3],
+                             orelse=orelse), children[0])
+
+    def handle_for_stmt(self, children):
+        target = self.set_context(children[1], STORE)
+        orelse = children[8] if len(children) > 6 else []
+        return self._at(ast.For(target=target, iter=children[3], body=children[5],
+                           orelse=orelse, type_comment=None), children[0])
+
+    def handle_try_stmt(self, children):
+        handlers = []
+        orelse = []
+        finalbody = []
+        for i in range(3, len(children), 3):
+            child = children[i]
+            body = children[i + 2]
+            if isinstance(child, tuple):
+                token, type, name = child
+                handlers.append(self._at(ast.ExceptHandler(
+                    type=type, name=name, body=body), token))
+            elif child.value == u"else":
+                orelse = body
+            else:
+                finalbody = body
+        return self._at(ast.Try(body=children[2], handlers=handlers, orelse=orelse,
+                           finalbody=finalbody), children[0])
+
+    def handle_except_clause(self, children):
+        type = children[1] if len(children) > 1 else None
+        name = None
+        if len(children) > 2:
+            target = children[3]
+            if not isinstance(target, ast.Name):
+                raise self.unsupported("except target that is not a name",
+                                       target)
+            name = target.id
+        return children[0], type, name
+
+    def handle_with_stmt(self, children):
+        return self._at(ast.With(items=children[1:-2:2], body=children[-1],
+                            type_comment=None), children[0])
+
+    def handle_with_item(self, children):
+        optional_vars = None
+        if len(children) > 1:
+            optional_vars = self.set_context(children[2], STORE)
+        return ast.withitem(context_expr=children[0],
+                            optional_vars=optional_vars)
+
+    def handle_fakesuite(self, children):
+        raise self.error("invalid syntax", children[0])
+
+    def handle_suite(self, children):
+        return children[-1]
+
+    def handle_realorfakesuite(self, children):
+        if len(children) == 1:
+            raise self.error("invalid syntax", children[0])
+        body = []
+        for stmts in children[1:-1]:
+            body.extend(stmts)
+        return body
+
+    def handle_funcdef(self, children):
+        return self._at(ast.FunctionDef(
+            name=children[1].value, args=children[2], body=children[4],
+            decorator_list=[], returns=None, type_comment=None), children[0])
+
+    def handle_parameters(self, children):
+        if len(children) == 2:
+            return _empty_arguments()
+        return children[1]
+
+    def handle_varargslist(self, children):
+        args = []
+        defaults = []
+        vararg = kwarg = None
+        i = 0
+        while i < len(children):
+            child = children[i]
+            if _is_op(child, u","):
+                i += 1
+            elif _is_op(child, u"*"):
+                vararg = self._arg(children[i + 1])
+                i += 2
+            elif _is_op(child, u"**"):
+                kwarg = self._arg(children[i + 1])
+                i += 2
+            else:
+                args.append(self._arg(child))
+                i += 1
+                if i < len(children) and _is_op(children[i], u"="):
+                    defaults.append(children[i + 1])
+                    i += 2
+                elif defaults:
+                    raise self.error(
+                        "non-default argument follows default argument",
+                        child)
+        return ast.arguments(posonlyargs=[], args=args, vararg=vararg,
+                             kwonlyargs=[], kw_defaults=[], kwarg=kwarg,
+                             defaults=defaults)
+
+    def _arg(self, token):
+        return self._at(ast.arg(arg=token.value, annotation=None,
+                           type_comment=None), token)
+
+    def handle_fpdef(self, children):
+        if len(children) > 1:
+            raise self.unsupported("tuple parameter", children[0])
+        return children[0]
+
+    def handle_fplist(self, children):
+        raise self.unsupported("tuple parameter", children[0])
+
+    def handle_decorator(self, children):
+        tokens = children[1]
+        node = self._at(ast.Name(id=tokens[0].value, ctx=LOAD), tokens[0])
+        for token in tokens[1:]:
+            node = self._at(ast.Attribute(value=node, attr=token.value, ctx=LOAD),
+                       tokens[0])
+        if len(children) > 3:
+            args, keywords = [], []
+            if not _is_op(children[3], u")"):
+                args, keywords = children[3]
+            node = self._at(ast.Call(func=node, args=args, keywords=keywords),
+                       tokens[0])
+        return node
+
+    def handle_decorators(self, children):
+        return children
+
+    def handle_decorated(self, children):
+        node = children[1]
+        node.decorator_list = children[0]
+        return node
+
+    def handle_classdef(self, children):
+        bases = []
+        if _is_op(children[2], u"(") and not _is_op(children[3], u")"):
+            bases = children[3]
+            if self._is_bare_tuple(bases):
+                bases = bases.elts
+            else:
+                bases = [bases]
+        return self._at(ast.ClassDef(name=children[1].value, bases=bases,
+                                keywords=[], body=children[-1],
+                                decorator_list=[]), children[0])
+
+    # ____________________________________________________________
+    # expressions
+
+    def _tuple(self, children):
+        return self._at(ast.Tuple(elts=children[::2], ctx=LOAD), children[0])
+
+    handle_testlist = _tuple
+    handle_exprlist = _tuple
+    handle_testlist_safe = _tuple
+    handle_subscriptlist = _tuple
+
+    def handle_testlist1(self, children):
+        # only used inside of backquotes
+        raise self.unsupported("backquote", children[0])
+
+    def handle_test(self, children):
+        return self._at(ast.IfExp(test=children[2], body=children[0],
+                             orelse=children[4]), children[0])
+
+    def handle_lambdef(self, children):
+        args = children[1] if len(children) == 4 else _empty_arguments()
+        return self._at(ast.Lambda(args=args, body=children[-1]), children[0])
+
+    handle_old_lambdef = handle_lambdef
+
+    def handle_or_test(self, children):
+        return self._at(ast.BoolOp(op=ast.Or(), values=children[::2]), children[0])
+
+    def handle_and_test(self, children):
+        return self._at(ast.BoolOp(op=ast.And(), values=children[::2]),
+                   children[0])
+
+    def handle_not_test(self, children):
+        return self._at(ast.UnaryOp(op=ast.Not(), operand=children[1]),
+                   children[0])
+
+    def handle_comparison(self, children):
+        return self._at(ast.Compare(left=children[0], ops=children[1::2],
+                               comparators=children[2::2]), children[0])
+
+    def handle_comp_op(self, children):
+        if len(children) == 2:
+            if children[0].value == u"not":
+                return ast.NotIn()
+            return ast.IsNot()
+        return _compare_ops[children[0].value]()
+
+    def _binop(self, children):
+        node = children[0]
+        for i in range(1, len(children), 2):
+            node = self._at(ast.BinOp(left=node, op=_binary_ops[children[i].value](),
+                                 right=children[i + 1]), children[0])
+        return node
+
+    handle_expr = _binop
+    handle_xor_expr = _binop
+    handle_and_expr = _binop
+    handle_shift_expr = _binop
+    handle_arith_expr = _binop
+    handle_term = _binop
+
+    def handle_factor(self, children):
+        return self._at(ast.UnaryOp(op=_unary_ops[children[0].value](),
+                               operand=children[1]), children[0])
+
+    def handle_power(self, children):
+        node = children[0]
+        end = len(children)
+        if _is_op(children[-2], u"**"):
+            end -= 2
+        for i in range(1, end):
+            trailer = children[i]
+            kind = trailer[0]
+            if kind == "call":
+                node = ast.Call(func=node, args=trailer[1],
+                                keywords=trailer[2])
+            elif kind == "attr":
+                node = ast.Attribute(value=node, attr=trailer[1], ctx=LOAD)
+            else:
+                node = ast.Subscript(value=node, slice=trailer[1], ctx=LOAD)
+            self._at(node, children[0])
+        if end < len(children):
+            node = self._at(ast.BinOp(left=node, op=ast.Pow(), right=children[-1]),
+                       children[0])
+        return node
+
+    def handle_trailer(self, children):
+        first = children[0].value
+        if first == u"(":
+            if len(children) == 2:
+                return "call", [], []
+            args, keywords = children[1]
+            if (len(args) == 1 and isinstance(args[0], ast.GeneratorExp) and
+                    self._start(args[0]) == self._start(args[0].elt)):
+                # the parentheses of the call are the ones of the generator
+                self._at(args[0], children[0])
+            return "call", args, keywords
+        if first == u".":
+            return "attr", children[1].value
+        return "subscript", children[1]
+
+    def handle_arglist(self, children):
+        args = []
+        keywords = []
+        i = 0
+        while i < len(children):
+            child = children[i]
+            if _is_op(child, u","):
+                i += 1
+            elif _is_op(child, u"*"):
+                args.append(self._at(ast.Starred(value=children[i + 1], ctx=LOAD),
+                                child))
+                i += 2
+            elif _is_op(child, u"**"):
+                keywords.append(self._at(ast.keyword(arg=None,
+                                                value=children[i + 1]), child))
+                i += 2
+            else:
+                if isinstance(child, ast.keyword):
+                    keywords.append(child)
+                elif keywords:
+                    raise self.error("non-keyword arg after keyword arg",
+                                     child)
+                else:
+                    args.append(child)
+                i += 1
+        return args, keywords
+
+    def handle_argument(self, children):
+        if len(children) == 2:
+            return self._at(ast.GeneratorExp(elt=children[0],
+                                        generators=children[1]), children[0])
+        name = children[0]
+        if not isinstance(name, ast.Name):
+            raise self.error("keyword can't be an expression", name)
+        return self._at(ast.keyword(arg=name.id, value=children[2]), name)
+
+    def handle_subscript(self, children):
+        if len(children) == 1 and not is_token(children[0]):
+            return children[0]
+        if len(children) == 3 and _is_op(children[1], u"."):
+            return self._at(ast.Constant(value=Ellipsis, kind=None), children[0])
+        lower = upper = step = None
+        i = 0
+        if not _is_op(children[0], u":"):
+            lower = children[0]
+            i = 1
+        # skip ':'
+        i += 1
+        if i < len(children) and not isinstance(children[i], tuple):
+            upper = children[i]
+            i += 1
+        if i < len(children):
+            step = children[i][1]
+        return self._at(ast.Slice(lower=lower, upper=upper, step=step),
+                   children[0])
+
+    def handle_sliceop(self, children):
+        step = children[1] if len(children) > 1 else None
+        return "step", step
+
+    def handle_atom(self, children):
+        first = children[0]
+        value = first.value
+        if len(children) == 1:
+            return self._atom_token(first)
+        if value == u"(":
+            if len(children) == 2:
+                return self._at(ast.Tuple(elts=[], ctx=LOAD), first)
+            node = children[1]
+            if self._is_bare_tuple(node) or (
+                    isinstance(node, ast.GeneratorExp) and
+                    self._start(node) == self._start(node.elt)):
+                self._at(node, first)
+            else:
+                self.parens[id(node)] = _pos(first)
+            return node
+        if value == u"[":
+            if len(children) == 2:
+                return self._at(ast.List(elts=[], ctx=LOAD), first)
+            kind, elt, generators = children[1]
+            if kind == "comp":
+                return self._at(ast.ListComp(elt=elt, generators=generators), first)
+            return self._at(ast.List(elts=elt, ctx=LOAD), first)
+        if value == u"{":
+            if len(children) == 2:
+                return self._at(ast.Dict(keys=[], values=[]), first)
+            return self._at(children[1], first)
+        if value == u"`":
+            raise self.unsupported("backquote", first)
+        return self._strings(children)
+
+    def _atom_token(self, token):
+        value = token.value
+        c = value[0]
+        if c.isdigit() or (c == u"." and len(value) > 1):
+            return self._at(ast.Constant(value=self._number(token), kind=None),
+                       token)
+        if value[-1] in u"'\"":
+            return self._strings([token])
+        if value in _constant_names:
+            return self._at(ast.Constant(value=_constant_names[value], kind=None),
+                       token)
+        if c == u"$":
+            raise self.unsupported("%s" % (value, ), token)
+        return self._at(ast.Name(id=value, ctx=LOAD), token)
+
+    def _number(self, token):
+        value = token.value
+        try:
+            last = value[-1]
+            if last in u"jJ":
+                return complex(0, float(value[:-1]))
+            if last in u"lL":
+                value = value[:-1]
+            if value[:2] in (u"0x", u"0X"):
+                return int(value[2:], 16)
+            if value[:2] in (u"0o", u"0O"):
+                return int(value[2:], 8)
+            if value[:2] in (u"0b", u"0B"):
+                return int(value[2:], 2)
+            for c in u".eE":
+                if c in value:
+                    return float(value)
+            if len(value) > 1 and value[0] == u"0":
+                return int(value, 8)
+            return int(value)
+        except ValueError:
+            raise self.error("invalid number %s" % (value, ), token)
+
+    def _strings(self, tokens):
+        values = [self._string(token) for token in tokens]
+        if len(values) == 1:
+            value = values[0]
+        elif any([not isinstance(v, bytes) for v in values]):
+            try:
+                value = u"".join([
+                    v if not isinstance(v, bytes) else v.decode("ascii")
+                    for v in values])
+            except UnicodeDecodeError as e:
+                raise self.error("(unicode error) %s" % (e, ), tokens[0])
+        else:
+            value = b"".join(values)
+        kind = u"u" if tokens[0].value[0] in u"uU" else None
+        return self._at(ast.Constant(value=value, kind=kind), tokens[0])
+
+    def _string(self, token):
+        value = token.value
+        i = 0
+        raw = False
+        unicode = self.compile_info.flags & astconsts.CO_FUTURE_UNICODE_LITERALS
+        while value[i] not in u"'\"":
+            c = value[i].lower()
+            if c == u"r":
+                raw = True
+            elif c == u"u":
+                unicode = True
+            elif c == u"b":
+                unicode = False
+            i += 1
+        quote = 3 if value[i:i + 3] in (u'"""', u"'''") else 1
+        body = value[i + quote:len(value) - quote]
+        try:
+            if unicode:
+                if raw:
+                    # \u escapes are processed even in raw unicode literals
+                    return body.encode("raw_unicode_escape").decode(
+                        "raw_unicode_escape")
+                return body.encode("latin-1", "backslashreplace").decode(
+                    "unicode_escape")
+            body = body.encode(self.compile_info.encoding or "utf-8")
+            if raw:
+                return body
+            return codecs.escape_decode(body)[0]
+        except (UnicodeError, ValueError) as e:
+            raise self.error("(unicode error) %s" % (e, ), token)
+
+    def handle_listmaker(self, children):
+        if len(children) > 1 and isinstance(children[1], list):
+            return "comp", children[0], children[1]
+        return "elts", children[::2], None
+
+    def handle_testlist_comp(self, children):
+        if isinstance(children[1], list):
+            return self._at(ast.GeneratorExp(elt=children[0],
+                                        generators=children[1]), children[0])
+        return self._tuple(children)
+
+    def handle_dictorsetmaker(self, children):
+        if len(children) > 1 and _is_op(children[1], u":"):
+            if len(children) > 3 and isinstance(children[3], list):
+                return ast.DictComp(key=children[0], value=children[2],
+                                    generators=children[3])
+            return self.handle_dictmaker(children)
+        if len(children) > 1 and isinstance(children[1], list):
+            return ast.SetComp(elt=children[0], generators=children[1])
+        return ast.Set(elts=children[::2])
+
+    def handle_dictmaker(self, children):
+        return ast.Dict(keys=children[0::4], values=children[2::4])
+
+    def _comprehension(self, children):
+        target = self.set_context(children[1], STORE)
+        comprehension = ast.comprehension(target=target, iter=children[3],
+                                          ifs=[], is_async=0)
+        rest = children[4] if len(children) > 4 else []
+        return _fold_comprehensions(comprehension, rest)
+
+    handle_list_for = _comprehension
+    handle_comp_for = _comprehension
+
+    def _comprehension_if(self, children):
+        rest = children[2] if len(children) > 2 else []
+        return [children[1]] + rest
+
+    handle_list_if = _comprehension_if
+    handle_comp_if = _comprehension_if
+
+    def handle_yield_expr(self, children):
+        value = children[1] if len(children) > 1 else None
+        return self._at(ast.Yield(value=value), children[0])
+
+    def handle_encoding_decl(self, children):
+        return children[0]
+
+
+# symbols whose value is the value of their child if they have just one
+_passthrough_names = [
+    "small_stmt", "flow_stmt", "import_stmt", "compound_stmt", "testlist_safe",
+    "old_test", "test", "or_test", "and_test", "not_test", "comparison",
+    "expr", "xor_expr", "and_expr", "shift_expr", "arith_expr", "term",
+    "factor", "power", "testlist_comp", "subscriptlist", "exprlist",
+    "testlist", "argument", "list_iter", "comp_iter",
+]
+
+def _make_tables(grammar):
+    handlers = [None] * len(grammar.dfas)
+    passthrough = [False] * len(grammar.dfas)
+    for name, symbol_id in grammar.symbol_ids.items():
+        handlers[symbol_id - 256] = getattr(ASTBuilder, "handle_" + name, None)
+        passthrough[symbol_id - 256] = name in _passthrough_names
+    return handlers, passthrough
+
+_handlers, ASTBuilder.passthrough = _make_tables(pygram.python_grammar)
+
+
+class BuilderStackEntry(parser.StackEntry):
+    """A stack entry that computes the values of the nodes with a builder
+    (see ASTBuilder) instead of building Nodes. node is the list of the
+    values of the children seen so far.
+
+    Like FlatStackEntry, the lists are appended to in place, which is only
+    correct because the parser stops building at the first error.
+    """
+
+    def __init__(self, next, dfa, state, node, builder):
+        self.next = next
+        self.dfa = dfa
+        self.state = state
+        self.node = node
+        self.builder = builder
+
+    def push(self, dfa, state):
+        return BuilderStackEntry(self, dfa, state, [], self.builder)
+
+    def switch_state(self, state):
+        return BuilderStackEntry(self.next, self.dfa, state, self.node,
+                                 self.builder)
+
+    def shift(self, grammar, next_state, token):
+        self.node.append(self.builder.terminal(token))
+        return BuilderStackEntry(self.next, self.dfa, next_state, self.node,
+                                 self.builder)
+
+    def pop_node(self):
+        builder = self.builder
+        children = self.node
+        symbol_id = self.dfa.symbol_id
+        if len(children) == 1 and builder.passthrough[symbol_id - 256]:
+            value = children[0]
+        else:
+            value = builder.nonterminal(symbol_id, children)
+        parent = self.next
+        if parent:
+            parent.node.append(value)
+            return parent
+        raise parser.Done(value)
+
+
+def tree_to_ast(tree, compile_info):
+    """Convert a parse tree of parser.Nodes (as returned by
+    pyparse.PythonParser.parse_source) to an ast."""
+    return ASTBuilder(compile_info).build(tree)
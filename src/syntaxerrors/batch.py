@@ -0,0 +1,223 @@
+"""
+Check the syntax of many files, distributed over a pool of worker processes.
+
+Every worker loads the grammar once when it starts (from the grammar cache, see
+grammarcache.py), then parses whole chunks of files and sends back one small
+FileResult per file. The parse trees never leave the workers.
+"""
+
+import functools
+import os
+import sys
+import time
+
+from syntaxerrors import error
+
+
+class FileResult(object):
+    """The result of checking one file.
+
+    * filename: the name of the file
+    * errors: list of error.SyntaxError instances, empty if the file parsed
+    * read_error: message if the file could not be read, else None
+    * internal_error: message if checking the file failed with an exception
+      that is not a syntax error (i.e. a bug), else None
+    * size: the size of the file in bytes
+    * duration: the time needed to parse the file, in seconds
+    """
+
+    def __init__(self, filename, errors=None, read_error=None, size=0,
+                 duration=0.0, internal_error=None):
+        self.filename = filename
+        if errors is None:
+            errors = []
+        self.errors = errors
+        self.read_error = read_error
+        self.internal_error = internal_error
+        self.size = size
+        self.duration = duration
+
+    def ok(self):
+        return (not self.errors and self.read_error is None and
+                self.internal_error is None)
+
+    def __repr__(self):
+        return "<FileResult %s: %d errors>" % (self.filename, len(self.errors))
+
+
+class BatchStats(object):
+    """Aggregate numbers over all the FileResults of a batch."""
+
+    def __init__(self):
+        self.files = 0
+        self.failed_files = 0
+        self.errors = 0
+        self.bytes = 0
+        self.parse_time = 0.0
+        self.wall_time = 0.0
+
+    def add(self, result):
+        self.files += 1
+        if not result.ok():
+            self.failed_files += 1
+        self.errors += len(result.errors)
+        self.bytes += result.size
+        self.parse_time += result.duration
+
+    def files_per_second(self):
+        if not self.wall_time:
+            return 0.0
+        return self.files / self.wall_time
+
+    def bytes_per_second(self):
+        if not self.wall_time:
+            return 0.0
+        return self.bytes / self.wall_time
+
+    def __str__(self):
+        return ("%d files (%d with errors, %d errors), %.1f KiB in %.2fs: "
+                "%.1f files/s, %.1f KiB/s, %.2fs parse time" % (
+                    self.files, self.failed_files, self.errors,
+                    self.bytes / 1024.0, self.wall_time,
+                    self.files_per_second(), self.bytes_per_second() / 1024.0,
+                    self.parse_time))
+
+
+def check_source(source, filename="<string>", mode="exec",
+                 first_error_only=False):
+    """Check the syntax of the bytes source and return a FileResult."""
+    from syntaxerrors import pyparse
+    info = pyparse.CompileInfo(filename, mode)
+    python_parser = pyparse.PythonParser(build_tree=False,
+                                         first_error_only=first_error_only)
+    t1 = time.time()
+    try:
+        python_parser.parse_source(source, info)
+    except error.MultipleSyntaxErrors as e:
+        errors = e.errors
+    except error.SyntaxError as e:
+        errors = [e]
+    except Exception as e:
+        # a bug, which must not stop the checking of the other files
+        return FileResult(filename, size=len(source),
+                          duration=time.time() - t1,
+                          internal_error="%s: %s" % (type(e).__name__, e))
+    else:
+        errors = []
+    t2 = time.time()
+    for e in errors:
+        if e.filename is None:
+            e.filename = filename
+        # the tokens of the whole file, don't send them back to the parent
+        if getattr(e, "tokens", None) is not None:
+            e.tokens = None
+    return FileResult(filename, errors, size=len(source), duration=t2 - t1)
+
+def check_file(filename, first_error_only=False):
+    """Read the file filename and check it, returns a FileResult."""
+    try:
+        with open(filename, "rb") as f:
+            source = f.read()
+    except (IOError, OSError) as e:
+        return FileResult(filename, read_error=str(e))
+    return check_source(source, filename, first_error_only=first_error_only)
+
+def _init_worker():
+    # load the grammar once per worker, not once per file
+    from syntaxerrors import pyparse
+
+def check_files(filenames, processes=None, chunksize=None,
+                first_error_only=False):
+    """Check all the files in filenames, yields one FileResult per file, in
+    the order of filenames.
+
+    The work is distributed over processes worker processes, by default one
+    per CPU. With processes=1 everything happens in the current process. If
+    first_error_only is True, only the first error of every file is reported.
+    """
+    check = functools.partial(check_file, first_error_only=first_error_only)
+    filenames = list(filenames)
+    if processes is None:
+        processes = _cpu_count()
+    processes = min(processes, len(filenames))
+    if processes <= 1:
+        for filename in filenames:
+            yield check(filename)
+        return
+    if chunksize is None:
+        # a couple of chunks per worker, to balance files of different sizes
+        # without too much communication overhead
+        chunksize = max(1, min(64, len(filenames) // (processes * 8)))
+    import multiprocessing
+    # with fork the workers inherit the grammar of this process
+    _init_worker()
+    pool = multiprocessing.Pool(processes, _init_worker)
+    try:
+        for result in pool.imap(check, filenames, chunksize):
+            yield result
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+def _cpu_count():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+def find_python_files(paths):
+    """Yield the names of the files in paths. Directories are searched
+    recursively for .py files."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(".py"):
+                    yield os.path.join(dirpath, name)
+
+
+def format_error(e):
+    return "%s:%d:%d: %s" % (e.filename, e.lineno, e.offset, e.msg)
+
+def main(argv=None, out=None):
+    import argparse
+    if out is None:
+        out = sys.stdout
+    argparser = argparse.ArgumentParser(
+        prog="python -m syntaxerrors",
+        description="Check Python files for syntax errors.")
+    argparser.add_argument("paths", nargs="+", metavar="path",
+                           help="files or directories to check")
+    argparser.add_argument("-j", "--jobs", type=int, default=None,
+                           help="number of worker processes "
+                                "(default: number of CPUs)")
+    argparser.add_argument("-q", "--quiet", action="store_true",
+                           help="don't print the statistics at the end")
+    argparser.add_argument("-x", "--first-error", action="store_true",
+                           help="only report the first error of every file")
+    args = argparser.parse_args(argv)
+
+    stats = BatchStats()
+    t1 = time.time()
+    results = check_files(find_python_files(args.paths), args.jobs,
+                          first_error_only=args.first_error)
+    for result in results:
+        stats.add(result)
+        if result.read_error is not None:
+            out.write("%s: %s\n" % (result.filename, result.read_error))
+        if result.internal_error is not None:
+            out.write("%s: internal error: %s\n" % (result.filename,
+                                                    result.internal_error))
+        for e in result.errors:
+            out.write(format_error(e) + "\n")
+    stats.wall_time = time.time() - t1
+    if not args.quiet:
+        out.write("%s\n" % (stats, ))
+    return 1 if stats.failed_files else 0
@@ -3,21 +3,46 @@ class SyntaxError(Exception):
     """Base class for exceptions raised by the parser."""
 
     def __init__(self, msg, lineno=0, offset=0, text=None, filename=None,
-                 lastlineno=0):
+                 lastlineno=0, lines=None):
         self.msg = msg
         self.lineno = lineno
         # NB: offset is a 1-based index!
         self.offset = offset
-        self.text = text
+        # if lines (e.g. a linetable.LineTable) is given, text is the index
+        # of the line in it, which is only looked up when it is needed
+        self.lines = lines
+        self._text = text
         self.filename = filename
         self.lastlineno = lastlineno
 
+    def _get_text(self):
+        if self.lines is not None:
+            return self.lines[self._text]
+        return self._text
+
+    def _set_text(self, text):
+        self.lines = None
+        self._text = text
+
+    text = property(_get_text, _set_text)
+
+    def __reduce__(self):
+        # the text is looked up, the lines of the whole source are not
+        # pickled along with the error
+        state = self.__dict__.copy()
+        state["lines"] = None
+        state["_text"] = self.text
+        return (_new_error, (self.__class__, ), state)
+
     def __str__(self):
         return "%s at pos (%d, %d) in %r" % (self.__class__.__name__,
                                              self.lineno,
                                              self.offset,
                                              self.text)
 
+def _new_error(cls):
+    return Exception.__new__(cls)
+
 class IndentationError(SyntaxError):
     pass
 
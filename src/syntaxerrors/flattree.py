@@ -0,0 +1,213 @@
+"""
+A compact encoding of the parse tree in a couple of parallel arrays.
+
+The nodes are stored in postorder: the children of a node come right before
+it, the root is the last node. For every node the arrays contain the type
+(symbol id or token type), the number of children, the number of nodes in
+its subtree and, for terminals, the index of its token in FlatTree.tokens.
+The parser appends to the arrays directly, see FlatStackEntry.
+
+FlatNode is a cursor into a FlatTree with the interface of parser.Node, so
+code that walks trees with get_child, num_children, get_value and
+get_lineno works with both.
+"""
+
+from array import array
+
+from syntaxerrors import parser
+
+
+class FlatTree(object):
+
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.types = array("h")
+        self.counts = array("i")
+        self.sizes = array("i")
+        # -1 for nonterminals
+        self.token_indexes = array("i")
+        # a list of tokens, or the TokenBuffer the tokens came from
+        self.tokens = None
+
+    def __len__(self):
+        return len(self.types)
+
+    def add_terminal(self, token):
+        tokens = self.tokens
+        if tokens is None:
+            tokens = getattr(token, "buffer", None)
+            if tokens is None:
+                tokens = []
+            self.tokens = tokens
+        if type(tokens) is list:
+            index = len(tokens)
+            tokens.append(token)
+        else:
+            index = token.index
+        self.types.append(token.token_type)
+        self.counts.append(0)
+        self.sizes.append(1)
+        self.token_indexes.append(index)
+
+    def add_nonterminal(self, type, count, size):
+        self.types.append(type)
+        self.counts.append(count)
+        self.sizes.append(size)
+        self.token_indexes.append(-1)
+
+    def root(self):
+        return FlatNode(self, len(self.types) - 1)
+
+    def node(self, index):
+        return FlatNode(self, index)
+
+    def nbytes(self):
+        """The memory used by the arrays, without the tokens."""
+        return sum([a.itemsize * len(a) for a in (
+            self.types, self.counts, self.sizes, self.token_indexes)])
+
+
+class FlatNode(object):
+    """A reference to one node of a FlatTree."""
+
+    __slots__ = ("tree", "index", "_children")
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+        self._children = None
+
+    @property
+    def type(self):
+        return self.tree.types[self.index]
+
+    @property
+    def grammar(self):
+        return self.tree.grammar
+
+    def is_terminal(self):
+        return self.tree.token_indexes[self.index] != -1
+
+    def token(self):
+        """The token of a terminal."""
+        tree = self.tree
+        return tree.tokens[tree.token_indexes[self.index]]
+
+    def children_indexes(self):
+        """The indexes of the children in the tree, in order."""
+        children = self._children
+        if children is None:
+            tree = self.tree
+            sizes = tree.sizes
+            children = [0] * tree.counts[self.index]
+            child = self.index - 1
+            for i in range(len(children) - 1, -1, -1):
+                children[i] = child
+                child -= sizes[child]
+            self._children = children
+        return children
+
+    def num_children(self):
+        return self.tree.counts[self.index]
+
+    def get_child(self, i):
+        return FlatNode(self.tree, self.children_indexes()[i])
+
+    def get_value(self):
+        if not self.is_terminal():
+            return None
+        return self.token().value
+
+    def get_lineno(self):
+        node = self
+        while not node.is_terminal():
+            node = node.get_child(0)
+        return node.token().lineno
+
+    def get_column(self):
+        node = self
+        while not node.is_terminal():
+            node = node.get_child(0)
+        return node.token().column
+
+    def to_node(self):
+        """Build the parser.Node tree for this subtree."""
+        tree = self.tree
+        if self.is_terminal():
+            return parser.Terminal.fromtoken(tree.grammar, self.token())
+        children = [self.get_child(i).to_node()
+                    for i in range(self.num_children())]
+        if len(children) == 1:
+            return parser.Nonterminal1(tree.grammar, self.type, children[0])
+        return parser.Nonterminal(tree.grammar, self.type, children)
+
+    def __repr__(self):
+        if self.is_terminal():
+            return "FlatNode(type=%s, value=%r)" % (self.type, self.get_value())
+        return "FlatNode(type=%s, children=%r)" % (
+            self.type, [self.get_child(i) for i in range(self.num_children())])
+
+    def __eq__(self, other):
+        # for tests, compares like parser.Node
+        if not isinstance(other, (FlatNode, parser.Node)):
+            return False
+        if self.type != other.type:
+            return False
+        if self.is_terminal():
+            return other.num_children() == 0 and \
+                    self.get_value() == other.get_value() and \
+                    (not isinstance(other, FlatNode) or other.is_terminal())
+        if isinstance(other, parser.Terminal):
+            return False
+        if self.num_children() != other.num_children():
+            return False
+        for i in range(self.num_children()):
+            if self.get_child(i) != other.get_child(i):
+                return False
+        return True
+
+    def __ne__(self, other):
+        return not self == other
+
+
+class FlatStackEntry(parser.StackEntry):
+    """A stack entry that appends the nodes to a FlatTree instead of building
+    Node objects. Every entry counts the children and the size of the
+    subtree of the node it builds.
+
+    Appending to the arrays is only correct as long as the stack is never
+    forked, which is the case because the parser stops building the tree at
+    the first error.
+    """
+
+    node = None
+
+    def __init__(self, next, dfa, state, tree, count=0, size=1):
+        self.next = next
+        self.dfa = dfa
+        self.state = state
+        self.tree = tree
+        self.count = count
+        self.size = size
+
+    def push(self, dfa, state):
+        return FlatStackEntry(self, dfa, state, self.tree)
+
+    def switch_state(self, state):
+        return FlatStackEntry(self.next, self.dfa, state, self.tree,
+                              self.count, self.size)
+
+    def shift(self, grammar, next_state, token):
+        self.tree.add_terminal(token)
+        return FlatStackEntry(self.next, self.dfa, next_state, self.tree,
+                              self.count + 1, self.size + 1)
+
+    def pop_node(self):
+        tree = self.tree
+        tree.add_nonterminal(self.dfa.symbol_id, self.count, self.size)
+        parent = self.next
+        if parent:
+            return FlatStackEntry(parent.next, parent.dfa, parent.state, tree,
+                                  parent.count + 1, parent.size + self.size)
+        else:
+            raise parser.Done(tree.root())
@@ -0,0 +1,277 @@
+#! /usr/bin/env python
+"""
+Generates parser_generated.py, a specialized version of parser.add_token for
+the Python grammar.
+
+Instead of looking up the action for every token in grammar.actions, the
+generated module has one function per state of every DFA. The function
+compares the label of the token against the labels that have an action in
+that state and performs the action with straight-line code: the chains of
+reductions are unrolled and whether the shifted-to state is a final state
+without arcs (so that the node is finished at once, see StackEntry.shift_pop)
+is decided when generating instead of for every token.
+
+pygram installs the generated code if it was generated from the current
+grammar file and the grammar that was built has the same numbering of labels
+and states as the one the code was generated from (see install), otherwise
+the action table is interpreted.
+
+When run from the command line, this prints the module:
+    python genparser.py > parser_generated.py
+"""
+
+import hashlib
+import os
+import sys
+
+from syntaxerrors import parser
+
+# bump this whenever the generated code changes
+GENERATOR_VERSION = 3
+
+
+def grammar_key(grammar_cls, gram_source):
+    """The key that the generated module is valid for."""
+    h = hashlib.sha1()
+    h.update(("genparser %s\n" % (GENERATOR_VERSION, )).encode("ascii"))
+    for name, index in sorted(grammar_cls.TOKENS.items()):
+        h.update(("%s=%s\n" % (name, index)).encode("utf-8"))
+    h.update(gram_source)
+    return h.hexdigest()
+
+def grammar_fingerprint(grammar):
+    """A hash of the numbering of the labels and states of a built grammar,
+    which the generated code hard-codes."""
+    h = hashlib.sha1()
+    h.update(("labels %s\n" % (" ".join(
+        [str(label) for label in grammar.labels]), )).encode("ascii"))
+    for value, label_index in sorted(grammar.keyword_ids.items()):
+        h.update(("%s=%s\n" % (value, label_index)).encode("utf-8"))
+    for dfa in grammar.dfas:
+        h.update(("dfa %s %s\n" % (dfa.symbol_id, dfa.first)).encode("ascii"))
+        for arcs, is_accepting in dfa.states:
+            h.update(("%s %s\n" % (bool(is_accepting), " ".join(
+                ["%s:%s" % (label_index, next_state)
+                 for label_index, next_state in arcs]))).encode("ascii"))
+    return h.hexdigest()
+
+def install(grammar, grammar_path):
+    """Use the generated add_token for grammar, if the generated module
+    exists, matches the grammar file and was generated from a grammar with
+    the same numbering. Returns whether it was installed."""
+    try:
+        from syntaxerrors import parser_generated
+    except ImportError:
+        return False
+    with open(grammar_path, "rb") as f:
+        key = grammar_key(type(grammar), f.read())
+    if getattr(parser_generated, "GRAMMAR_KEY", None) != key:
+        return False
+    # the numbering can differ between interpreters, e.g. if the grammar was
+    # built with a different iteration order of dicts
+    fingerprint = grammar_fingerprint(grammar)
+    if getattr(parser_generated, "GRAMMAR_FINGERPRINT", None) != fingerprint:
+        return False
+    grammar.generated_add_token = parser_generated.build(grammar.dfas)
+    return True
+
+
+def _label_names(grammar):
+    keywords = {}
+    for value, label_index in grammar.keyword_ids.items():
+        keywords[label_index] = repr(str(value))
+    names = []
+    for label_index, label in enumerate(grammar.labels):
+        if label >= 256:
+            names.append(grammar.symbol_names[label])
+        elif label_index in keywords:
+            names.append(keywords[label_index])
+        else:
+            names.append(grammar.TOKEN_NAMES.get(label, str(label)))
+    return names
+
+def _final(dfa, state_index):
+    """Whether the state accepts and has no arcs, so that the parser pops the
+    node as soon as it gets there."""
+    arcs, is_accepting = dfa.states[state_index]
+    return is_accepting and not arcs
+
+class _Generator(object):
+
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.label_names = _label_names(grammar)
+        self.name_label = grammar.token_ids[grammar.KEYWORD_TOKEN]
+        self.label_sets = []
+        self.lines = []
+
+    def emit(self, line):
+        self.lines.append(line)
+
+    def dfa_name(self, dfa):
+        return "dfa_" + self.grammar.symbol_names[dfa.symbol_id]
+
+    def state_name(self, dfa, state_index):
+        return "%s_%d" % (self.grammar.symbol_names[dfa.symbol_id],
+                          state_index)
+
+    def condition(self, labels):
+        if len(labels) <= 3:
+            return " or ".join(["label_index == %d" % (label_index, )
+                                for label_index in labels])
+        labels = tuple(labels)
+        if labels not in self.label_sets:
+            self.label_sets.append(labels)
+        return "label_index in labels_%d" % (self.label_sets.index(labels), )
+
+    def rank(self, shifts):
+        labels = sum(shifts.values(), [])
+        if self.name_label in labels:
+            return 0
+        for label_index in labels:
+            if self.grammar.labels[label_index] < 256:
+                return 1
+        return 2
+
+    def chain(self, reductions):
+        """The code that performs the reductions. StackEntry.reduce switches
+        the state of the last entry and pushes an entry for the sub-DFA in
+        state 0, whose state the next reduction switches again. Here every
+        entry is pushed in its final state instead."""
+        parts = ["stack.switch_state(%d)" % (reductions[0][0], )]
+        for i in range(len(reductions)):
+            if i + 1 < len(reductions):
+                state = reductions[i + 1][0]
+            else:
+                state = 0
+            parts.append("push(%s, %d)" % (self.dfa_name(reductions[i][1]),
+                                           state))
+        lines = ["            stack = " + parts[0]]
+        for part in parts[1:]:
+            if len(lines[-1]) + len(part) + 1 > 78:
+                lines.append("                .")
+            else:
+                lines[-1] += "."
+            lines[-1] += part
+        if len(lines) > 1:
+            lines[0] = lines[0].replace("stack = ", "stack = (")
+            lines[-1] += ")"
+        return lines
+
+    def shift(self, dfa, next_state):
+        if _final(dfa, next_state):
+            return "return pop_finished(stack.shift(grammar, %d, token))" % (
+                next_state, )
+        return "return stack.shift(grammar, %d, token)" % (next_state, )
+
+    def generate_state(self, dfa, state_index):
+        grammar = self.grammar
+        base = dfa.action_base[state_index]
+        # group the labels by the reductions and then by the state the token
+        # is shifted into, in the order of the first label
+        groups = []
+        group_of = {}
+        default = None
+        for label_index in range(len(grammar.labels)):
+            action, next_state, reductions = grammar.actions[
+                base + label_index]
+            if action in (parser.POP, parser.ERROR):
+                default = action
+                continue
+            if reductions not in group_of:
+                group_of[reductions] = {}
+                groups.append(reductions)
+            shifts = group_of[reductions]
+            shifts.setdefault(next_state, []).append(label_index)
+        # check the most likely labels first: the ones of NAME tokens are by
+        # far the most common, nonterminal labels are never seen by the parser
+        groups.sort(key=lambda reductions: self.rank(group_of[reductions]))
+        self.emit("    def %s(stack, grammar, token, label_index):" % (
+            self.state_name(dfa, state_index), ))
+        for reductions in groups:
+            shifts = group_of[reductions]
+            labels = sorted(sum(shifts.values(), []))
+            self.emit("        if %s:" % (self.condition(labels), ))
+            self.emit("            # %s" % (", ".join(
+                [self.label_names[label_index] for label_index in labels]), ))
+            shift_dfa = dfa
+            if reductions is not None:
+                for line in self.chain(reductions):
+                    self.emit(line)
+                shift_dfa = reductions[-1][1]
+            next_states = sorted(shifts, key=lambda state: (
+                self.name_label not in shifts[state], shifts[state][0]))
+            for next_state in next_states[:-1]:
+                self.emit("            if %s:" % (
+                    self.condition(shifts[next_state]), ))
+                self.emit("                " + self.shift(shift_dfa, next_state))
+            self.emit("            " + self.shift(shift_dfa, next_states[-1]))
+        if default == parser.POP:
+            self.emit("        return None")
+        else:
+            self.emit("        raise bad_input(grammar, stack.dfa, %d, token)"
+                      % (state_index, ))
+        self.emit("")
+
+    def generate(self, key):
+        grammar = self.grammar
+        self.emit("def build(dfas):")
+        for dfa in grammar.dfas:
+            self.emit("    %s = dfas[%d]" % (self.dfa_name(dfa),
+                                             dfa.symbol_id - 256))
+        self.emit("")
+        for dfa in grammar.dfas:
+            for state_index in range(len(dfa.states)):
+                self.generate_state(dfa, state_index)
+        self.emit("    states = [")
+        for dfa in grammar.dfas:
+            self.emit("        [%s]," % (", ".join(
+                [self.state_name(dfa, state_index)
+                 for state_index in range(len(dfa.states))]), ))
+        self.emit("    ]")
+        self.emit("")
+        self.emit("    def add_token(stack, grammar, token, label_index):")
+        self.emit("        while True:")
+        self.emit("            result = states[stack.dfa.symbol_id - %d]"
+                  "[stack.state](" % (256, ))
+        self.emit("                stack, grammar, token, label_index)")
+        self.emit("            if result is not None:")
+        self.emit("                return result")
+        self.emit("            stack = pop(stack, token)")
+        self.emit("")
+        self.emit("    return add_token")
+        body = self.lines
+
+        self.lines = []
+        self.emit("# THIS FILE IS AUTOMATICALLY GENERATED BY genparser.py")
+        self.emit("# DO NOT EDIT")
+        self.emit("# TO REGENERATE THE FILE, RUN:")
+        self.emit("#     python genparser.py > parser_generated.py")
+        self.emit("")
+        self.emit("from syntaxerrors.parser import bad_input, pop, "
+                  "pop_finished")
+        self.emit("")
+        self.emit("GRAMMAR_KEY = %r" % (str(key), ))
+        self.emit("GRAMMAR_FINGERPRINT = %r" % (
+            str(grammar_fingerprint(grammar)), ))
+        self.emit("")
+        for i, labels in enumerate(self.label_sets):
+            self.emit("labels_%d = frozenset(%r)" % (i, list(labels)))
+        self.emit("")
+        self.emit("")
+        return "\n".join(self.lines + body) + "\n"
+
+
+def generate(grammar, key):
+    """Return the source of the module for grammar."""
+    return _Generator(grammar).generate(key)
+
+def main():
+    from syntaxerrors import pygram
+    here = os.path.dirname(os.path.abspath(pygram.__file__))
+    with open(os.path.join(here, "data", "Grammar2.7"), "rb") as f:
+        key = grammar_key(pygram.PythonGrammar, f.read())
+    sys.stdout.write(generate(pygram.python_grammar, key))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Caches the result of building a grammar with metaparser.ParserGenerator.
+
+The cache is a marshal dump of plain tuples, lists, dicts, ints and strings
+(no pickle), written next to the grammar file or, if that directory is not
+writable, into a per-user cache directory. Every cache file starts with a key
+made from the format version and a hash of the grammar source, stale files are
+ignored and regenerated.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import platform
+from array import array
+
+from syntaxerrors import parser
+
+# bump this whenever the layout of the cached data or the way the grammar
+# tables are computed changes
+FORMAT_VERSION = 3
+
+_ACTION_NAMES = (parser.SHIFT, parser.REDUCE, parser.POP, parser.ERROR)
+
+
+def _python_tag():
+    # marshal data is only guaranteed to be readable by the same interpreter
+    return "%s%s%s" % (platform.python_implementation().lower(),
+                       sys.version_info[0], sys.version_info[1])
+
+def source_hash(grammar_cls, gram_source):
+    """Compute the key under which a grammar source is cached."""
+    h = hashlib.sha1()
+    h.update(("%s\n" % (FORMAT_VERSION, )).encode("ascii"))
+    for name, index in sorted(grammar_cls.TOKENS.items()):
+        h.update(("%s=%s\n" % (name, index)).encode("utf-8"))
+    h.update(gram_source)
+    return h.hexdigest()
+
+def cache_dirs(grammar_path):
+    """The directories that are tried for the cache file, in order."""
+    dirs = [os.path.dirname(os.path.abspath(grammar_path))]
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    dirs.append(os.path.join(base, "syntaxerrors"))
+    return dirs
+
+def cache_filename(grammar_path):
+    return "%s.%s.cache" % (os.path.basename(grammar_path), _python_tag())
+
+
+def dumps(gram, key):
+    """Serialize a built grammar into a bytes object."""
+    dfas = []
+    for dfa in gram.dfas:
+        dfas.append((dfa.symbol_id, dfa.states, dfa.first, dfa.action_base))
+    # the action table contains lots of identical entries, store the unique
+    # ones once and a compact array of indexes into them
+    unique_actions = []
+    action_indexes = {}
+    indexes = array("i")
+    for action, next_state, reductions in gram.actions:
+        if reductions is not None:
+            reductions = tuple([(state, dfa.symbol_id - 256)
+                                for state, dfa in reductions])
+        entry = (_ACTION_NAMES.index(action), next_state, reductions)
+        index = action_indexes.get(entry, -1)
+        if index == -1:
+            index = action_indexes[entry] = len(unique_actions)
+            unique_actions.append(entry)
+        indexes.append(index)
+    data = (
+        gram.start,
+        gram.symbol_ids,
+        gram.symbol_to_label,
+        gram.keyword_ids,
+        gram.token_to_error_string,
+        gram.labels,
+        gram.token_ids,
+        dfas,
+        unique_actions,
+        indexes.tobytes() if hasattr(indexes, "tobytes") else indexes.tostring(),
+    )
+    return marshal.dumps((FORMAT_VERSION, key, data))
+
+def loads(grammar_cls, s, key):
+    """Rebuild a grammar from the result of dumps.
+
+    Returns None if the data was written for a different grammar source or
+    format version.
+    """
+    try:
+        version, data_key, data = marshal.loads(s)
+    except (ValueError, EOFError, TypeError):
+        return None
+    if version != FORMAT_VERSION or data_key != key:
+        return None
+    (start, symbol_ids, symbol_to_label, keyword_ids, token_to_error_string,
+     labels, token_ids, dfas, unique_actions, indexes) = data
+    gram = grammar_cls()
+    gram.start = start
+    gram.symbol_ids = symbol_ids
+    for name, symbol_id in symbol_ids.items():
+        gram.symbol_names[symbol_id] = name
+    gram.symbol_to_label = symbol_to_label
+    gram.keyword_ids = keyword_ids
+    gram.token_to_error_string = token_to_error_string
+    gram.labels = labels
+    gram.token_ids = token_ids
+    for symbol_id, states, first, action_base in dfas:
+        dfa = parser.DFA(gram, symbol_id, states, {})
+        dfa.first = first
+        dfa.action_base = action_base
+        gram.dfas.append(dfa)
+    entries = []
+    for action_index, next_state, reductions in unique_actions:
+        if reductions is not None:
+            reductions = tuple([(state, gram.dfas[dfa_index])
+                                for state, dfa_index in reductions])
+        entries.append((_ACTION_NAMES[action_index], next_state, reductions))
+    index_array = array("i")
+    if hasattr(index_array, "frombytes"):
+        index_array.frombytes(indexes)
+    else:
+        index_array.fromstring(indexes)
+    gram.actions = [entries[i] for i in index_array]
+    return gram
+
+
+def load_grammar(grammar_cls, grammar_path, dirs=None):
+    """Return the grammar built from the file at grammar_path.
+
+    A valid cache file is used if one exists, otherwise the grammar is built
+    with metaparser.ParserGenerator and the result is written to the first
+    writable cache directory.
+    """
+    with open(grammar_path, "rb") as f:
+        gram_source = f.read()
+    key = source_hash(grammar_cls, gram_source)
+    if dirs is None:
+        dirs = cache_dirs(grammar_path)
+    filename = cache_filename(grammar_path)
+    for dirname in dirs:
+        try:
+            with open(os.path.join(dirname, filename), "rb") as f:
+                s = f.read()
+        except (IOError, OSError):
+            continue
+        gram = loads(grammar_cls, s, key)
+        if gram is not None:
+            return gram
+    from syntaxerrors import metaparser
+    pgen = metaparser.ParserGenerator(gram_source)
+    gram = pgen.build_grammar(grammar_cls)
+    s = dumps(gram, key)
+    for dirname in dirs:
+        if _write_cache(dirname, filename, s):
+            break
+    return gram
+
+def _write_cache(dirname, filename, s):
+    target = os.path.join(dirname, filename)
+    tmp = "%s.%s.tmp" % (target, os.getpid())
+    try:
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(tmp, "wb") as f:
+            f.write(s)
+        # atomic, concurrent workers either see the old or the new file
+        os.rename(tmp, target)
+    except (IOError, OSError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    return True
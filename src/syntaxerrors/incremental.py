@@ -0,0 +1,276 @@
+"""
+Incremental reparsing of a module after a text edit, for editor integration.
+
+The children of a file_input node are the top-level statements. Each of them
+starts at the beginning of a line, where the tokenizer has no open brackets,
+strings or indentation. After an edit, only the statements between the last
+untouched statement before the edit and the first untouched statement after it
+are tokenized and parsed again, the other statements are reused. If the edit
+added or removed lines, the statements after it are wrapped in
+ShiftedNonterminals, which move their line numbers on first access. Whenever
+that is not obviously equivalent to parsing the whole source, e.g. because the
+edited part does not parse on its own, the whole source is parsed again. That
+is also what happens if there is no tree to reuse, for a parser with
+build_tree=False.
+"""
+
+import bisect
+
+from syntaxerrors import parser, pytokenizer, pygram, error
+from syntaxerrors import astconsts
+
+
+class ParseResult(object):
+    """The source and the parse tree of a module.
+
+    * source: the source bytes
+    * tree: the file_input node, None if the parser doesn't build trees
+    * compile_info: the pyparse.CompileInfo used for parsing
+    * reparsed: (first, last) range of line numbers in source that was
+      tokenized and parsed to produce the tree
+    """
+
+    def __init__(self, source, tree, compile_info, flags, reparsed):
+        self.source = source
+        self.tree = tree
+        self.compile_info = compile_info
+        # the flags before parsing, which adds future flags
+        self.flags = flags
+        self.reparsed = reparsed
+        self.line_starts = line_starts(source)
+
+    def lineno_of(self, offset):
+        """The (1-based) number of the line that contains offset."""
+        return bisect.bisect_right(self.line_starts, offset)
+
+
+def line_starts(source):
+    result = [0]
+    pos = source.find(b"\n")
+    while pos >= 0:
+        result.append(pos + 1)
+        pos = source.find(b"\n", pos + 1)
+    return result
+
+
+def parse(python_parser, source, compile_info):
+    flags = compile_info.flags
+    tree = python_parser.parse_source(source, compile_info)
+    reparsed = (1, source.count(b"\n") + (not source.endswith(b"\n")))
+    return ParseResult(source, tree, compile_info, flags, reparsed)
+
+
+def reparse(python_parser, result, start, end, replacement):
+    """Return a new ParseResult for the source of result, where the bytes
+    between the offsets start and end are replaced by replacement."""
+    from syntaxerrors.pyparse import CompileInfo
+    old_info = result.compile_info
+    source = result.source[:start] + replacement + result.source[end:]
+    compile_info = CompileInfo(old_info.filename, old_info.mode, result.flags,
+                               hidden_applevel=old_info.hidden_applevel)
+    new = None
+    if result.tree is not None and _reuses_statements(python_parser):
+        new = _reparse_statements(python_parser, result, start, end,
+                                  replacement, source, compile_info)
+    if new is None:
+        return parse(python_parser, source, compile_info)
+    return new
+
+
+def _reuses_statements(python_parser):
+    """Whether the trees of python_parser can be put together from the
+    statements of several parses: not for flat trees, AST builders and lazy
+    bodies."""
+    return (python_parser.build_tree and not python_parser.flat_tree and
+            python_parser.builder is None and not python_parser.lazy_bodies)
+
+
+def _reparse_statements(python_parser, result, start, end, replacement,
+                        source, compile_info):
+    old_info = result.compile_info
+    if old_info.mode != "exec" or result.flags & astconsts.PyCF_DONT_IMPLY_DEDENT:
+        return None
+    if old_info.encoding not in (None, 'utf-8'):
+        # the source was recoded before parsing
+        return None
+    first_line = result.lineno_of(start)
+    last_line = result.lineno_of(max(start, end - 1))
+    if first_line <= 2:
+        # might change the encoding declaration
+        return None
+    if first_line <= old_info.last_future_import[0]:
+        return None
+    split = _split_statements(result.tree)
+    if split is None:
+        return None
+    statements, tail = split
+    starts = [node.get_lineno() for node in statements]
+
+    # the first statement to reparse is the one before the first statement
+    # that starts at or after the edited line, since the edit can extend it
+    first = 0
+    while first + 1 < len(starts) and starts[first + 1] < first_line:
+        first += 1
+    if first == 0:
+        return None
+    # reparse up to the first statement that starts after the edited lines
+    stop = first + 1
+    while stop < len(starts) and starts[stop] <= last_line:
+        stop += 1
+
+    line_delta = (replacement.count(b"\n") -
+                  result.source.count(b"\n", start, end))
+    chunk_start = result.line_starts[starts[first] - 1]
+    if stop < len(starts):
+        old_chunk_end = result.line_starts[starts[stop] - 1]
+        chunk_end = old_chunk_end + len(source) - len(result.source)
+    else:
+        chunk_end = len(source)
+    chunk = source[chunk_start:chunk_end]
+    if b"__future__" in chunk:
+        return None
+
+    lines = chunk.splitlines(True)
+    if lines and not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"
+    if old_info.flags & astconsts.CO_FUTURE_PRINT_FUNCTION:
+        grammar = pygram.python_grammar_no_print
+    else:
+        grammar = pygram.python_grammar
+    try:
+        tokens = pytokenizer.generate_tokens(lines, 0, lineno=starts[first])
+        if stop < len(starts):
+            _move_final_dedents(tokens, starts[stop] + line_delta)
+        chunk_tree = _parse_chunk(python_parser, grammar, tokens)
+    except (error.TokenError, error.TokenIndentationError, parser.ParseError):
+        return None
+
+    split = _split_statements(chunk_tree)
+    if split is None:
+        return None
+    new_statements, new_tail = split
+    new_children = statements[:first] + new_statements
+    if stop < len(starts):
+        for node in statements[stop:] + tail:
+            new_children.append(shift_lines(node, line_delta))
+    else:
+        new_children.extend(new_tail)
+    tree = parser.Nonterminal(grammar, result.tree.type, new_children)
+    compile_info.flags = old_info.flags
+    compile_info.encoding = old_info.encoding
+    compile_info.last_future_import = old_info.last_future_import
+    reparsed = (starts[first], starts[first] + chunk.count(b"\n") - 1)
+    return ParseResult(source, tree, compile_info, result.flags, reparsed)
+
+
+def _parse_chunk(python_parser, grammar, tokens):
+    """Parse tokens as a file_input with the stack entries of python_parser,
+    so that the tree is built the same way as for the whole source (e.g.
+    with collapsed chains). Doesn't try to recover from errors: the whole
+    source is parsed again then, to get the proper errors."""
+    python_parser.grammar = grammar
+    python_parser.prepare(grammar.symbol_ids["file_input"])
+    stack = python_parser.initial_stack()
+    step = python_parser.step_function()
+    for token in tokens:
+        try:
+            stack = step(stack, grammar, token, grammar.classify(token))
+        except parser.Done as e:
+            return e.node
+    raise parser.SingleParseError("unexpected end of input", tokens[-1])
+
+
+def _move_final_dedents(tokens, lineno):
+    """The tokenizer emits the DEDENT tokens that close the blocks at the end
+    of the chunk at the end of the input. In the whole source they are at the
+    start of the first line of the next statement, move them there."""
+    index = len(tokens) - 1
+    while index >= 0 and tokens[index].token_type in (pytokenizer.tokens.NEWLINE,
+                                                      pytokenizer.tokens.ENDMARKER):
+        index -= 1
+    while index >= 0 and tokens[index].token_type == pytokenizer.tokens.DEDENT:
+        token = tokens[index]
+        token.lineno = lineno
+        token.column = 0
+        index -= 1
+
+
+def _split_statements(tree):
+    """Split the children of a file_input node into the statements and the
+    NEWLINE and ENDMARKER tokens at the end. Returns None if there are
+    NEWLINE tokens between statements."""
+    children = [tree.get_child(i) for i in range(tree.num_children())]
+    num_statements = 0
+    while (num_statements < len(children) and
+           isinstance(children[num_statements], parser.AbstractNonterminal)):
+        num_statements += 1
+    tail = children[num_statements:]
+    for node in tail:
+        if isinstance(node, parser.AbstractNonterminal):
+            return None
+    return children[:num_statements], tail
+
+
+def shift_lines(node, delta):
+    """Return node with delta added to the line numbers of all terminals.
+    The children of a Nonterminal are only copied when they are first looked
+    at, see ShiftedNonterminal, so that moving the statements after an edit
+    doesn't copy the rest of the file."""
+    if delta == 0:
+        return node
+    if isinstance(node, parser.Terminal):
+        return parser.Terminal(node.grammar, node.type, node.value,
+                               node.lineno + delta, node.column)
+    if isinstance(node, ShiftedNonterminal):
+        return shift_lines(node.node, node.delta + delta)
+    if isinstance(node, parser.ChainNonterminal):
+        return parser.ChainNonterminal(node.grammar, node.type, node.chain,
+                                       shift_lines(node.get_child(0), delta))
+    if isinstance(node, parser.Nonterminal1):
+        return parser.Nonterminal1(node.grammar, node.type,
+                                   shift_lines(node.get_child(0), delta))
+    return ShiftedNonterminal(node, delta)
+
+
+class ShiftedNonterminal(parser.AbstractNonterminal):
+    """A node that stands for node with delta added to the line numbers of
+    all its terminals. Its children are shifted on first access, the line
+    number and column are known without that. Shifting it again only adds
+    up the deltas."""
+
+    __slots__ = ("node", "delta", "_children")
+
+    def __init__(self, node, delta):
+        parser.Node.__init__(self, node.grammar, node.type)
+        self.node = node
+        self.delta = delta
+        self._children = None
+
+    def __repr__(self):
+        return "ShiftedNonterminal(delta=%d, node=%r)" % (self.delta,
+                                                         self.node)
+
+    def _shifted_children(self):
+        children = self._children
+        if children is None:
+            node = self.node
+            children = self._children = [
+                shift_lines(node.get_child(i), self.delta)
+                for i in range(node.num_children())]
+        return children
+
+    def get_child(self, i):
+        return self._shifted_children()[i]
+
+    def num_children(self):
+        return self.node.num_children()
+
+    def get_lineno(self):
+        return self.node.get_lineno() + self.delta
+
+    def get_column(self):
+        return self.node.get_column()
+
+    def _dot(self, result):
+        parser.Nonterminal(self.grammar, self.type,
+                           self._shifted_children())._dot(result)
@@ -0,0 +1,198 @@
+"""
+Lazy parsing of the bodies of functions and classes, for tools that mostly
+look at the module-level structure of the code, like outlines or import
+scanners.
+
+Before parsing, the indented body of every def and class statement, from
+its INDENT token to the matching DEDENT, is replaced by a single FAKESUITE
+token, which the grammar accepts in place of an indented block. After
+parsing, the suite node of the statement is replaced by a LazySuite, which
+keeps the tokens of the body and parses them when its children are first
+looked at. The bodies of the functions and classes in a lazily parsed body
+are skipped in the same way.
+
+Syntax errors in a skipped body are raised by the first access to the
+children of its LazySuite, unless the source was checked up front (see
+PythonParser's check_bodies), which parses all the tokens without building
+a tree first.
+"""
+
+from syntaxerrors import parser
+from syntaxerrors.pytoken import tokens as _tokens
+
+# the nodes that can contain funcdef and classdef nodes
+_CONTAINERS = ["file_input", "single_input", "stmt", "compound_stmt",
+               "if_stmt", "while_stmt", "for_stmt", "try_stmt", "with_stmt",
+               "suite", "realorfakesuite", "decorated", "fakesuite"]
+
+
+class LazyContext(object):
+    """What is needed to parse the skipped bodies of one source."""
+
+    def __init__(self, python_parser, compile_info):
+        self.grammar = python_parser.grammar
+        self.lalr = python_parser.lalr
+        self.first_error_only = python_parser.first_error_only
+        self.compile_info = compile_info
+        symbol_ids = self.grammar.symbol_ids
+        self.containers = set([symbol_ids[name] for name in _CONTAINERS])
+        self.funcdef = symbol_ids["funcdef"]
+        self.classdef = symbol_ids["classdef"]
+        self.suite = symbol_ids["suite"]
+
+
+class LazySuite(parser.AbstractNonterminal):
+    """A suite node whose children are parsed on first access.
+
+    tokens are the tokens of the suite, NEWLINE INDENT ... DEDENT. Accessing
+    the children of a suite with a syntax error raises error.SyntaxError
+    (or error.MultipleSyntaxErrors), the line number and column of the node
+    are known without parsing.
+    """
+
+    __slots__ = ("tokens", "context", "_node")
+
+    def __init__(self, context, tokens):
+        parser.Node.__init__(self, context.grammar, context.suite)
+        self.tokens = tokens
+        self.context = context
+        self._node = None
+
+    def __repr__(self):
+        return "LazySuite(lines=%d-%d, parsed=%s)" % (
+            self.tokens[0].lineno, self.tokens[-1].lineno, self.is_parsed())
+
+    def is_parsed(self):
+        return self._node is not None
+
+    def parse(self):
+        """Return the suite as a parsed node."""
+        node = self._node
+        if node is None:
+            node = self._node = parse_tokens(self.context, self.tokens,
+                                             self.context.suite)
+        return node
+
+    def get_child(self, i):
+        return self.parse().get_child(i)
+
+    def num_children(self):
+        return self.parse().num_children()
+
+    def get_lineno(self):
+        return self.tokens[0].lineno
+
+    def get_column(self):
+        return self.tokens[0].column
+
+    def _dot(self, result):
+        self.parse()._dot(result)
+
+
+def skip_bodies(context, tokens):
+    """Return the tokens with the bodies of the def and class statements
+    replaced by FAKESUITE tokens, and a list with an entry for every def and
+    class keyword in the result: the LazySuite of the statement, or None if
+    its body is not indented (and so not skipped)."""
+    result = []
+    lazy_suites = []
+    header = False
+    at_start = True
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        token_type = token.token_type
+        if token_type == _tokens.NAME and (token.value == u"def" or
+                                           token.value == u"class"):
+            header = at_start
+            lazy_suites.append(None)
+        if token_type == _tokens.NEWLINE:
+            if (header and i + 1 < len(tokens) and
+                    tokens[i + 1].token_type == _tokens.INDENT):
+                end = _matching_dedent(tokens, i + 1)
+                lazy_suites[-1] = LazySuite(context, tokens[i:end + 1])
+                indent = tokens[i + 1]
+                result.append(token)
+                result.append(parser.Token(_tokens.FAKESUITE, u"",
+                                           indent.lineno, indent.column,
+                                           indent.line))
+                i = end + 1
+                header = False
+                at_start = True
+                continue
+            header = False
+            at_start = True
+        else:
+            at_start = token_type in (_tokens.INDENT, _tokens.DEDENT)
+        result.append(token)
+        i += 1
+    return result, lazy_suites
+
+def _matching_dedent(tokens, index):
+    depth = 0
+    for i in range(index, len(tokens)):
+        token_type = tokens[i].token_type
+        if token_type == _tokens.INDENT:
+            depth += 1
+        elif token_type == _tokens.DEDENT:
+            depth -= 1
+            if depth == 0:
+                return i
+    # the tokenizer closes all the blocks before the ENDMARKER
+    assert 0, "unbalanced INDENT"
+
+def attach(context, node, lazy_suites):
+    """Return node with the suites of the def and class statements replaced
+    by the LazySuites of lazy_suites, which are in the order of the
+    statements."""
+    lazy_suites = iter(lazy_suites)
+    return _attach(context, node, lazy_suites)
+
+def _attach(context, node, lazy_suites):
+    if node.type == context.funcdef or node.type == context.classdef:
+        lazy_suite = next(lazy_suites)
+        if lazy_suite is None:
+            return node
+        children = [node.get_child(i) for i in range(node.num_children())]
+        children[-1] = lazy_suite
+        return parser.Nonterminal(node.grammar, node.type, children)
+    if node.type not in context.containers:
+        return node
+    changed = False
+    children = []
+    for i in range(node.num_children()):
+        child = node.get_child(i)
+        new_child = _attach(context, child, lazy_suites)
+        changed = changed or new_child is not child
+        children.append(new_child)
+    if not changed:
+        return node
+    if len(children) == 1:
+        return parser.Nonterminal1(node.grammar, node.type, children[0])
+    return parser.Nonterminal(node.grammar, node.type, children)
+
+def parse_tokens(context, tokens, start):
+    """Parse tokens as the symbol start, skipping the bodies of the def and
+    class statements."""
+    from syntaxerrors.pyparse import PythonParser
+    skipped, lazy_suites = skip_bodies(context, tokens)
+    python_parser = PythonParser(grammar=context.grammar, lalr=context.lalr,
+                                 first_error_only=context.first_error_only)
+    python_parser.prepare(start)
+    try:
+        python_parser._add_tokens(python_parser.add_tokens, skipped,
+                                  context.compile_info)
+        tree = python_parser.root
+    finally:
+        python_parser.root = None
+    return attach(context, tree, lazy_suites)
+
+def check_tokens(python_parser, tokens, compile_info):
+    """Check the syntax of all the tokens, including the bodies that are
+    skipped, without building a tree."""
+    from syntaxerrors.pyparse import PythonParser
+    checker = PythonParser(grammar=python_parser.grammar, build_tree=False,
+                           lalr=python_parser.lalr,
+                           first_error_only=python_parser.first_error_only)
+    checker.prepare(python_parser.start)
+    checker._add_tokens(checker.add_tokens, tokens, compile_info)
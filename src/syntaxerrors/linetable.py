@@ -0,0 +1,133 @@
+"""
+The lines of a source, shared by its tokens and syntax errors.
+
+A LineTable stores the offsets at which the lines start in the source buffer
+that pytokenizer.iter_source_tokens scans. The text of a line is only
+decoded when it is first needed, which for most lines is never: the parser
+only looks at lines to report errors. Tokens and errors store the index of
+their line in the table instead of the line itself. The lines at the end of
+the source that the tokenizer makes up are added as text.
+
+A StreamedLineTable is the table for a source that is given as lines and
+read one line at a time, by pytokenizer.iter_tokens. Its source is the part
+of the lines that the tokenizer still needs.
+"""
+
+from array import array
+
+
+class LineTable(object):
+
+    def __init__(self, source, text=None):
+        # the source, with normalized line endings
+        self.source = source
+        # the source decoded as a whole, if it is pure ASCII
+        self.text = text
+        # offsets of the lines in source, -1 for the lines added as text
+        self.starts = array("i")
+        # the lines that were decoded already, by index
+        self._texts = {}
+
+    def add(self, start):
+        """Add the line starting at offset start, return its index."""
+        self.starts.append(start)
+        return len(self.starts) - 1
+
+    def add_text(self, text):
+        """Add a line that is not in the source, return its index."""
+        self._texts[len(self.starts)] = text
+        self.starts.append(-1)
+        return len(self.starts) - 1
+
+    def read_more(self, clean):
+        """Called by the tokenizer at the end of source. Returns whether
+        more of the source was read, which is never for a LineTable."""
+        return False
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        text = self._texts.get(index)
+        if text is not None:
+            return text
+        start = self.starts[index]
+        end = self.source.find(b"\n", start) + 1
+        if self.text is not None:
+            text = self.text[start:end]
+        else:
+            # the lines are also looked up to show errors, which must not
+            # fail if the source is not valid utf-8
+            text = self.source[start:end].decode("utf-8", "replace")
+        self._texts[index] = text
+        return text
+
+
+class StreamedLineTable(object):
+    """The lines of a source given as an iterable of byte strings, which are
+    read as the tokenizer reaches them. source only starts with the line
+    the tokenizer is at if it is not in the middle of a bracket or string,
+    otherwise the lines are appended to it. Only the text of the current
+    line is kept, the tokens get it when they are made."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self.source = b""
+        self.text = None
+        self._count = 0
+        self._current = -1
+        self._current_text = None
+        self._texts = {}
+
+    def _next_line(self):
+        line = next(self._lines, b"")
+        assert isinstance(line, bytes)
+        return line
+
+    def read_more(self, clean):
+        """Read the next line. If clean is true, nothing before it is needed
+        any more and source is replaced by it. Otherwise the lines are
+        appended to source, as many as are in it already, so that reading a
+        long bracket or string doesn't copy source for every line. Returns
+        False at the end of the lines (or at an empty line)."""
+        line = self._next_line()
+        if not line:
+            return False
+        if clean:
+            self.source = line
+            return True
+        lines = [self.source, line]
+        size = len(line)
+        while size < len(self.source):
+            line = self._next_line()
+            if not line:
+                break
+            lines.append(line)
+            size += len(line)
+        self.source = b"".join(lines)
+        return True
+
+    def add(self, start):
+        """Add the line of source starting at offset start, return its
+        index."""
+        end = self.source.find(b"\n", start) + 1
+        if end == 0:
+            end = len(self.source)
+        self._current = self._count
+        self._current_text = self.source[start:end].decode("utf-8")
+        self._count += 1
+        return self._current
+
+    def add_text(self, text):
+        """Add a line that is not in the source, return its index."""
+        self._texts[self._count] = text
+        self._count += 1
+        return self._count - 1
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index == self._current:
+            return self._current_text
+        return self._texts[index]
@@ -0,0 +1,295 @@
+"""
+An LR parser driver for the LALR(1) tables of metaparser.build_lr_tables.
+
+It builds the same trees and reports the same errors as the DFA parser in
+parser.py, but its stack is a list of integer states instead of a chain of
+StackEntry objects. The nodes that are under construction live in a second,
+parallel list, which is left out (None) when only the syntax is checked and
+after the first error. Then a stack is just its states, which are cheap to
+copy for the repairs tried by the error recovery, and a tuple of them is the
+configuration (see StackEntry.configuration).
+
+Use it with Parser(..., lalr=True).
+"""
+
+from syntaxerrors import metaparser, parser
+
+# the tables for the grammars with the same DFAs, by id(grammar.dfas)
+_tables = {}
+
+
+def get_tables(grammar):
+    """Return the DriverTables for grammar, building them on first use.
+    Grammars made by shared_copy share them."""
+    entry = _tables.get(id(grammar.dfas), None)
+    if entry is None or entry[0] is not grammar.dfas:
+        entry = _tables[id(grammar.dfas)] = (
+            grammar.dfas,
+            DriverTables(metaparser.build_lr_tables(grammar)))
+    return entry[1]
+
+
+class DriverTables(object):
+    """The tables of a metaparser.LRTables, rearranged for the driver:
+
+    * every label that has no action in a state with a default reduction
+      reduces by default, so errors are only found in the states that have
+      no default reduction
+    * the reductions of LR_START productions only push a state, the whole
+      chain of them that precedes a shift is done at once: an action >=
+      num_states is the index + num_states into chains, the tuples of
+      states to push, and chain_targets, the states the token is then
+      shifted into
+    * eager_reductions: per state, the production to reduce without looking
+      at the next token, because the state has no other action, or -1. The
+      DFA parser pops such nodes at once too (see parser.pop_finished)
+    * append_states: per state, if its only action is to reduce an
+      LR_APPEND production and the state after that does not depend on the
+      rest of the stack, that state, otherwise -1. Instead of pushing such
+      a state (after a shift or a goto), the driver replaces the top of the
+      stack with it at once, like the SHIFTREDUCE actions of lemon
+    """
+
+    def __init__(self, lr_tables):
+        self.lr_tables = lr_tables
+        num_labels = self.num_labels = lr_tables.num_labels
+        num_states = self.num_states = lr_tables.num_states
+        num_nonterminals = self.num_nonterminals = (
+            lr_tables.num_nonterminals)
+        self.gotos = lr_tables.gotos
+        self.positions = lr_tables.positions
+        self.start_states = lr_tables.start_states
+        self.lhs = [production[0] for production in lr_tables.productions]
+        self.kinds = [production[2] for production in lr_tables.productions]
+        self.symbols = [production[3] for production in lr_tables.productions]
+        self.chains = []
+        self.chain_targets = []
+        chain_index = {}
+        actions = []
+        self.eager_reductions = [-1] * num_states
+        for state in range(num_states):
+            default = lr_tables.default_reductions[state]
+            only_default = default != -1
+            for label_index in range(num_labels):
+                action = self.chain_action(state, label_index)
+                if action == -1 and default != -1:
+                    action = -2 - default
+                elif action != -2 - default:
+                    only_default = False
+                if isinstance(action, tuple):
+                    if action not in chain_index:
+                        chain_index[action] = len(self.chains)
+                        self.chains.append(action[:-1])
+                        self.chain_targets.append(action[-1])
+                    action = num_states + chain_index[action]
+                actions.append(action)
+            if only_default:
+                self.eager_reductions[state] = default
+        self.actions = actions
+
+        targets = {}
+        for state in range(num_states):
+            base = state * num_nonterminals
+            for nonterminal in range(num_nonterminals):
+                target = self.gotos[base + nonterminal]
+                if target != -1:
+                    targets.setdefault(nonterminal, set()).add(target)
+        self.append_states = [-1] * num_states
+        for state in range(num_states):
+            production = self.eager_reductions[state]
+            if (production != -1 and
+                    self.kinds[production] == metaparser.LR_APPEND and
+                    len(targets[self.lhs[production]]) == 1):
+                self.append_states[state], = targets[self.lhs[production]]
+
+    def chain_action(self, state, label_index):
+        """The action for label_index in state, the actions of LR_START
+        reductions are followed to the tuple of states they push, the last
+        one is the state the token is shifted into."""
+        lr_tables = self.lr_tables
+        action = lr_tables.actions[state * self.num_labels + label_index]
+        pushed = []
+        while action < -1 and self.kinds[-2 - action] == metaparser.LR_START:
+            state = self.gotos[state * self.num_nonterminals +
+                               self.lhs[-2 - action]]
+            pushed.append(state)
+            action = lr_tables.actions[state * self.num_labels + label_index]
+        if not pushed:
+            return action
+        # the first set of the sub-DFA contains the label, so its chain
+        # always ends with a shift
+        assert action >= 0
+        pushed.append(action)
+        return tuple(pushed)
+
+
+class LRStack(object):
+    """The stack of the LR driver, add_token changes it in place.
+
+    values is the list of the nodes of the states, the entry for a state of
+    a DFA position is the list of the children of the node under
+    construction, or None if no tree is built.
+    """
+
+    def __init__(self, tables, states, values=None):
+        self.tables = tables
+        self.states = states
+        self.values = values
+
+    def add_token(self, grammar, token, label_index):
+        """Return a new stack with token added, self stays unchanged. Used
+        by the error recovery."""
+        assert self.values is None
+        return add_token(self, grammar, token, label_index, copy=True)
+
+    def configuration(self):
+        return tuple(self.states)
+
+    def without_nodes(self):
+        return LRStack(self.tables, self.states[:])
+
+
+def initial_stack(grammar, start, build_tree=True):
+    tables = get_tables(grammar)
+    values = None
+    if build_tree:
+        values = [None]
+    return LRStack(tables, [tables.start_states[start]], values)
+
+
+def add_token(stack, grammar, token, label_index, copy=False):
+    """Add token to stack, which is changed in place, or to a copy of it if
+    copy is true. Raises a ParseError if the token is invalid, the stack is
+    unchanged then."""
+    tables = stack.tables
+    states = stack.states
+    num_nonterminals = tables.num_nonterminals
+    gotos = tables.gotos
+    append_states = tables.append_states
+    # the reductions before the shift only change the top of the stack
+    # states[:depth] + [state], they are done on the real stack once it is
+    # known that the token can be shifted. The productions are collected in
+    # reduced, the ones with a folded goto (see append_states) inverted
+    depth = len(states) - 1
+    state = states[depth]
+    reduced = None
+    while True:
+        action = tables.actions[state * tables.num_labels + label_index]
+        if action >= 0:
+            break
+        if action == -1:
+            symbol_id, dfa_state = tables.positions[state]
+            raise parser.bad_input(grammar, grammar.dfas[symbol_id - 256],
+                                   dfa_state, token)
+        production = -2 - action
+        if reduced is None:
+            reduced = []
+        nonterminal = tables.lhs[production]
+        if tables.kinds[production] == metaparser.LR_APPEND:
+            depth -= 1
+            state = gotos[states[depth - 1] * num_nonterminals + nonterminal]
+            reduced.append(production)
+            continue
+        if depth == 1:
+            # the node of the start symbol is finished, the token is not
+            # part of the input anymore
+            stack = _commit(stack, grammar, depth, state, reduced, copy)
+            raise parser.Done(_finish_node(stack.values, grammar, tables,
+                                           production))
+        state = gotos[states[depth - 1] * num_nonterminals + nonterminal]
+        target = append_states[state]
+        if target != -1:
+            depth -= 1
+            state = target
+            production = ~production
+        reduced.append(production)
+
+    stack = _commit(stack, grammar, depth, state, reduced, copy)
+    states = stack.states
+    values = stack.values
+    if action >= tables.num_states:
+        chain = tables.chains[action - tables.num_states]
+        states.extend(chain)
+        if values is not None:
+            values.extend([[] for state in chain])
+        action = tables.chain_targets[action - tables.num_states]
+    target = append_states[action]
+    if target != -1:
+        states[-1] = target
+        if values is not None:
+            values[-1].append(parser.Terminal.fromtoken(grammar, token))
+    else:
+        states.append(action)
+        if values is not None:
+            values.append(parser.Terminal.fromtoken(grammar, token))
+
+    eager_reductions = tables.eager_reductions
+    while True:
+        production = eager_reductions[states[-1]]
+        if production == -1:
+            return stack
+        nonterminal = tables.lhs[production]
+        if tables.kinds[production] == metaparser.LR_APPEND:
+            # the states of the node and of the child are replaced by the
+            # state of the next DFA position, the node gets the child
+            states.pop()
+            if values is not None:
+                child = values.pop()
+                values[-1].append(child)
+            states[-1] = gotos[states[-2] * num_nonterminals + nonterminal]
+            continue
+        node = _finish_node(values, grammar, tables, production)
+        if len(states) == 2:
+            # only the initial state is left
+            raise parser.Done(node)
+        state = gotos[states[-2] * num_nonterminals + nonterminal]
+        target = append_states[state]
+        if target != -1:
+            states.pop()
+            states[-1] = target
+            if values is not None:
+                values.pop()
+                values[-1].append(node)
+        else:
+            states[-1] = state
+            if values is not None:
+                values[-1] = node
+
+def _commit(stack, grammar, depth, state, reduced, copy):
+    """Do the reductions found by add_token on the stack, or a copy."""
+    if copy:
+        states = stack.states[:depth]
+        states.append(state)
+        return LRStack(stack.tables, states)
+    if reduced is None:
+        return stack
+    states = stack.states
+    del states[depth + 1:]
+    states[depth] = state
+    values = stack.values
+    if values is None:
+        return stack
+    tables = stack.tables
+    for production in reduced:
+        if production < 0:
+            production = ~production
+            node = _finish_node(values, grammar, tables, production)
+            values.pop()
+            values[-1].append(node)
+        elif tables.kinds[production] == metaparser.LR_APPEND:
+            child = values.pop()
+            values[-1].append(child)
+        else:
+            values[-1] = _finish_node(values, grammar, tables, production)
+    return stack
+
+def _finish_node(values, grammar, tables, production):
+    """The node for the children on top of values, or None if no tree is
+    built."""
+    if values is None:
+        return None
+    children = values[-1]
+    if len(children) == 1:
+        return parser.Nonterminal1(grammar, tables.symbols[production],
+                                   children[0])
+    return parser.Nonterminal(grammar, tables.symbols[production], children)
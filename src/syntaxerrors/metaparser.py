@@ -87,7 +87,10 @@ def nfa_to_dfa(start, end):
             for label, sub_nfa in nfa.arcs:
                 if label is not None:
                     sub_nfa.find_unlabeled_states(arcs.setdefault(label, set()))
-        for label, nfa_set in arcs.items():
+        # in a fixed order, so that the numbering of the states and labels
+        # doesn't depend on the order of the NFA sets
+        for label in sorted(arcs):
+            nfa_set = arcs[label]
             for st in state_stack:
                 if st.nfas == nfa_set:
                     break
@@ -142,7 +145,8 @@ class ParserGenerator(object):
             states = []
             for state in dfa:
                 arcs = []
-                for label, next in state.arcs.items():
+                # sorted, the order of the dict differs between interpreters
+                for label, next in sorted(state.arcs.items()):
                     arcs.append((self.make_label(gram, label), dfa.index(next)))
                 states.append((arcs, state.is_final))
             symbol_id = gram.symbol_ids[name]
@@ -150,6 +154,7 @@ class ParserGenerator(object):
             gram.dfas.append(dfa)
             assert len(gram.dfas) - 1 == symbol_id - 256
         gram.start = gram.symbol_ids[self.start_symbol]
+        gram.build_action_table()
         return gram
 
     def make_label(self, gram, label):
@@ -209,7 +214,7 @@ class ParserGenerator(object):
     def make_first(self, gram, name):
         original_firsts = self.first[name]
         firsts = dict()
-        for label in original_firsts:
+        for label in sorted(original_firsts):
             firsts[self.make_label(gram, label)] = None
         return firsts
 
@@ -367,3 +372,370 @@ class ParserGenerator(object):
             invalid = pytoken.tok_name[self.type]
             raise PgenError("unexpected token: %s" % (invalid,),
                             self.token)
+
+
+# Kinds of the productions of the LR grammar of build_lr_tables. For every
+# DFA D there is a nonterminal N(D) and one nonterminal N(D, s) per state s,
+# which derives the sequences of labels that lead from state 0 to s.
+LR_START = 0        # N(D, 0) -> (empty)
+LR_APPEND = 1       # N(D, t) -> N(D, s) X, for every arc s -X-> t
+LR_FINISH = 2       # N(D) -> N(D, f), for every accepting state f
+LR_ACCEPT = 3       # start(D) -> N(D) EOF
+
+# lookahead standing for "propagated" while computing the LALR lookaheads
+_PROPAGATE = -1
+
+
+class LRTables(object):
+    """LALR(1) parse tables for the DFAs of a grammar, see build_lr_tables.
+
+    * num_labels, num_nonterminals, num_states: the sizes of the tables
+    * actions: flat list, the entry for state * num_labels + label_index is
+      the state to shift to if >= 0, -1 for an error, or -2 - p to reduce
+      production p. Reductions that are only done by default are not in it
+    * default_reductions: per state, the production that is reduced if the
+      label has no action, or -1
+    * gotos: flat list, the entry for state * num_nonterminals + nonterminal
+      is the state after reducing to that nonterminal, or -1
+    * productions: list of (nonterminal, length, kind, symbol_id) tuples
+    * nonterminals: list of (symbol_id, dfa_state) pairs, dfa_state is -1
+      for N(D) and -2 for start(D)
+    * start_states: the initial state for every symbol_id
+    * positions: per state, the (symbol_id, dfa_state) pair of the DFA state
+      whose arcs are the possible next labels, or None
+    * conflicts: the number of (state, label) pairs with more than one
+      action, which were resolved like the DFA parser does
+    """
+
+    def __init__(self, num_labels, nonterminals, productions):
+        self.num_labels = num_labels
+        self.num_nonterminals = len(nonterminals)
+        self.nonterminals = nonterminals
+        self.productions = productions
+        self.num_states = 0
+        self.actions = None
+        self.default_reductions = None
+        self.gotos = None
+        self.start_states = {}
+        self.positions = None
+        self.conflicts = 0
+
+
+def build_lr_tables(grammar):
+    """Build LALR(1) tables that parse the same language as the DFAs of
+    grammar and produce the same trees (see lrparser).
+
+    Every DFA is turned into a left-linear set of productions (see LR_START
+    and the other kinds), so an LR parser reduces a child label onto the
+    node of its parent as soon as the child is complete, like the DFA parser
+    does. The lookaheads are computed by propagating them between the
+    kernel items of the LR(0) automaton.
+
+    Where the DFA parser has a choice, it takes the first arc that matches
+    and only pops a node if no arc matches. Conflicts are resolved in the
+    same way: shifting wins over reducing and entering a sub-DFA wins over
+    finishing the current one. Reductions of a state that only finish its
+    node are done by default, for every label that has no other action, so
+    errors are found in the same DFA state as by the DFA parser.
+    """
+    return _LRBuilder(grammar).build()
+
+
+class _LRBuilder(object):
+
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.num_labels = len(grammar.labels)
+        # terminals are the label indices, plus one for the end of the input
+        self.eof = self.num_labels
+        self.num_terminals = self.num_labels + 1
+        self.nonterminals = []
+        self.productions = []
+        self.symbol_nonterminals = {}
+        self.state_nonterminals = {}
+        self.start_nonterminals = {}
+        for dfa in grammar.dfas:
+            symbol_id = dfa.symbol_id
+            self.symbol_nonterminals[symbol_id] = self.new_nonterminal(
+                symbol_id, -1)
+            self.state_nonterminals[symbol_id] = [
+                self.new_nonterminal(symbol_id, state_index)
+                for state_index in range(len(dfa.states))]
+            self.start_nonterminals[symbol_id] = self.new_nonterminal(
+                symbol_id, -2)
+        for dfa in grammar.dfas:
+            self.add_productions(dfa)
+        self.by_lhs = {}
+        for production, (lhs, rhs, kind) in enumerate(self.productions):
+            self.by_lhs.setdefault(lhs, []).append(production)
+        self.compute_first_sets()
+
+    def new_nonterminal(self, symbol_id, dfa_state):
+        self.nonterminals.append((symbol_id, dfa_state))
+        return self.num_terminals + len(self.nonterminals) - 1
+
+    def add_productions(self, dfa):
+        grammar = self.grammar
+        symbol_id = dfa.symbol_id
+        states = self.state_nonterminals[symbol_id]
+        self.productions.append((states[0], (), LR_START))
+        for state_index, (arcs, is_accepting) in enumerate(dfa.states):
+            for label_index, next_state in arcs:
+                label = grammar.labels[label_index]
+                if label >= 256:
+                    symbol = self.symbol_nonterminals[label]
+                else:
+                    symbol = label_index
+                production = (states[next_state],
+                              (states[state_index], symbol), LR_APPEND)
+                # '<>' and '!=' are different arcs with the same label
+                if production not in self.productions:
+                    self.productions.append(production)
+            if is_accepting:
+                self.productions.append(
+                    (self.symbol_nonterminals[symbol_id],
+                     (states[state_index], ), LR_FINISH))
+        self.productions.append(
+            (self.start_nonterminals[symbol_id],
+             (self.symbol_nonterminals[symbol_id], self.eof), LR_ACCEPT))
+
+    def compute_first_sets(self):
+        self.nullable = set()
+        self.first = {}
+        for lhs in self.by_lhs:
+            self.first[lhs] = set()
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs, kind in self.productions:
+                first = self.first[lhs]
+                size = len(first)
+                nullable = True
+                for symbol in rhs:
+                    if symbol < self.num_terminals:
+                        first.add(symbol)
+                        nullable = False
+                        break
+                    first.update(self.first[symbol])
+                    if symbol not in self.nullable:
+                        nullable = False
+                        break
+                if nullable and lhs not in self.nullable:
+                    self.nullable.add(lhs)
+                    changed = True
+                if len(first) != size:
+                    changed = True
+
+    def first_of(self, symbols, lookaheads):
+        """The first set of symbols followed by any of lookaheads."""
+        result = set()
+        for symbol in symbols:
+            if symbol < self.num_terminals:
+                result.add(symbol)
+                return result
+            result.update(self.first[symbol])
+            if symbol not in self.nullable:
+                return result
+        result.update(lookaheads)
+        return result
+
+    def closure(self, kernel):
+        """The LR(0) closure of the items (production, dot) of kernel."""
+        items = list(kernel)
+        seen = set(items)
+        for production, dot in items:
+            rhs = self.productions[production][1]
+            if dot < len(rhs) and rhs[dot] >= self.num_terminals:
+                for sub in self.by_lhs[rhs[dot]]:
+                    if (sub, 0) not in seen:
+                        seen.add((sub, 0))
+                        items.append((sub, 0))
+        return items
+
+    def closure1(self, kernel):
+        """The LR(1) closure of kernel, a dict mapping items to their sets
+        of lookaheads."""
+        items = {}
+        for item, lookaheads in kernel.items():
+            items[item] = set(lookaheads)
+        todo = list(items)
+        while todo:
+            production, dot = todo.pop()
+            rhs = self.productions[production][1]
+            if dot >= len(rhs) or rhs[dot] < self.num_terminals:
+                continue
+            lookaheads = self.first_of(rhs[dot + 1:],
+                                       items[production, dot])
+            for sub in self.by_lhs[rhs[dot]]:
+                sub_lookaheads = items.get((sub, 0), None)
+                if sub_lookaheads is None:
+                    items[sub, 0] = set(lookaheads)
+                elif lookaheads <= sub_lookaheads:
+                    continue
+                else:
+                    sub_lookaheads.update(lookaheads)
+                todo.append((sub, 0))
+        return items
+
+    def build_lr0(self):
+        self.kernels = []
+        self.state_of_kernel = {}
+        self.transitions = []
+        start_states = {}
+        for dfa in self.grammar.dfas:
+            start = self.start_nonterminals[dfa.symbol_id]
+            production, = self.by_lhs[start]
+            start_states[dfa.symbol_id] = self.state_for(
+                frozenset([(production, 0)]))
+        i = 0
+        while i < len(self.kernels):
+            by_symbol = {}
+            for production, dot in self.closure(self.kernels[i]):
+                rhs = self.productions[production][1]
+                if dot < len(rhs):
+                    by_symbol.setdefault(rhs[dot], []).append(
+                        (production, dot + 1))
+            transitions = {}
+            for symbol, kernel in by_symbol.items():
+                transitions[symbol] = self.state_for(frozenset(kernel))
+            self.transitions.append(transitions)
+            i += 1
+        return start_states
+
+    def state_for(self, kernel):
+        state = self.state_of_kernel.get(kernel, -1)
+        if state == -1:
+            state = self.state_of_kernel[kernel] = len(self.kernels)
+            self.kernels.append(kernel)
+        return state
+
+    def compute_lookaheads(self, start_states):
+        lookaheads = [dict([(item, set()) for item in kernel])
+                      for kernel in self.kernels]
+        propagate = {}
+        for state in start_states.values():
+            for item in self.kernels[state]:
+                lookaheads[state][item].add(self.eof)
+        for state, kernel in enumerate(self.kernels):
+            transitions = self.transitions[state]
+            for item in kernel:
+                targets = propagate[state, item] = []
+                closure = self.closure1({item: set([_PROPAGATE])})
+                for (production, dot), item_lookaheads in closure.items():
+                    rhs = self.productions[production][1]
+                    if dot == len(rhs):
+                        continue
+                    target = transitions[rhs[dot]]
+                    target_item = (production, dot + 1)
+                    for lookahead in item_lookaheads:
+                        if lookahead == _PROPAGATE:
+                            targets.append((target, target_item))
+                        else:
+                            lookaheads[target][target_item].add(lookahead)
+        changed = True
+        while changed:
+            changed = False
+            for (state, item), targets in propagate.items():
+                item_lookaheads = lookaheads[state][item]
+                for target, target_item in targets:
+                    target_lookaheads = lookaheads[target][target_item]
+                    if not item_lookaheads <= target_lookaheads:
+                        target_lookaheads.update(item_lookaheads)
+                        changed = True
+        return lookaheads
+
+    def build(self):
+        start_states = self.build_lr0()
+        lookaheads = self.compute_lookaheads(start_states)
+        num_labels = self.num_labels
+        num_nonterminals = len(self.nonterminals)
+        num_states = len(self.kernels)
+        tables = LRTables(
+            num_labels, self.nonterminals,
+            [(lhs - self.num_terminals, len(rhs), kind,
+              self.nonterminals[lhs - self.num_terminals][0])
+             for lhs, rhs, kind in self.productions])
+        tables.num_states = num_states
+        tables.start_states = start_states
+        actions = [-1] * (num_states * num_labels)
+        gotos = [-1] * (num_states * num_nonterminals)
+        tables.default_reductions = [-1] * num_states
+        tables.positions = [None] * num_states
+        for state in range(num_states):
+            base = state * num_labels
+            for symbol, target in self.transitions[state].items():
+                if symbol >= self.num_terminals:
+                    gotos[state * num_nonterminals + symbol -
+                          self.num_terminals] = target
+                elif symbol != self.eof:
+                    actions[base + symbol] = target
+            finishing = set()
+            closure = self.closure1(lookaheads[state])
+            for (production, dot), item_lookaheads in sorted(closure.items()):
+                lhs, rhs, kind = self.productions[production]
+                if dot != len(rhs):
+                    continue
+                if kind != LR_START:
+                    finishing.add(production)
+                for lookahead in item_lookaheads:
+                    if lookahead == self.eof:
+                        continue
+                    self.add_reduction(tables, actions, base + lookahead,
+                                       production)
+            if len(finishing) == 1:
+                tables.default_reductions[state], = finishing
+            tables.positions[state] = self.position(self.kernels[state])
+        tables.actions = actions
+        tables.gotos = gotos
+        return tables
+
+    def add_reduction(self, tables, actions, index, production):
+        action = actions[index]
+        if action == -1:
+            actions[index] = -2 - production
+            return
+        tables.conflicts += 1
+        if action >= 0:
+            # shifting wins
+            return
+        other = -2 - action
+        kind = self.productions[production][2]
+        other_kind = self.productions[other][2]
+        if kind == LR_START and other_kind != LR_START:
+            actions[index] = -2 - production
+        elif kind == LR_START or other_kind != LR_START:
+            raise PgenError("reduce/reduce conflict between %s and %s" % (
+                self.production_repr(other), self.production_repr(production)))
+
+    def production_repr(self, production):
+        lhs, rhs, kind = self.productions[production]
+        return " ".join([self.symbol_repr(symbol)
+                         for symbol in (lhs, ) + rhs])
+
+    def symbol_repr(self, symbol):
+        if symbol < self.num_terminals:
+            return str(symbol)
+        symbol_id, dfa_state = self.nonterminals[symbol - self.num_terminals]
+        name = self.grammar.symbol_names[symbol_id]
+        if dfa_state == -1:
+            return name
+        return "%s_%s" % (name, dfa_state)
+
+    def position(self, kernel):
+        positions = set()
+        for production, dot in kernel:
+            lhs, rhs, kind = self.productions[production]
+            if kind == LR_ACCEPT and dot == 0:
+                symbol = rhs[0]
+            elif kind in (LR_APPEND, LR_FINISH) and dot == 1:
+                symbol = rhs[0]
+            else:
+                return None
+            positions.add(self.nonterminals[symbol - self.num_terminals])
+        if len(positions) != 1:
+            return None
+        symbol_id, dfa_state = positions.pop()
+        if dfa_state == -1:
+            # the kernel of an initial state
+            dfa_state = 0
+        return symbol_id, dfa_state
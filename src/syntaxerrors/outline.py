@@ -0,0 +1,164 @@
+"""
+Outlines of Python sources: the def and class statements, with their names,
+decorators and line ranges, for editors and code indexers.
+
+The outline only needs the tokens. A def or class keyword at the start of a
+statement starts a span, whose body is either the rest of the line or the
+indented block after it, which ends with the DEDENT that goes back to the
+indentation of the header. The tokenizer guarantees that structure for
+every source it accepts, even one with syntax errors, and when it gives up
+(e.g. on an unclosed bracket), the tokens up to there are used. Checking the
+syntax is optional, it runs the parser without building a tree, with the
+usual error recovery.
+"""
+
+from syntaxerrors import error, pyparse, pytokenizer
+from syntaxerrors.pytoken import tokens as _tokens
+
+
+class Span(object):
+    """A def or class statement.
+
+    * kind: u"def" or u"class"
+    * name: the name of the function or class, None if it is missing
+    * lineno, end_lineno: the first and the last line of the statement, the
+      first line is the one of the first decorator, if there are any
+    * depth: the number of def and class statements around it
+    * decorators: the dotted names of the decorators
+    """
+
+    __slots__ = ("kind", "name", "lineno", "end_lineno", "depth",
+                 "decorators")
+
+    def __init__(self, kind, name, lineno, end_lineno, depth, decorators):
+        self.kind = kind
+        self.name = name
+        self.lineno = lineno
+        self.end_lineno = end_lineno
+        self.depth = depth
+        self.decorators = decorators
+
+    def __repr__(self):
+        return "Span(%s, %r, %d-%d, depth=%d)" % (
+            self.kind, self.name, self.lineno, self.end_lineno, self.depth)
+
+
+class Outline(object):
+    """The spans of a source, in the order of their first lines, and the
+    syntax errors found (the error of the tokenizer if it gave up, or all
+    the errors if the syntax was checked)."""
+
+    def __init__(self, spans, errors):
+        self.spans = spans
+        self.errors = errors
+
+
+def outline(python_parser, textsrc, compile_info, check=False):
+    """Return the Outline of the (utf-8 encoded) textsrc, see
+    PythonParser.parse_outline."""
+    flags = pyparse.source_flags(textsrc, compile_info.flags)
+    errors = []
+    try:
+        tokens = pytokenizer.generate_source_tokens(textsrc, flags)
+    except (error.TokenError, error.TokenIndentationError) as e:
+        e.filename = compile_info.filename
+        tokens = e.tokens
+        errors.append(e)
+    else:
+        if check:
+            errors = check_syntax(python_parser, tokens, compile_info)
+    return Outline(find_spans(tokens), errors)
+
+def check_syntax(python_parser, tokens, compile_info):
+    """Return the list of the syntax errors in tokens."""
+    checker = pyparse.PythonParser(
+        future_flags=python_parser.future_flags, build_tree=False,
+        lalr=python_parser.lalr,
+        first_error_only=python_parser.first_error_only)
+    checker.prepare(pyparse._targets[compile_info.mode])
+    checker._select_grammar(tokens, compile_info)
+    try:
+        checker._add_tokens(checker.add_tokens, tokens, compile_info)
+    except error.SyntaxError as e:
+        return [e]
+    except error.MultipleSyntaxErrors as e:
+        return e.errors
+    return []
+
+def find_spans(tokens):
+    """Return the list of Spans for the def and class statements in
+    tokens."""
+    spans = []
+    # the spans with an indented body that has not ended yet, and the
+    # indentation level of their headers
+    open_spans = []
+    level = 0
+    # the span whose header is being read
+    header = None
+    decorators = []
+    decorated_lineno = 0
+    at_start = True
+    last_lineno = 0
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        token_type = token.token_type
+        if token_type == _tokens.NEWLINE:
+            last_lineno = token.lineno
+            if header is not None:
+                if (i + 1 < len(tokens) and
+                        tokens[i + 1].token_type == _tokens.INDENT):
+                    open_spans.append((header, level))
+                else:
+                    header.end_lineno = token.lineno
+                header = None
+            at_start = True
+        elif token_type == _tokens.INDENT:
+            level += 1
+            at_start = True
+        elif token_type == _tokens.DEDENT:
+            level -= 1
+            while open_spans and open_spans[-1][1] >= level:
+                open_spans.pop()[0].end_lineno = last_lineno
+            at_start = True
+        elif at_start:
+            at_start = False
+            if token_type == _tokens.AT:
+                if not decorators:
+                    decorated_lineno = token.lineno
+                decorators.append(_dotted_name(tokens, i + 1))
+            elif token_type == _tokens.NAME and (token.value == u"def" or
+                                                 token.value == u"class"):
+                name = None
+                if (i + 1 < len(tokens) and
+                        tokens[i + 1].token_type == _tokens.NAME):
+                    name = tokens[i + 1].value
+                lineno = token.lineno
+                if decorators:
+                    lineno = decorated_lineno
+                header = Span(token.value, name, lineno, token.lineno,
+                              len(open_spans), decorators)
+                spans.append(header)
+                decorators = []
+            else:
+                decorators = []
+        i += 1
+    # only left open if the tokenizer gave up
+    if tokens:
+        last_lineno = max(last_lineno, tokens[len(tokens) - 1].lineno)
+    if header is not None:
+        header.end_lineno = last_lineno
+    for span, _ in open_spans:
+        span.end_lineno = last_lineno
+    return spans
+
+def _dotted_name(tokens, index):
+    parts = []
+    while index < len(tokens) and tokens[index].token_type == _tokens.NAME:
+        parts.append(tokens[index].value)
+        if (index + 1 < len(tokens) and
+                tokens[index + 1].token_type == _tokens.DOT):
+            index += 2
+        else:
+            break
+    return u".".join(parts)
@@ -2,6 +2,8 @@
 A CPython inspired RPython parser.
 """
 
+import weakref
+
 import six
 
 SHIFT = "SHIFT"
@@ -9,6 +11,9 @@ REDUCE = "REDUCE"
 POP = "POP"
 ERROR = "ERROR"
 
+_POP_ACTION = (POP, -1, None)
+_ERROR_ACTION = (ERROR, -1, None)
+
 class Grammar(object):
     """
     Base Grammar object.
@@ -34,6 +39,13 @@ class Grammar(object):
         self.token_ids = {}
         self.start = -1
         self._repair_fake_tokens = None
+        # flat action table, see build_action_table
+        self.actions = None
+        # specialized add_token for this grammar, see genparser.py
+        self.generated_add_token = None
+        # the index of the label of this grammar in the labels of the
+        # tokens, -1 if they don't have them, see tokenlabels.py
+        self.label_slot = -1
 
         self.TOKEN_NAMES = d = {}
         for name, index in self.TOKENS.items():
@@ -49,14 +61,63 @@ class Grammar(object):
         new.dfas = self.dfas
         new.labels = self.labels
         new.token_ids = self.token_ids
+        new.actions = self.actions
+        new.generated_add_token = self.generated_add_token
         return new
 
+    def build_action_table(self):
+        """Precompute the parser action for every (dfa, state, label) triple.
+
+        The result is a flat list, the entry for a triple is found at index
+        dfa.action_base[state] + label_index. Every entry is a tuple (action,
+        next_state, reductions). For REDUCE, the whole chain of sub-DFAs that
+        need to be pushed is precomputed as the reductions tuple of
+        (state, dfa) pairs, next_state is then the state that the token is
+        shifted into in the innermost DFA.
+        """
+        num_labels = len(self.labels)
+        actions = []
+        for dfa in self.dfas:
+            dfa.action_base = []
+            for state_index in range(len(dfa.states)):
+                dfa.action_base.append(len(actions))
+                for label_index in range(num_labels):
+                    actions.append(
+                        self._compute_action(dfa, state_index, label_index))
+        self.actions = actions
+
+    def _compute_action(self, dfa, state_index, label_index):
+        reductions = []
+        while True:
+            action, next_state, sub_node_dfa = _find_dfa_action(
+                self, dfa, state_index, label_index)
+            if action != REDUCE:
+                break
+            reductions.append((next_state, sub_node_dfa))
+            dfa = sub_node_dfa
+            state_index = 0
+        if not reductions:
+            if action == SHIFT:
+                return (SHIFT, next_state, None)
+            elif action == POP:
+                return _POP_ACTION
+            return _ERROR_ACTION
+        # a sub-DFA is only entered if the label is in its first set, so the
+        # chain of reductions always ends with a shift
+        assert action == SHIFT
+        return (REDUCE, next_state, tuple(reductions))
+
 
     def classify(self, token):
         """Find the label for a token."""
         if token.label_index != -1:
             return token.label_index
         token.grammar = self
+        if token.labels is not None and self.label_slot != -1:
+            label_index = token.labels[self.label_slot]
+            if label_index != -1:
+                token.label_index = label_index
+                return label_index
         if token.token_type == self.KEYWORD_TOKEN:
             label_index = self.keyword_ids.get(token.value, -1)
             if label_index != -1:
@@ -95,22 +156,22 @@ class DFA(object):
         self.grammar = grammar
         self.symbol_id = symbol_id
         self.states = states
-        self.first = self._first_to_string(first)
+        # the labels that can start the symbol, as a bitmask
+        self.first = self._first_to_mask(first)
+        # offsets into grammar.actions, one per state
+        self.action_base = None
+        # interned StackFrames with this dfa, by (state, next frame)
+        self.frames = weakref.WeakValueDictionary()
 
     def could_match_token(self, label_index):
-        pos = label_index >> 3
-        bit = 1 << (label_index & 0b111)
-        return bool(six.indexbytes(self.first, label_index >> 3) & bit)
+        return bool((self.first >> label_index) & 1)
 
     @staticmethod
-    def _first_to_string(first):
-        l = sorted(first.keys())
-        b = bytearray(32)
-        for label_index in l:
-            pos = label_index >> 3
-            bit = 1 << (label_index & 0b111)
-            b[pos] |= bit
-        return bytes(b)
+    def _first_to_mask(first):
+        mask = 0
+        for label_index in first:
+            mask |= 1 << label_index
+        return mask
 
     def __repr__(self):
         return "<DFA %s>" % (self.grammar.symbol_names[self.symbol_id], )
@@ -129,6 +190,8 @@ class Token(object):
         # label_index in the grammar, computed later
         self.label_index = -1
         self.grammar = None
+        # the label indexes in the grammars of a tokenlabels.TokenLabels
+        self.labels = None
 
     def __repr__(self):
         if self.grammar is None:
@@ -266,25 +329,56 @@ class AbstractNonterminal(Node):
             child._dot(result)
 
 class Nonterminal(AbstractNonterminal):
-    __slots__ = ("_children", )
-    def __init__(self, grammar, type, children=None):
+    """A node with any number of children.
+
+    Nodes are immutable, but append_child does not copy the list of children:
+    the new node shares the list with the old one and the old one only looks
+    at its first _length entries. Only when appending to a node that is not
+    the last one sharing the list (which happens during error recovery), the
+    children are copied.
+    """
+    __slots__ = ("_children", "_length")
+    def __init__(self, grammar, type, children=None, length=-1):
         Node.__init__(self, grammar, type)
         if children is None:
             children = []
         self._children = children
+        # -1 means all of _children
+        self._length = length
 
     def __repr__(self):
-        return "Nonterminal(type=%s, children=%r)" % (self.type, self._children)
+        return "Nonterminal(type=%s, children=%r)" % (
+            self.type, self._children[:self.num_children()])
 
     def get_child(self, i):
         assert self._children is not None
+        length = self._length
+        if length != -1:
+            if i < 0:
+                i += length
+            if not 0 <= i < length:
+                raise IndexError(i)
         return self._children[i]
 
     def num_children(self):
-        return len(self._children)
+        length = self._length
+        if length == -1:
+            return len(self._children)
+        return length
 
     def append_child(self, child):
-        return Nonterminal(self.grammar, self.type, self._children + [child])
+        children = self._children
+        length = self._length
+        if length == -1:
+            # from now on, only look at the current children
+            length = self._length = len(children)
+        if len(children) == length:
+            # nobody appended to the list after self, extend it in place
+            children.append(child)
+        else:
+            children = children[:length]
+            children.append(child)
+        return Nonterminal(self.grammar, self.type, children, length + 1)
 
 
 class Nonterminal1(AbstractNonterminal):
@@ -307,6 +401,62 @@ class Nonterminal1(AbstractNonterminal):
         assert 0, "should be unreachable"
 
 
+class ChainNonterminal(Nonterminal1):
+    """Stands for a chain of nodes that have exactly one child each, like the
+    nodes for all the operator precedence levels above an expression that is
+    just an atom. type is the type of the outermost node of the chain, chain
+    the types of the left out nodes below it (outermost first) and the child
+    is the child of the innermost node."""
+    __slots__ = ("chain", )
+    def __init__(self, grammar, type, chain, child):
+        Nonterminal1.__init__(self, grammar, type, child)
+        self.chain = chain
+
+    def __repr__(self):
+        return "ChainNonterminal(type=%s, chain=%r, children=[%r])" % (
+            self.type, self.chain, self._child)
+
+    def expand(self):
+        """Return the chain as Nonterminal1 nodes."""
+        node = self._child
+        for type in reversed(self.chain):
+            node = Nonterminal1(self.grammar, type, node)
+        return Nonterminal1(self.grammar, self.type, node)
+
+_chains = {}
+
+def _collapse(node):
+    """Return node, or a ChainNonterminal for it if node has a single child
+    which has a single child itself."""
+    child = node._child
+    if not isinstance(child, Nonterminal1):
+        return node
+    if isinstance(child, ChainNonterminal):
+        key = (child.type, child.chain)
+    else:
+        key = (child.type, None)
+    chain = _chains.get(key, None)
+    if chain is None:
+        # all nodes with the same chain share the tuple
+        if key[1] is None:
+            chain = _chains[key] = (child.type, )
+        else:
+            chain = _chains[key] = (child.type, ) + child.chain
+    return ChainNonterminal(node.grammar, node.type, chain, child._child)
+
+def expand_chains(node):
+    """Return the tree node with all ChainNonterminals expanded."""
+    if isinstance(node, ChainNonterminal):
+        node = node.expand()
+    if isinstance(node, Terminal):
+        return node
+    children = [expand_chains(node.get_child(i))
+                for i in range(node.num_children())]
+    if len(children) == 1:
+        return Nonterminal1(node.grammar, node.type, children[0])
+    return Nonterminal(node.grammar, node.type, children)
+
+
 class ParseError(Exception):
     pass
 
@@ -330,7 +480,44 @@ class Done(Exception):
         self.node = node
 
 
+class StackFrame(object):
+    """The (dfa, state) pairs of a stack, without the nodes.
+
+    Frames are interned: two stacks have the same frame if and only if they
+    have the same dfas and states, so frames can be compared and hashed by
+    identity.
+    """
+
+    __slots__ = ("dfa", "state", "next", "depth", "__weakref__")
+
+    def __init__(self, dfa, state, next):
+        self.dfa = dfa
+        self.state = state
+        self.next = next
+        if next is None:
+            self.depth = 1
+        else:
+            self.depth = next.depth + 1
+
+    @staticmethod
+    def intern(dfa, state, next):
+        key = (state, next)
+        frame = dfa.frames.get(key, None)
+        if frame is None:
+            frame = dfa.frames[key] = StackFrame(dfa, state, next)
+        return frame
+
+    def __repr__(self):
+        return "<StackFrame %s %s depth=%s>" % (
+            self.dfa.grammar.symbol_names.get(self.dfa.symbol_id,
+                                              self.dfa.symbol_id),
+            self.state, self.depth)
+
+
 class StackEntry(object):
+    # the interned StackFrame, computed on demand
+    _frame = None
+
     def __init__(self, next, dfa, state, node=None):
         self.next = next
         self.dfa = dfa
@@ -343,16 +530,61 @@ class StackEntry(object):
     def pop(self):
         return self.next
 
-    def node_append_child(self, child):
+    def frame(self):
+        """Return the interned StackFrame of this stack. Stacks with the same
+        frame accept the same tokens, no matter what their nodes are."""
+        frame = self._frame
+        if frame is not None:
+            return frame
+        # the entries are immutable, so the frames are cached on them; only
+        # the entries that are newer than the last cached frame are visited
+        entries = []
+        stack = self
+        while stack is not None and stack._frame is None:
+            entries.append(stack)
+            stack = stack.next
+        if stack is not None:
+            frame = stack._frame
+        for entry in reversed(entries):
+            frame = StackFrame.intern(entry.dfa, entry.state, frame)
+            entry._frame = frame
+        return frame
+
+    def configuration(self):
+        """Return a hashable description of the parser configuration, see
+        frame."""
+        return self.frame()
+
+    def add_token(self, grammar, token, label_index):
+        """Return the stack after adding token, used by the error recovery,
+        which works on the stacks of both drivers."""
+        return add_token(self, grammar, token, label_index)
+
+    def without_nodes(self):
+        """Return a ValidatingStackEntry with the same dfas and states."""
+        entries = []
+        stack = self
+        while stack is not None:
+            entries.append(stack)
+            stack = stack.next
+        result = None
+        for entry in reversed(entries):
+            result = ValidatingStackEntry(result, entry.dfa, entry.state)
+        return result
+
+    def _appended_node(self, child):
         node = self.node
         if node is None:
-            newnode = Nonterminal1(self.dfa.grammar, self.dfa.symbol_id, child)
+            return Nonterminal1(self.dfa.grammar, self.dfa.symbol_id, child)
         elif isinstance(node, Nonterminal1):
-            newnode = Nonterminal(
+            return Nonterminal(
                     self.dfa.grammar, self.dfa.symbol_id, [node._child, child])
         else:
-            newnode = self.node.append_child(child)
-        return StackEntry(self.next, self.dfa, self.state, newnode)
+            return node.append_child(child)
+
+    def node_append_child(self, child):
+        return StackEntry(self.next, self.dfa, self.state,
+                          self._appended_node(child))
 
     def switch_state(self, state):
         return StackEntry(self.next, self.dfa, state, self.node)
@@ -374,8 +606,8 @@ class StackEntry(object):
     def shift(self, grammar, next_state, token):
         """shift a non-terminal and prepare for the next state."""
         new_node = Terminal.fromtoken(grammar, token)
-        self = self.node_append_child(new_node)
-        return self.switch_state(next_state)
+        return StackEntry(self.next, self.dfa, next_state,
+                          self._appended_node(new_node))
 
     def shift_pop(self, grammar, next_state, token):
         stack = self.shift(grammar, next_state, token)
@@ -410,11 +642,97 @@ class StackEntry(object):
             self.node._dot(result)
 
 
+class CollapsingStackEntry(StackEntry):
+    """A stack entry that builds a tree where chains of nodes with a single
+    child are replaced by ChainNonterminals."""
+
+    def push(self, dfa, state):
+        return CollapsingStackEntry(self, dfa, state)
+
+    def node_append_child(self, child):
+        return CollapsingStackEntry(self.next, self.dfa, self.state,
+                                    self._appended_node(child))
+
+    def switch_state(self, state):
+        return CollapsingStackEntry(self.next, self.dfa, state, self.node)
+
+    def pop_node(self):
+        node = self.node
+        if isinstance(node, Nonterminal1):
+            node = _collapse(node)
+        self = self.next
+        if self:
+            return self.node_append_child(node)
+        else:
+            raise Done(node)
+
+    def shift(self, grammar, next_state, token):
+        new_node = Terminal.fromtoken(grammar, token)
+        return CollapsingStackEntry(self.next, self.dfa, next_state,
+                                    self._appended_node(new_node))
+
+
+class ValidatingStackEntry(StackEntry):
+    """A stack entry that runs the same state machine as StackEntry, but
+    never builds any nodes. Used to only check the syntax of the input."""
+
+    def push(self, dfa, state):
+        return ValidatingStackEntry(self, dfa, state)
+
+    def node_append_child(self, child):
+        return self
+
+    def switch_state(self, state):
+        return ValidatingStackEntry(self.next, self.dfa, state)
+
+    def pop_node(self):
+        self = self.next
+        if self:
+            return self
+        else:
+            raise Done(None)
+
+    def reduce(self, next_dfa, next_state):
+        return ValidatingStackEntry(
+            ValidatingStackEntry(self.next, self.dfa, next_state), next_dfa, 0)
+
+    def shift(self, grammar, next_state, token):
+        return ValidatingStackEntry(self.next, self.dfa, next_state)
+
+    def without_nodes(self):
+        return self
+
+
 class Parser(object):
+    """The parser driver.
+
+    * build_tree: if False, only check the syntax of the input, root stays
+      None
+    * first_error_only: if True, stop at the first error instead of trying
+      to recover from it to find further errors
+    * flat_tree: if True, root is a flattree.FlatNode instead of a Node
+    * collapse_chains: if True, chains of nodes with a single child are
+      replaced by ChainNonterminals, see expand_chains
+    * builder: if given, root is the value the builder computes for the
+      start symbol instead of a Node, see astbuilder.ASTBuilder
+    * lalr: if True, run the LR driver of lrparser on LALR(1) tables built
+      from the DFAs instead of the DFAs themselves. The trees and errors are
+      the same. Can't be combined with flat_tree, collapse_chains or builder
+    """
 
-    def __init__(self, grammar):
+    def __init__(self, grammar, build_tree=True, first_error_only=False,
+                 flat_tree=False, collapse_chains=False, builder=None,
+                 lalr=False):
+        if lalr and (flat_tree or collapse_chains or builder is not None):
+            raise ValueError("lalr only builds Node trees")
         self.grammar = grammar
         self.root = None
+        self.build_tree = build_tree
+        self.first_error_only = first_error_only
+        self.flat_tree = flat_tree
+        self.collapse_chains = collapse_chains
+        self.builder = builder
+        self.lalr = lalr
 
     def prepare(self, start=-1):
         """Setup the parser for parsing.
@@ -426,19 +744,49 @@ class Parser(object):
         self.root = None
         self.start = start
 
+    def initial_stack(self):
+        if self.lalr:
+            from syntaxerrors import lrparser
+            return lrparser.initial_stack(self.grammar, self.start,
+                                          self.build_tree)
+        dfa = self.grammar.dfas[self.start - 256]
+        if not self.build_tree:
+            return ValidatingStackEntry(None, dfa, 0)
+        if self.builder is not None:
+            from syntaxerrors.astbuilder import BuilderStackEntry
+            return BuilderStackEntry(None, dfa, 0, [], self.builder)
+        if self.flat_tree:
+            from syntaxerrors.flattree import FlatTree, FlatStackEntry
+            return FlatStackEntry(None, dfa, 0, FlatTree(self.grammar))
+        if self.collapse_chains:
+            return CollapsingStackEntry(None, dfa, 0)
+        return StackEntry(None, dfa, 0)
+
+    def step_function(self):
+        """The function that adds a token to the stack of initial_stack."""
+        if self.lalr:
+            from syntaxerrors import lrparser
+            return lrparser.add_token
+        return add_token
+
     def add_tokens(self, tokens):
         from syntaxerrors.recovery import try_recover
         grammar = self.grammar
-        stack = StackEntry(None, grammar.dfas[self.start - 256], 0)
+        stack = self.initial_stack()
+        step = self.step_function()
         errors = []
         i = 0
         while i < len(tokens):
             token = tokens[i]
             label_index = grammar.classify(token)
             try:
-                stack = add_token(stack, grammar, token, label_index)
+                stack = step(stack, grammar, token, label_index)
             except ParseError as e:
                 errors.append(e)
+                if self.first_error_only:
+                    break
+                # the tree is thrown away after an error, stop building it
+                stack = stack.without_nodes()
                 tokens, i, stack = try_recover(grammar, stack, tokens, i)
                 if i == -1:
                     break
@@ -447,6 +795,54 @@ class Parser(object):
                 break
             else:
                 i += 1
+        self._raise_errors(errors)
+
+    def add_token_stream(self, tokens):
+        """Like add_tokens, but consume the iterable tokens lazily.
+
+        Only the current token is kept, except when recovering from an error,
+        then the tokens the recovery needs to look at are buffered.
+        """
+        from syntaxerrors.recovery import try_recover, fill_lookahead
+        grammar = self.grammar
+        stack = self.initial_stack()
+        step = self.step_function()
+        errors = []
+        tokens = iter(tokens)
+        # tokens buffered for error recovery, window[i] is the next one
+        window = None
+        i = 0
+        while True:
+            if window is not None and i < len(window):
+                token = window[i]
+            else:
+                window = None
+                token = next(tokens, None)
+                if token is None:
+                    break
+            label_index = grammar.classify(token)
+            try:
+                stack = step(stack, grammar, token, label_index)
+            except ParseError as e:
+                errors.append(e)
+                if self.first_error_only:
+                    break
+                stack = stack.without_nodes()
+                if window is None:
+                    window = [token]
+                    i = 0
+                fill_lookahead(window, i, tokens)
+                window, i, stack = try_recover(grammar, stack, window, i)
+                if i == -1:
+                    break
+            except Done as e:
+                self.root = e.node
+                break
+            else:
+                i += 1
+        self._raise_errors(errors)
+
+    def _raise_errors(self, errors):
         if errors:
             self.root = None
             if len(errors) == 1:
@@ -456,46 +852,64 @@ class Parser(object):
 
 
 def add_token(stack, grammar, token, label_index):
-    orig_stack = stack
+    generated = grammar.generated_add_token
+    if generated is not None:
+        return generated(stack, grammar, token, label_index)
+    actions = grammar.actions
     while True:
-        action, next_state, sub_node_dfa = find_action(stack, grammar, token, label_index)
         dfa = stack.dfa
         state_index = stack.state
-        states = dfa.states
+        action, next_state, reductions = actions[
+                dfa.action_base[state_index] + label_index]
         if action == SHIFT:
             # We matched a non-terminal.
             return stack.shift_pop(grammar, next_state, token)
         elif action == REDUCE:
-            stack = stack.reduce(sub_node_dfa, next_state)
+            for reduce_state, sub_node_dfa in reductions:
+                stack = stack.reduce(sub_node_dfa, reduce_state)
+            return stack.shift_pop(grammar, next_state, token)
         elif action == POP:
-            try:
-                stack = stack.pop_node()
-            except Done as e:
-                XXX #?
-            if stack is None:
-                raise SingleParseError("too much input", token)
+            stack = pop(stack, token)
         else:
             assert action == ERROR
-            arcs, is_accepting = states[state_index]
-            # We failed to find any arcs to another state, so unless this
-            # state is accepting, it's invalid input.
-            # If only one possible input would satisfy, attach it to the
-            # error.
-            if len(arcs) == 1:
-                expected = grammar.labels[arcs[0][0]]
-                expected_str = grammar.token_to_error_string.get(
-                        arcs[0][0], None)
-            else:
-                expected = -1
-                expected_str = None
+            raise bad_input(grammar, dfa, state_index, token)
 
-            raise SingleParseError("bad input", token, expected, expected_str)
+def pop(stack, token):
+    stack = stack.pop_node()
+    if stack is None:
+        raise SingleParseError("too much input", token)
+    return stack
+
+def pop_finished(stack):
+    """Pop the nodes of stack that are finished, because their DFA is in a
+    final state without arcs. Used after shifting into such a state."""
+    while True:
+        stack = stack.pop_node()
+        arcs, is_accepting = stack.dfa.states[stack.state]
+        if arcs or not is_accepting:
+            return stack
+
+def bad_input(grammar, dfa, state_index, token):
+    arcs, is_accepting = dfa.states[state_index]
+    # We failed to find any arcs to another state, so unless this
+    # state is accepting, it's invalid input.
+    # If only one possible input would satisfy, attach it to the
+    # error.
+    if len(arcs) == 1:
+        expected = grammar.labels[arcs[0][0]]
+        expected_str = grammar.token_to_error_string.get(
+                arcs[0][0], None)
+    else:
+        expected = -1
+        expected_str = None
+    return SingleParseError("bad input", token, expected, expected_str)
 
 def find_action(stack, grammar, token, label_index):
-    dfa = stack.dfa
-    state_index = stack.state
-    states = dfa.states
-    arcs, is_accepting = states[state_index]
+    """Compute a single parser step without using the action table."""
+    return _find_dfa_action(grammar, stack.dfa, stack.state, label_index)
+
+def _find_dfa_action(grammar, dfa, state_index, label_index):
+    arcs, is_accepting = dfa.states[state_index]
     for i, next_state in arcs:
         sym_id = grammar.labels[i]
         if label_index == i:
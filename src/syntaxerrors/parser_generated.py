@@ -0,0 +1,9593 @@
+# THIS FILE IS AUTOMATICALLY GENERATED BY genparser.py
+# DO NOT EDIT
+# TO REGENERATE THE FILE, RUN:
+#     python genparser.py > parser_generated.py
+
+from syntaxerrors.parser import bad_input, pop, pop_finished
+
+GRAMMAR_KEY = 'e24e9bcc5ecc764a7cde7a0b5d818e76bfd877c3'
+GRAMMAR_FINGERPRINT = '56d8c4fc47141521bf5dc91e64f9df18ed89be47'
+
+labels_0 = frozenset([4, 5, 9, 10, 33, 36, 37, 38])
+labels_1 = frozenset([59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70])
+labels_2 = frozenset([24, 75, 80, 81, 82, 83, 84, 85, 86])
+labels_3 = frozenset([75, 80, 81, 82, 83, 84, 85])
+labels_4 = frozenset([89, 90, 91, 92, 93, 94, 95, 96, 97])
+labels_5 = frozenset([6, 7, 34, 110])
+labels_6 = frozenset([115, 116, 117, 118, 119])
+labels_7 = frozenset([147, 148, 149, 150, 151, 152, 153, 154, 155])
+labels_8 = frozenset([43, 159, 160, 161])
+
+
+def build(dfas):
+    dfa_single_input = dfas[0]
+    dfa_and_expr = dfas[1]
+    dfa_and_test = dfas[2]
+    dfa_arglist = dfas[3]
+    dfa_argument = dfas[4]
+    dfa_arith_expr = dfas[5]
+    dfa_assert_stmt = dfas[6]
+    dfa_atom = dfas[7]
+    dfa_augassign = dfas[8]
+    dfa_break_stmt = dfas[9]
+    dfa_classdef = dfas[10]
+    dfa_comp_for = dfas[11]
+    dfa_comp_if = dfas[12]
+    dfa_comp_iter = dfas[13]
+    dfa_comp_op = dfas[14]
+    dfa_comparison = dfas[15]
+    dfa_compound_stmt = dfas[16]
+    dfa_continue_stmt = dfas[17]
+    dfa_decorated = dfas[18]
+    dfa_decorator = dfas[19]
+    dfa_decorators = dfas[20]
+    dfa_del_stmt = dfas[21]
+    dfa_dictmaker = dfas[22]
+    dfa_dictorsetmaker = dfas[23]
+    dfa_dotted_as_name = dfas[24]
+    dfa_dotted_as_names = dfas[25]
+    dfa_dotted_name = dfas[26]
+    dfa_encoding_decl = dfas[27]
+    dfa_eval_input = dfas[28]
+    dfa_except_clause = dfas[29]
+    dfa_exec_stmt = dfas[30]
+    dfa_expr = dfas[31]
+    dfa_expr_stmt = dfas[32]
+    dfa_exprlist = dfas[33]
+    dfa_factor = dfas[34]
+    dfa_fakesuite = dfas[35]
+    dfa_file_input = dfas[36]
+    dfa_flow_stmt = dfas[37]
+    dfa_for_stmt = dfas[38]
+    dfa_fpdef = dfas[39]
+    dfa_fplist = dfas[40]
+    dfa_funcdef = dfas[41]
+    dfa_global_stmt = dfas[42]
+    dfa_if_stmt = dfas[43]
+    dfa_import_as_name = dfas[44]
+    dfa_import_as_names = dfas[45]
+    dfa_import_from = dfas[46]
+    dfa_import_name = dfas[47]
+    dfa_import_stmt = dfas[48]
+    dfa_lambdef = dfas[49]
+    dfa_list_for = dfas[50]
+    dfa_list_if = dfas[51]
+    dfa_list_iter = dfas[52]
+    dfa_listmaker = dfas[53]
+    dfa_not_test = dfas[54]
+    dfa_old_lambdef = dfas[55]
+    dfa_old_test = dfas[56]
+    dfa_or_test = dfas[57]
+    dfa_parameters = dfas[58]
+    dfa_pass_stmt = dfas[59]
+    dfa_power = dfas[60]
+    dfa_print_stmt = dfas[61]
+    dfa_raise_stmt = dfas[62]
+    dfa_realorfakesuite = dfas[63]
+    dfa_return_stmt = dfas[64]
+    dfa_shift_expr = dfas[65]
+    dfa_simple_stmt = dfas[66]
+    dfa_sliceop = dfas[67]
+    dfa_small_stmt = dfas[68]
+    dfa_stmt = dfas[69]
+    dfa_subscript = dfas[70]
+    dfa_subscriptlist = dfas[71]
+    dfa_suite = dfas[72]
+    dfa_term = dfas[73]
+    dfa_test = dfas[74]
+    dfa_testlist = dfas[75]
+    dfa_testlist1 = dfas[76]
+    dfa_testlist_comp = dfas[77]
+    dfa_testlist_safe = dfas[78]
+    dfa_trailer = dfas[79]
+    dfa_try_stmt = dfas[80]
+    dfa_varargslist = dfas[81]
+    dfa_while_stmt = dfas[82]
+    dfa_with_item = dfas[83]
+    dfa_with_stmt = dfas[84]
+    dfa_xor_expr = dfas[85]
+    dfa_yield_expr = dfas[86]
+    dfa_yield_stmt = dfas[87]
+
+    def single_input_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1 or label_index == 2 or label_index == 3:
+            # NEWLINE, compound_stmt, simple_stmt
+            if label_index == 1 or label_index == 3:
+                return pop_finished(stack.shift(grammar, 1, token))
+            return stack.shift(grammar, 2, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_decorated, 1).push(dfa_decorators, 1)
+                .push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 13:
+            # 'class'
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_classdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 15:
+            # 'def'
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_funcdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_for_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_import_stmt, 1)
+                .push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_if_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_import_stmt, 1)
+                .push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_try_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_while_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_with_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_yield_stmt, 1).push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = (stack.switch_state(2).push(dfa_compound_stmt, 1)
+                .push(dfa_fakesuite, 0))
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def single_input_1(stack, grammar, token, label_index):
+        return None
+
+    def single_input_2(stack, grammar, token, label_index):
+        if label_index == 1:
+            # NEWLINE
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def and_expr_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_shift_expr, 1)
+                .push(dfa_arith_expr, 1).push(dfa_term, 1).push(dfa_factor, 2)
+                .push(dfa_power, 1).push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_shift_expr, 1)
+                .push(dfa_arith_expr, 1).push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 39:
+            # shift_expr
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def and_expr_1(stack, grammar, token, label_index):
+        if label_index == 40:
+            # AMPER
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def and_test_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = stack.switch_state(1).push(dfa_not_test, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 41:
+            # not_test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def and_test_1(stack, grammar, token, label_index):
+        if label_index == 42:
+            # 'and'
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def arglist_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44 or label_index == 45:
+            # STAR, DOUBLESTAR, argument
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            if label_index == 44:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def arglist_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def arglist_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(5).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(5).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(5).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(5).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 5, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def arglist_3(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 6, token)
+        return None
+
+    def arglist_4(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 7, token)
+        return None
+
+    def arglist_5(stack, grammar, token, label_index):
+        return None
+
+    def arglist_6(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44 or label_index == 45:
+            # STAR, DOUBLESTAR, argument
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            if label_index == 44:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def arglist_7(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_argument, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_argument, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 44 or label_index == 45:
+            # DOUBLESTAR, argument
+            if label_index == 44:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 7, token)
+
+    def argument_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def argument_1(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(3).push(dfa_comp_for, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 48 or label_index == 49:
+            # EQUAL, comp_for
+            if label_index == 48:
+                return stack.shift(grammar, 2, token)
+            return pop_finished(stack.shift(grammar, 3, token))
+        return None
+
+    def argument_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 3, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def argument_3(stack, grammar, token, label_index):
+        return None
+
+    def arith_expr_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_term, 1)
+                .push(dfa_factor, 2).push(dfa_power, 1).push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_term, 1)
+                .push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 50:
+            # term
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def arith_expr_1(stack, grammar, token, label_index):
+        if label_index == 6 or label_index == 7:
+            # PLUS, MINUS
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def assert_stmt_0(stack, grammar, token, label_index):
+        if label_index == 11:
+            # 'assert'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def assert_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def assert_stmt_2(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def assert_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def assert_stmt_4(stack, grammar, token, label_index):
+        return None
+
+    def atom_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def atom_1(stack, grammar, token, label_index):
+        return None
+
+    def atom_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(7).push(dfa_testlist_comp, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(7).push(dfa_testlist_comp, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(7).push(dfa_testlist_comp, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(7).push(dfa_testlist_comp, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = stack.switch_state(7).push(dfa_yield_expr, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 51 or label_index == 52 or label_index == 53:
+            # RPAR, testlist_comp, yield_expr
+            if label_index == 51:
+                return pop_finished(stack.shift(grammar, 1, token))
+            return stack.shift(grammar, 7, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def atom_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(8).push(dfa_listmaker, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(8).push(dfa_listmaker, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(8).push(dfa_listmaker, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(8).push(dfa_listmaker, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 54 or label_index == 55:
+            # RSQB, listmaker
+            if label_index == 54:
+                return pop_finished(stack.shift(grammar, 1, token))
+            return stack.shift(grammar, 8, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def atom_4(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(9).push(dfa_testlist1, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(9).push(dfa_testlist1, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(9).push(dfa_testlist1, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(9).push(dfa_testlist1, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 56:
+            # testlist1
+            return stack.shift(grammar, 9, token)
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def atom_5(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(10).push(dfa_dictorsetmaker, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(10).push(dfa_dictorsetmaker, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(10).push(dfa_dictorsetmaker, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(10).push(dfa_dictorsetmaker, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 57 or label_index == 58:
+            # RBRACE, dictorsetmaker
+            if label_index == 57:
+                return pop_finished(stack.shift(grammar, 1, token))
+            return stack.shift(grammar, 10, token)
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def atom_6(stack, grammar, token, label_index):
+        if label_index == 38:
+            # STRING
+            return stack.shift(grammar, 6, token)
+        return None
+
+    def atom_7(stack, grammar, token, label_index):
+        if label_index == 51:
+            # RPAR
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 7, token)
+
+    def atom_8(stack, grammar, token, label_index):
+        if label_index == 54:
+            # RSQB
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 8, token)
+
+    def atom_9(stack, grammar, token, label_index):
+        if label_index == 10:
+            # BACKQUOTE
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 9, token)
+
+    def atom_10(stack, grammar, token, label_index):
+        if label_index == 57:
+            # RBRACE
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 10, token)
+
+    def augassign_0(stack, grammar, token, label_index):
+        if label_index in labels_1:
+            # PERCENTEQUAL, AMPEREQUAL, DOUBLESTAREQUAL, STAREQUAL, PLUSEQUAL, MINEQUAL, DOUBLESLASHEQUAL, SLASHEQUAL, LEFTSHIFTEQUAL, RIGHTSHIFTEQUAL, CIRCUMFLEXEQUAL, VBAREQUAL
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def augassign_1(stack, grammar, token, label_index):
+        return None
+
+    def break_stmt_0(stack, grammar, token, label_index):
+        if label_index == 12:
+            # 'break'
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def break_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def classdef_0(stack, grammar, token, label_index):
+        if label_index == 13:
+            # 'class'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def classdef_1(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def classdef_2(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 71:
+            # LPAR, COLON
+            if label_index == 5:
+                return stack.shift(grammar, 3, token)
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def classdef_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 51 or label_index == 72:
+            # RPAR, testlist
+            if label_index == 51:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def classdef_4(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(7).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return pop_finished(stack.shift(grammar, 7, token))
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def classdef_5(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def classdef_6(stack, grammar, token, label_index):
+        if label_index == 51:
+            # RPAR
+            return stack.shift(grammar, 5, token)
+        raise bad_input(grammar, stack.dfa, 6, token)
+
+    def classdef_7(stack, grammar, token, label_index):
+        return None
+
+    def comp_for_0(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def comp_for_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 74:
+            # exprlist
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def comp_for_2(stack, grammar, token, label_index):
+        if label_index == 75:
+            # 'in'
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def comp_for_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 76:
+            # or_test
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def comp_for_4(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(5).push(dfa_comp_iter, 1)
+                .push(dfa_comp_for, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(5).push(dfa_comp_iter, 1)
+                .push(dfa_comp_if, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 77:
+            # comp_iter
+            return pop_finished(stack.shift(grammar, 5, token))
+        return None
+
+    def comp_for_5(stack, grammar, token, label_index):
+        return None
+
+    def comp_if_0(stack, grammar, token, label_index):
+        if label_index == 21:
+            # 'if'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def comp_if_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_old_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 78:
+            # old_test
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def comp_if_2(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(3).push(dfa_comp_iter, 1)
+                .push(dfa_comp_for, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(3).push(dfa_comp_iter, 1)
+                .push(dfa_comp_if, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 77:
+            # comp_iter
+            return pop_finished(stack.shift(grammar, 3, token))
+        return None
+
+    def comp_if_3(stack, grammar, token, label_index):
+        return None
+
+    def comp_iter_0(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(1).push(dfa_comp_for, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = stack.switch_state(1).push(dfa_comp_if, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 49 or label_index == 79:
+            # comp_for, comp_if
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def comp_iter_1(stack, grammar, token, label_index):
+        return None
+
+    def comp_op_0(stack, grammar, token, label_index):
+        if label_index in labels_2:
+            # 'not', 'in', NOTEQUAL, LESS, LESSEQUAL, EQEQUAL, GREATER, GREATEREQUAL, 'is'
+            if label_index == 24:
+                return stack.shift(grammar, 3, token)
+            if label_index in labels_3:
+                return pop_finished(stack.shift(grammar, 1, token))
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def comp_op_1(stack, grammar, token, label_index):
+        return None
+
+    def comp_op_2(stack, grammar, token, label_index):
+        if label_index == 24:
+            # 'not'
+            return pop_finished(stack.shift(grammar, 1, token))
+        return None
+
+    def comp_op_3(stack, grammar, token, label_index):
+        if label_index == 75:
+            # 'in'
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def comparison_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 87:
+            # expr
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def comparison_1(stack, grammar, token, label_index):
+        if label_index in labels_2:
+            # 'not', 'in', NOTEQUAL, LESS, LESSEQUAL, EQEQUAL, GREATER, GREATEREQUAL, 'is'
+            stack = stack.switch_state(0).push(dfa_comp_op, 0)
+            if label_index == 24:
+                return stack.shift(grammar, 3, token)
+            if label_index in labels_3:
+                return pop_finished(stack.shift(grammar, 1, token))
+            return stack.shift(grammar, 2, token)
+        if label_index == 88:
+            # comp_op
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def compound_stmt_0(stack, grammar, token, label_index):
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(1).push(dfa_decorated, 1)
+                .push(dfa_decorators, 1).push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 13:
+            # 'class'
+            stack = stack.switch_state(1).push(dfa_classdef, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 15:
+            # 'def'
+            stack = stack.switch_state(1).push(dfa_funcdef, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(1).push(dfa_for_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = stack.switch_state(1).push(dfa_if_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = stack.switch_state(1).push(dfa_try_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = stack.switch_state(1).push(dfa_while_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = stack.switch_state(1).push(dfa_with_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = stack.switch_state(1).push(dfa_fakesuite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index in labels_4:
+            # classdef, decorated, fakesuite, for_stmt, funcdef, if_stmt, try_stmt, while_stmt, with_stmt
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def compound_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def continue_stmt_0(stack, grammar, token, label_index):
+        if label_index == 14:
+            # 'continue'
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def continue_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def decorated_0(stack, grammar, token, label_index):
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(1).push(dfa_decorators, 1)
+                .push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 98:
+            # decorators
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def decorated_1(stack, grammar, token, label_index):
+        if label_index == 13:
+            # 'class'
+            stack = stack.switch_state(2).push(dfa_classdef, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 15:
+            # 'def'
+            stack = stack.switch_state(2).push(dfa_funcdef, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 89 or label_index == 93:
+            # classdef, funcdef
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def decorated_2(stack, grammar, token, label_index):
+        return None
+
+    def decorator_0(stack, grammar, token, label_index):
+        if label_index == 8:
+            # AT
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def decorator_1(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = stack.switch_state(2).push(dfa_dotted_name, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 99:
+            # dotted_name
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def decorator_2(stack, grammar, token, label_index):
+        if label_index == 1 or label_index == 5:
+            # NEWLINE, LPAR
+            if label_index == 1:
+                return pop_finished(stack.shift(grammar, 4, token))
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def decorator_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44:
+            # STAR, DOUBLESTAR
+            stack = stack.switch_state(6).push(dfa_arglist, 0)
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            return stack.shift(grammar, 2, token)
+        if label_index == 51 or label_index == 100:
+            # RPAR, arglist
+            if label_index == 51:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def decorator_4(stack, grammar, token, label_index):
+        return None
+
+    def decorator_5(stack, grammar, token, label_index):
+        if label_index == 1:
+            # NEWLINE
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def decorator_6(stack, grammar, token, label_index):
+        if label_index == 51:
+            # RPAR
+            return stack.shift(grammar, 5, token)
+        raise bad_input(grammar, stack.dfa, 6, token)
+
+    def decorators_0(stack, grammar, token, label_index):
+        if label_index == 8:
+            # AT
+            stack = stack.switch_state(1).push(dfa_decorator, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 101:
+            # decorator
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def decorators_1(stack, grammar, token, label_index):
+        if label_index == 8:
+            # AT
+            stack = stack.switch_state(1).push(dfa_decorator, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 101:
+            # decorator
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def del_stmt_0(stack, grammar, token, label_index):
+        if label_index == 16:
+            # 'del'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def del_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 74:
+            # exprlist
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def del_stmt_2(stack, grammar, token, label_index):
+        return None
+
+    def dictmaker_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def dictmaker_1(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def dictmaker_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def dictmaker_3(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 4, token)
+        return None
+
+    def dictmaker_4(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def dictorsetmaker_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def dictorsetmaker_1(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(4).push(dfa_comp_for, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 47 or label_index == 49 or label_index == 71:
+            # COMMA, comp_for, COLON
+            if label_index == 47:
+                return stack.shift(grammar, 2, token)
+            if label_index == 49:
+                return pop_finished(stack.shift(grammar, 4, token))
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def dictorsetmaker_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(5).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(5).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(5).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(5).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 5, token)
+        return None
+
+    def dictorsetmaker_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def dictorsetmaker_4(stack, grammar, token, label_index):
+        return None
+
+    def dictorsetmaker_5(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def dictorsetmaker_6(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(4).push(dfa_comp_for, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 47 or label_index == 49:
+            # COMMA, comp_for
+            if label_index == 47:
+                return stack.shift(grammar, 7, token)
+            return pop_finished(stack.shift(grammar, 4, token))
+        return None
+
+    def dictorsetmaker_7(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(8).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(8).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(8).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(8).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 8, token)
+        return None
+
+    def dictorsetmaker_8(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 9, token)
+        raise bad_input(grammar, stack.dfa, 8, token)
+
+    def dictorsetmaker_9(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(10).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(10).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(10).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(10).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 10, token)
+        raise bad_input(grammar, stack.dfa, 9, token)
+
+    def dictorsetmaker_10(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 7, token)
+        return None
+
+    def dotted_as_name_0(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = stack.switch_state(1).push(dfa_dotted_name, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 99:
+            # dotted_name
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def dotted_as_name_1(stack, grammar, token, label_index):
+        if label_index == 102:
+            # 'as'
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def dotted_as_name_2(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return pop_finished(stack.shift(grammar, 3, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def dotted_as_name_3(stack, grammar, token, label_index):
+        return None
+
+    def dotted_as_names_0(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = (stack.switch_state(1).push(dfa_dotted_as_name, 1)
+                .push(dfa_dotted_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 103:
+            # dotted_as_name
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def dotted_as_names_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def dotted_name_0(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def dotted_name_1(stack, grammar, token, label_index):
+        if label_index == 104:
+            # DOT
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def encoding_decl_0(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def encoding_decl_1(stack, grammar, token, label_index):
+        return None
+
+    def eval_input_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 72:
+            # testlist
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def eval_input_1(stack, grammar, token, label_index):
+        if label_index == 1 or label_index == 105:
+            # NEWLINE, ENDMARKER
+            if label_index == 1:
+                return stack.shift(grammar, 1, token)
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def eval_input_2(stack, grammar, token, label_index):
+        return None
+
+    def except_clause_0(stack, grammar, token, label_index):
+        if label_index == 106:
+            # 'except'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def except_clause_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def except_clause_2(stack, grammar, token, label_index):
+        if label_index == 47 or label_index == 102:
+            # COMMA, 'as'
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def except_clause_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def except_clause_4(stack, grammar, token, label_index):
+        return None
+
+    def exec_stmt_0(stack, grammar, token, label_index):
+        if label_index == 17:
+            # 'exec'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def exec_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 87:
+            # expr
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def exec_stmt_2(stack, grammar, token, label_index):
+        if label_index == 75:
+            # 'in'
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def exec_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def exec_stmt_4(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 5, token)
+        return None
+
+    def exec_stmt_5(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 6, token))
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def exec_stmt_6(stack, grammar, token, label_index):
+        return None
+
+    def expr_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_xor_expr, 1)
+                .push(dfa_and_expr, 1).push(dfa_shift_expr, 1)
+                .push(dfa_arith_expr, 1).push(dfa_term, 1).push(dfa_factor, 2)
+                .push(dfa_power, 1).push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_xor_expr, 1)
+                .push(dfa_and_expr, 1).push(dfa_shift_expr, 1)
+                .push(dfa_arith_expr, 1).push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 107:
+            # xor_expr
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def expr_1(stack, grammar, token, label_index):
+        if label_index == 108:
+            # VBAR
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def expr_stmt_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 72:
+            # testlist
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def expr_stmt_1(stack, grammar, token, label_index):
+        if label_index == 48 or label_index == 109:
+            # EQUAL, augassign
+            if label_index == 48:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 3, token)
+        if label_index in labels_1:
+            # PERCENTEQUAL, AMPEREQUAL, DOUBLESTAREQUAL, STAREQUAL, PLUSEQUAL, MINEQUAL, DOUBLESLASHEQUAL, SLASHEQUAL, LEFTSHIFTEQUAL, RIGHTSHIFTEQUAL, CIRCUMFLEXEQUAL, VBAREQUAL
+            stack = stack.switch_state(3).push(dfa_augassign, 0)
+            return pop_finished(stack.shift(grammar, 1, token))
+        return None
+
+    def expr_stmt_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = stack.switch_state(4).push(dfa_yield_expr, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 53 or label_index == 72:
+            # yield_expr, testlist
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def expr_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(5).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(5).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(5).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(5).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = stack.switch_state(5).push(dfa_yield_expr, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 53 or label_index == 72:
+            # yield_expr, testlist
+            return pop_finished(stack.shift(grammar, 5, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def expr_stmt_4(stack, grammar, token, label_index):
+        if label_index == 48:
+            # EQUAL
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def expr_stmt_5(stack, grammar, token, label_index):
+        return None
+
+    def exprlist_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 87:
+            # expr
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def exprlist_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def exprlist_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 87:
+            # expr
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def factor_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = stack.switch_state(2).push(dfa_power, 1).push(dfa_atom, 0)
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index in labels_5:
+            # PLUS, MINUS, TILDE, power
+            if label_index == 6 or label_index == 7 or label_index == 34:
+                return stack.shift(grammar, 1, token)
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def factor_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_factor, 2)
+                .push(dfa_power, 1).push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = stack.switch_state(2).push(dfa_factor, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 111:
+            # factor
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def factor_2(stack, grammar, token, label_index):
+        return None
+
+    def fakesuite_0(stack, grammar, token, label_index):
+        if label_index == 35:
+            # FAKESUITESTART
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def fakesuite_1(stack, grammar, token, label_index):
+        if label_index == 1 or label_index == 71:
+            # NEWLINE, COLON
+            if label_index == 1:
+                return stack.shift(grammar, 3, token)
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def fakesuite_2(stack, grammar, token, label_index):
+        if label_index == 1:
+            # NEWLINE
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def fakesuite_3(stack, grammar, token, label_index):
+        if label_index == 112:
+            # INDENT
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def fakesuite_4(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_decorated, 1)
+                .push(dfa_decorators, 1).push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 13:
+            # 'class'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_classdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 15:
+            # 'def'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_funcdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_for_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_if_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_try_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_while_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_with_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_fakesuite, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 113:
+            # stmt
+            return stack.shift(grammar, 5, token)
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def fakesuite_5(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_decorated, 1)
+                .push(dfa_decorators, 1).push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 13:
+            # 'class'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_classdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 15:
+            # 'def'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_funcdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_for_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_if_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_try_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_while_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_with_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = (stack.switch_state(5).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_fakesuite, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 113 or label_index == 114:
+            # stmt, DEDENT
+            if label_index == 113:
+                return stack.shift(grammar, 5, token)
+            return pop_finished(stack.shift(grammar, 6, token))
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def fakesuite_6(stack, grammar, token, label_index):
+        return None
+
+    def file_input_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1 or label_index == 105 or label_index == 113:
+            # NEWLINE, ENDMARKER, stmt
+            if label_index == 1 or label_index == 113:
+                return stack.shift(grammar, 0, token)
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_decorated, 1)
+                .push(dfa_decorators, 1).push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 13:
+            # 'class'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_classdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 15:
+            # 'def'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_funcdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_for_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_if_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_try_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_while_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_with_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = (stack.switch_state(0).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_fakesuite, 0))
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def file_input_1(stack, grammar, token, label_index):
+        return None
+
+    def flow_stmt_0(stack, grammar, token, label_index):
+        if label_index == 12:
+            # 'break'
+            stack = stack.switch_state(1).push(dfa_break_stmt, 0)
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = stack.switch_state(1).push(dfa_continue_stmt, 0)
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 27:
+            # 'raise'
+            stack = stack.switch_state(1).push(dfa_raise_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = stack.switch_state(1).push(dfa_return_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index in labels_6:
+            # break_stmt, continue_stmt, raise_stmt, return_stmt, yield_stmt
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def flow_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def for_stmt_0(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def for_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 74:
+            # exprlist
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def for_stmt_2(stack, grammar, token, label_index):
+        if label_index == 75:
+            # 'in'
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def for_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 72:
+            # testlist
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def for_stmt_4(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 5, token)
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def for_stmt_5(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(6).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(6).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def for_stmt_6(stack, grammar, token, label_index):
+        if label_index == 120:
+            # 'else'
+            return stack.shift(grammar, 7, token)
+        return None
+
+    def for_stmt_7(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 8, token)
+        raise bad_input(grammar, stack.dfa, 7, token)
+
+    def for_stmt_8(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(9).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return pop_finished(stack.shift(grammar, 9, token))
+        raise bad_input(grammar, stack.dfa, 8, token)
+
+    def for_stmt_9(stack, grammar, token, label_index):
+        return None
+
+    def fpdef_0(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def fpdef_1(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = (stack.switch_state(3).push(dfa_fplist, 1)
+                .push(dfa_fpdef, 0))
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 121:
+            # fplist
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def fpdef_2(stack, grammar, token, label_index):
+        return None
+
+    def fpdef_3(stack, grammar, token, label_index):
+        if label_index == 51:
+            # RPAR
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def fplist_0(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = stack.switch_state(1).push(dfa_fpdef, 0)
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 122:
+            # fpdef
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def fplist_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def fplist_2(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = stack.switch_state(1).push(dfa_fpdef, 0)
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 122:
+            # fpdef
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def funcdef_0(stack, grammar, token, label_index):
+        if label_index == 15:
+            # 'def'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def funcdef_1(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def funcdef_2(stack, grammar, token, label_index):
+        if label_index == 5:
+            # LPAR
+            stack = stack.switch_state(3).push(dfa_parameters, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 123:
+            # parameters
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def funcdef_3(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def funcdef_4(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(5).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(5).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return pop_finished(stack.shift(grammar, 5, token))
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def funcdef_5(stack, grammar, token, label_index):
+        return None
+
+    def global_stmt_0(stack, grammar, token, label_index):
+        if label_index == 20:
+            # 'global'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def global_stmt_1(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def global_stmt_2(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def if_stmt_0(stack, grammar, token, label_index):
+        if label_index == 21:
+            # 'if'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def if_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def if_stmt_2(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def if_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(4).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def if_stmt_4(stack, grammar, token, label_index):
+        if label_index == 120 or label_index == 124:
+            # 'else', 'elif'
+            if label_index == 120:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def if_stmt_5(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def if_stmt_6(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(7).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return pop_finished(stack.shift(grammar, 7, token))
+        raise bad_input(grammar, stack.dfa, 6, token)
+
+    def if_stmt_7(stack, grammar, token, label_index):
+        return None
+
+    def import_as_name_0(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def import_as_name_1(stack, grammar, token, label_index):
+        if label_index == 102:
+            # 'as'
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def import_as_name_2(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return pop_finished(stack.shift(grammar, 3, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def import_as_name_3(stack, grammar, token, label_index):
+        return None
+
+    def import_as_names_0(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = stack.switch_state(1).push(dfa_import_as_name, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 125:
+            # import_as_name
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def import_as_names_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def import_as_names_2(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = stack.switch_state(1).push(dfa_import_as_name, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 125:
+            # import_as_name
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def import_from_0(stack, grammar, token, label_index):
+        if label_index == 19:
+            # 'from'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def import_from_1(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = stack.switch_state(3).push(dfa_dotted_name, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 99 or label_index == 104:
+            # dotted_name, DOT
+            if label_index == 99:
+                return stack.shift(grammar, 3, token)
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def import_from_2(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = stack.switch_state(3).push(dfa_dotted_name, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 22 or label_index == 99 or label_index == 104:
+            # 'import', dotted_name, DOT
+            if label_index == 22:
+                return stack.shift(grammar, 4, token)
+            if label_index == 99:
+                return stack.shift(grammar, 3, token)
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def import_from_3(stack, grammar, token, label_index):
+        if label_index == 22:
+            # 'import'
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def import_from_4(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = (stack.switch_state(6).push(dfa_import_as_names, 1)
+                .push(dfa_import_as_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 5 or label_index == 43 or label_index == 126:
+            # LPAR, STAR, import_as_names
+            if label_index == 5:
+                return stack.shift(grammar, 5, token)
+            return pop_finished(stack.shift(grammar, 6, token))
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def import_from_5(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = (stack.switch_state(7).push(dfa_import_as_names, 1)
+                .push(dfa_import_as_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 126:
+            # import_as_names
+            return stack.shift(grammar, 7, token)
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def import_from_6(stack, grammar, token, label_index):
+        return None
+
+    def import_from_7(stack, grammar, token, label_index):
+        if label_index == 51:
+            # RPAR
+            return pop_finished(stack.shift(grammar, 6, token))
+        raise bad_input(grammar, stack.dfa, 7, token)
+
+    def import_name_0(stack, grammar, token, label_index):
+        if label_index == 22:
+            # 'import'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def import_name_1(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            stack = (stack.switch_state(2).push(dfa_dotted_as_names, 1)
+                .push(dfa_dotted_as_name, 1).push(dfa_dotted_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 127:
+            # dotted_as_names
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def import_name_2(stack, grammar, token, label_index):
+        return None
+
+    def import_stmt_0(stack, grammar, token, label_index):
+        if label_index == 19:
+            # 'from'
+            stack = stack.switch_state(1).push(dfa_import_from, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = stack.switch_state(1).push(dfa_import_name, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 128 or label_index == 129:
+            # import_from, import_name
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def import_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def lambdef_0(stack, grammar, token, label_index):
+        if label_index == 23:
+            # 'lambda'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def lambdef_1(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = (stack.switch_state(3).push(dfa_varargslist, 3)
+                .push(dfa_fpdef, 0))
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44:
+            # STAR, DOUBLESTAR
+            stack = stack.switch_state(3).push(dfa_varargslist, 0)
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            return stack.shift(grammar, 2, token)
+        if label_index == 71 or label_index == 130:
+            # COLON, varargslist
+            if label_index == 71:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def lambdef_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def lambdef_3(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def lambdef_4(stack, grammar, token, label_index):
+        return None
+
+    def list_for_0(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def list_for_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_exprlist, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 74:
+            # exprlist
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def list_for_2(stack, grammar, token, label_index):
+        if label_index == 75:
+            # 'in'
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def list_for_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_testlist_safe, 1)
+                .push(dfa_old_test, 1).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_testlist_safe, 1)
+                .push(dfa_old_test, 1).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_testlist_safe, 1)
+                .push(dfa_old_test, 1).push(dfa_old_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_testlist_safe, 1)
+                .push(dfa_old_test, 1).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 131:
+            # testlist_safe
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def list_for_4(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(5).push(dfa_list_iter, 1)
+                .push(dfa_list_for, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(5).push(dfa_list_iter, 1)
+                .push(dfa_list_if, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 132:
+            # list_iter
+            return pop_finished(stack.shift(grammar, 5, token))
+        return None
+
+    def list_for_5(stack, grammar, token, label_index):
+        return None
+
+    def list_if_0(stack, grammar, token, label_index):
+        if label_index == 21:
+            # 'if'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def list_if_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_old_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 78:
+            # old_test
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def list_if_2(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(3).push(dfa_list_iter, 1)
+                .push(dfa_list_for, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(3).push(dfa_list_iter, 1)
+                .push(dfa_list_if, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 132:
+            # list_iter
+            return pop_finished(stack.shift(grammar, 3, token))
+        return None
+
+    def list_if_3(stack, grammar, token, label_index):
+        return None
+
+    def list_iter_0(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(1).push(dfa_list_for, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = stack.switch_state(1).push(dfa_list_if, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 133 or label_index == 134:
+            # list_for, list_if
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def list_iter_1(stack, grammar, token, label_index):
+        return None
+
+    def listmaker_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def listmaker_1(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(3).push(dfa_list_for, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 47 or label_index == 133:
+            # COMMA, list_for
+            if label_index == 47:
+                return stack.shift(grammar, 2, token)
+            return pop_finished(stack.shift(grammar, 3, token))
+        return None
+
+    def listmaker_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 4, token)
+        return None
+
+    def listmaker_3(stack, grammar, token, label_index):
+        return None
+
+    def listmaker_4(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def not_test_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24 or label_index == 135:
+            # 'not', comparison
+            if label_index == 24:
+                return stack.shift(grammar, 1, token)
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def not_test_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = stack.switch_state(2).push(dfa_not_test, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 41:
+            # not_test
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def not_test_2(stack, grammar, token, label_index):
+        return None
+
+    def old_lambdef_0(stack, grammar, token, label_index):
+        if label_index == 23:
+            # 'lambda'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def old_lambdef_1(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = (stack.switch_state(3).push(dfa_varargslist, 3)
+                .push(dfa_fpdef, 0))
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44:
+            # STAR, DOUBLESTAR
+            stack = stack.switch_state(3).push(dfa_varargslist, 0)
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            return stack.shift(grammar, 2, token)
+        if label_index == 71 or label_index == 130:
+            # COLON, varargslist
+            if label_index == 71:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def old_lambdef_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_old_test, 1)
+                .push(dfa_old_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 78:
+            # old_test
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def old_lambdef_3(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def old_lambdef_4(stack, grammar, token, label_index):
+        return None
+
+    def old_test_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = stack.switch_state(1).push(dfa_old_lambdef, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 76 or label_index == 136:
+            # or_test, old_lambdef
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def old_test_1(stack, grammar, token, label_index):
+        return None
+
+    def or_test_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 137:
+            # and_test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def or_test_1(stack, grammar, token, label_index):
+        if label_index == 138:
+            # 'or'
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def parameters_0(stack, grammar, token, label_index):
+        if label_index == 5:
+            # LPAR
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def parameters_1(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = (stack.switch_state(3).push(dfa_varargslist, 3)
+                .push(dfa_fpdef, 0))
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44:
+            # STAR, DOUBLESTAR
+            stack = stack.switch_state(3).push(dfa_varargslist, 0)
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            return stack.shift(grammar, 2, token)
+        if label_index == 51 or label_index == 130:
+            # RPAR, varargslist
+            if label_index == 51:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def parameters_2(stack, grammar, token, label_index):
+        return None
+
+    def parameters_3(stack, grammar, token, label_index):
+        if label_index == 51:
+            # RPAR
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def pass_stmt_0(stack, grammar, token, label_index):
+        if label_index == 25:
+            # 'pass'
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def pass_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def power_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = stack.switch_state(1).push(dfa_atom, 0)
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 139:
+            # atom
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def power_1(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 9 or label_index == 104:
+            # LPAR, LSQB, DOT
+            stack = stack.switch_state(1).push(dfa_trailer, 0)
+            if label_index == 5:
+                return stack.shift(grammar, 1, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            return stack.shift(grammar, 2, token)
+        if label_index == 44 or label_index == 140:
+            # DOUBLESTAR, trailer
+            if label_index == 44:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def power_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_factor, 2)
+                .push(dfa_power, 1).push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = stack.switch_state(3).push(dfa_factor, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 111:
+            # factor
+            return pop_finished(stack.shift(grammar, 3, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def power_3(stack, grammar, token, label_index):
+        return None
+
+    def print_stmt_0(stack, grammar, token, label_index):
+        if label_index == 26:
+            # 'print'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def print_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46 or label_index == 141:
+            # test, RIGHTSHIFT
+            if label_index == 46:
+                return stack.shift(grammar, 3, token)
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def print_stmt_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def print_stmt_3(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 5, token)
+        return None
+
+    def print_stmt_4(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 6, token)
+        return None
+
+    def print_stmt_5(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def print_stmt_6(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(7).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(7).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(7).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(7).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 7, token)
+        raise bad_input(grammar, stack.dfa, 6, token)
+
+    def print_stmt_7(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 8, token)
+        return None
+
+    def print_stmt_8(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(7).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(7).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(7).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(7).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 7, token)
+        return None
+
+    def raise_stmt_0(stack, grammar, token, label_index):
+        if label_index == 27:
+            # 'raise'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def raise_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def raise_stmt_2(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def raise_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def raise_stmt_4(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 5, token)
+        return None
+
+    def raise_stmt_5(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 6, token))
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def raise_stmt_6(stack, grammar, token, label_index):
+        return None
+
+    def realorfakesuite_0(stack, grammar, token, label_index):
+        if label_index == 112 or label_index == 142:
+            # INDENT, FAKESUITE
+            if label_index == 112:
+                return stack.shift(grammar, 2, token)
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def realorfakesuite_1(stack, grammar, token, label_index):
+        return None
+
+    def realorfakesuite_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_decorated, 1)
+                .push(dfa_decorators, 1).push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 13:
+            # 'class'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_classdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 15:
+            # 'def'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_funcdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_for_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_if_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_try_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_while_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_with_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_fakesuite, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 113:
+            # stmt
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def realorfakesuite_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_decorated, 1)
+                .push(dfa_decorators, 1).push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 13:
+            # 'class'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_classdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 15:
+            # 'def'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_funcdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_for_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_if_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_try_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_while_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_with_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = (stack.switch_state(3).push(dfa_stmt, 1)
+                .push(dfa_compound_stmt, 1).push(dfa_fakesuite, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 113 or label_index == 114:
+            # stmt, DEDENT
+            if label_index == 113:
+                return stack.shift(grammar, 3, token)
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def return_stmt_0(stack, grammar, token, label_index):
+        if label_index == 28:
+            # 'return'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def return_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 72:
+            # testlist
+            return pop_finished(stack.shift(grammar, 2, token))
+        return None
+
+    def return_stmt_2(stack, grammar, token, label_index):
+        return None
+
+    def shift_expr_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 143:
+            # arith_expr
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def shift_expr_1(stack, grammar, token, label_index):
+        if label_index == 141 or label_index == 144:
+            # RIGHTSHIFT, LEFTSHIFT
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def simple_stmt_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 145:
+            # small_stmt
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def simple_stmt_1(stack, grammar, token, label_index):
+        if label_index == 1 or label_index == 146:
+            # NEWLINE, SEMI
+            if label_index == 1:
+                return pop_finished(stack.shift(grammar, 3, token))
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def simple_stmt_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1 or label_index == 145:
+            # NEWLINE, small_stmt
+            if label_index == 1:
+                return pop_finished(stack.shift(grammar, 3, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def simple_stmt_3(stack, grammar, token, label_index):
+        return None
+
+    def sliceop_0(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def sliceop_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 2, token))
+        return None
+
+    def sliceop_2(stack, grammar, token, label_index):
+        return None
+
+    def small_stmt_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = stack.switch_state(1).push(dfa_assert_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(1).push(dfa_flow_stmt, 1)
+                .push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(1).push(dfa_flow_stmt, 1)
+                .push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = stack.switch_state(1).push(dfa_del_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = stack.switch_state(1).push(dfa_exec_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(1).push(dfa_import_stmt, 1)
+                .push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = stack.switch_state(1).push(dfa_global_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(1).push(dfa_import_stmt, 1)
+                .push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = stack.switch_state(1).push(dfa_pass_stmt, 0)
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = stack.switch_state(1).push(dfa_print_stmt, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(1).push(dfa_flow_stmt, 1)
+                .push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(1).push(dfa_flow_stmt, 1)
+                .push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(1).push(dfa_flow_stmt, 1)
+                .push(dfa_yield_stmt, 1).push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index in labels_7:
+            # assert_stmt, del_stmt, exec_stmt, expr_stmt, flow_stmt, global_stmt, import_stmt, pass_stmt, print_stmt
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def small_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def stmt_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 8:
+            # AT
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_decorated, 1).push(dfa_decorators, 1)
+                .push(dfa_decorator, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 13:
+            # 'class'
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_classdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 15:
+            # 'def'
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_funcdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 18:
+            # 'for'
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_for_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_import_stmt, 1)
+                .push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 21:
+            # 'if'
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_if_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_import_stmt, 1)
+                .push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 29:
+            # 'try'
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_try_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 30:
+            # 'while'
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_while_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 31:
+            # 'with'
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_with_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(1).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_yield_stmt, 1).push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 35:
+            # FAKESUITESTART
+            stack = (stack.switch_state(1).push(dfa_compound_stmt, 1)
+                .push(dfa_fakesuite, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 2 or label_index == 3:
+            # compound_stmt, simple_stmt
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def stmt_1(stack, grammar, token, label_index):
+        return None
+
+    def subscript_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46 or label_index == 71 or label_index == 104:
+            # test, COLON, DOT
+            if label_index == 46:
+                return stack.shift(grammar, 3, token)
+            if label_index == 71:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def subscript_1(stack, grammar, token, label_index):
+        if label_index == 104:
+            # DOT
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def subscript_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 71:
+            # COLON
+            stack = stack.switch_state(5).push(dfa_sliceop, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 46 or label_index == 156:
+            # test, sliceop
+            if label_index == 46:
+                return stack.shift(grammar, 6, token)
+            return pop_finished(stack.shift(grammar, 5, token))
+        return None
+
+    def subscript_3(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def subscript_4(stack, grammar, token, label_index):
+        if label_index == 104:
+            # DOT
+            return pop_finished(stack.shift(grammar, 5, token))
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def subscript_5(stack, grammar, token, label_index):
+        return None
+
+    def subscript_6(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            stack = stack.switch_state(5).push(dfa_sliceop, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 156:
+            # sliceop
+            return pop_finished(stack.shift(grammar, 5, token))
+        return None
+
+    def subscriptlist_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 71 or label_index == 104:
+            # COLON, DOT
+            stack = stack.switch_state(1).push(dfa_subscript, 0)
+            if label_index == 71:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 1, token)
+        if label_index == 157:
+            # subscript
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def subscriptlist_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def subscriptlist_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_subscript, 3)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 71 or label_index == 104:
+            # COLON, DOT
+            stack = stack.switch_state(1).push(dfa_subscript, 0)
+            if label_index == 71:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 1, token)
+        if label_index == 157:
+            # subscript
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def suite_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1 or label_index == 3:
+            # NEWLINE, simple_stmt
+            if label_index == 1:
+                return stack.shift(grammar, 1, token)
+            return pop_finished(stack.shift(grammar, 2, token))
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_import_stmt, 1)
+                .push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_import_stmt, 1)
+                .push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_expr_stmt, 1)
+                .push(dfa_testlist, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(2).push(dfa_simple_stmt, 1)
+                .push(dfa_small_stmt, 1).push(dfa_flow_stmt, 1)
+                .push(dfa_yield_stmt, 1).push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def suite_1(stack, grammar, token, label_index):
+        if label_index == 112 or label_index == 142:
+            # INDENT, FAKESUITE
+            stack = stack.switch_state(2).push(dfa_realorfakesuite, 0)
+            if label_index == 112:
+                return stack.shift(grammar, 2, token)
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 158:
+            # realorfakesuite
+            return pop_finished(stack.shift(grammar, 2, token))
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def suite_2(stack, grammar, token, label_index):
+        return None
+
+    def term_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_factor, 2)
+                .push(dfa_power, 1).push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = stack.switch_state(1).push(dfa_factor, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 111:
+            # factor
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def term_1(stack, grammar, token, label_index):
+        if label_index in labels_8:
+            # STAR, PERCENT, SLASH, DOUBLESLASH
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def test_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = stack.switch_state(1).push(dfa_lambdef, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 76 or label_index == 162:
+            # or_test, lambdef
+            if label_index == 76:
+                return stack.shift(grammar, 2, token)
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def test_1(stack, grammar, token, label_index):
+        return None
+
+    def test_2(stack, grammar, token, label_index):
+        if label_index == 21:
+            # 'if'
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def test_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 76:
+            # or_test
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def test_4(stack, grammar, token, label_index):
+        if label_index == 120:
+            # 'else'
+            return stack.shift(grammar, 5, token)
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def test_5(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def testlist_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def testlist_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def testlist_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        return None
+
+    def testlist1_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def testlist1_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def testlist_comp_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def testlist_comp_1(stack, grammar, token, label_index):
+        if label_index == 18:
+            # 'for'
+            stack = stack.switch_state(3).push(dfa_comp_for, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 47 or label_index == 49:
+            # COMMA, comp_for
+            if label_index == 47:
+                return stack.shift(grammar, 2, token)
+            return pop_finished(stack.shift(grammar, 3, token))
+        return None
+
+    def testlist_comp_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 4, token)
+        return None
+
+    def testlist_comp_3(stack, grammar, token, label_index):
+        return None
+
+    def testlist_comp_4(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def testlist_safe_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_old_test, 1)
+                .push(dfa_old_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 78:
+            # old_test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def testlist_safe_1(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def testlist_safe_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_old_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 78:
+            # old_test
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def testlist_safe_3(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 4, token)
+        return None
+
+    def testlist_safe_4(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_old_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_old_test, 1)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 78:
+            # old_test
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def trailer_0(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 9 or label_index == 104:
+            # LPAR, LSQB, DOT
+            if label_index == 5:
+                return stack.shift(grammar, 1, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def trailer_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(5).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(5).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(5).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(5).push(dfa_arglist, 3)
+                .push(dfa_argument, 1).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44:
+            # STAR, DOUBLESTAR
+            stack = stack.switch_state(5).push(dfa_arglist, 0)
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            return stack.shift(grammar, 2, token)
+        if label_index == 51 or label_index == 100:
+            # RPAR, arglist
+            if label_index == 51:
+                return pop_finished(stack.shift(grammar, 4, token))
+            return stack.shift(grammar, 5, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def trailer_2(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def trailer_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(6).push(dfa_subscriptlist, 1)
+                .push(dfa_subscript, 3).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(6).push(dfa_subscriptlist, 1)
+                .push(dfa_subscript, 3).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 2)
+                .push(dfa_comparison, 1).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(6).push(dfa_subscriptlist, 1)
+                .push(dfa_subscript, 3).push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(6).push(dfa_subscriptlist, 1)
+                .push(dfa_subscript, 3).push(dfa_test, 2).push(dfa_or_test, 1)
+                .push(dfa_and_test, 1).push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 71 or label_index == 104:
+            # COLON, DOT
+            stack = (stack.switch_state(6).push(dfa_subscriptlist, 1)
+                .push(dfa_subscript, 0))
+            if label_index == 71:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 1, token)
+        if label_index == 163:
+            # subscriptlist
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def trailer_4(stack, grammar, token, label_index):
+        return None
+
+    def trailer_5(stack, grammar, token, label_index):
+        if label_index == 51:
+            # RPAR
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def trailer_6(stack, grammar, token, label_index):
+        if label_index == 54:
+            # RSQB
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 6, token)
+
+    def try_stmt_0(stack, grammar, token, label_index):
+        if label_index == 29:
+            # 'try'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def try_stmt_1(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def try_stmt_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(3).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(3).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def try_stmt_3(stack, grammar, token, label_index):
+        if label_index == 106:
+            # 'except'
+            stack = stack.switch_state(5).push(dfa_except_clause, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 164 or label_index == 165:
+            # 'finally', except_clause
+            if label_index == 164:
+                return stack.shift(grammar, 4, token)
+            return stack.shift(grammar, 5, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def try_stmt_4(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 4, token)
+
+    def try_stmt_5(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 7, token)
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def try_stmt_6(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(8).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(8).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return pop_finished(stack.shift(grammar, 8, token))
+        raise bad_input(grammar, stack.dfa, 6, token)
+
+    def try_stmt_7(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(9).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(9).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return stack.shift(grammar, 9, token)
+        raise bad_input(grammar, stack.dfa, 7, token)
+
+    def try_stmt_8(stack, grammar, token, label_index):
+        return None
+
+    def try_stmt_9(stack, grammar, token, label_index):
+        if label_index == 106:
+            # 'except'
+            stack = stack.switch_state(5).push(dfa_except_clause, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 120 or label_index == 164 or label_index == 165:
+            # 'else', 'finally', except_clause
+            if label_index == 120:
+                return stack.shift(grammar, 10, token)
+            if label_index == 164:
+                return stack.shift(grammar, 4, token)
+            return stack.shift(grammar, 5, token)
+        return None
+
+    def try_stmt_10(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 11, token)
+        raise bad_input(grammar, stack.dfa, 10, token)
+
+    def try_stmt_11(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(12).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(12).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return stack.shift(grammar, 12, token)
+        raise bad_input(grammar, stack.dfa, 11, token)
+
+    def try_stmt_12(stack, grammar, token, label_index):
+        if label_index == 164:
+            # 'finally'
+            return stack.shift(grammar, 4, token)
+        return None
+
+    def varargslist_0(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = stack.switch_state(3).push(dfa_fpdef, 0)
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44 or label_index == 122:
+            # STAR, DOUBLESTAR, fpdef
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            if label_index == 44:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def varargslist_1(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def varargslist_2(stack, grammar, token, label_index):
+        if label_index == 36:
+            # NAME
+            return pop_finished(stack.shift(grammar, 5, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def varargslist_3(stack, grammar, token, label_index):
+        if label_index == 47 or label_index == 48:
+            # COMMA, EQUAL
+            if label_index == 47:
+                return stack.shift(grammar, 6, token)
+            return stack.shift(grammar, 7, token)
+        return None
+
+    def varargslist_4(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 8, token)
+        return None
+
+    def varargslist_5(stack, grammar, token, label_index):
+        return None
+
+    def varargslist_6(stack, grammar, token, label_index):
+        if label_index == 5 or label_index == 36:
+            # LPAR, NAME
+            stack = stack.switch_state(3).push(dfa_fpdef, 0)
+            if label_index == 36:
+                return pop_finished(stack.shift(grammar, 2, token))
+            return stack.shift(grammar, 1, token)
+        if label_index == 43 or label_index == 44 or label_index == 122:
+            # STAR, DOUBLESTAR, fpdef
+            if label_index == 43:
+                return stack.shift(grammar, 1, token)
+            if label_index == 44:
+                return stack.shift(grammar, 2, token)
+            return stack.shift(grammar, 3, token)
+        return None
+
+    def varargslist_7(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(9).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(9).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(9).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(9).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 9, token)
+        raise bad_input(grammar, stack.dfa, 7, token)
+
+    def varargslist_8(stack, grammar, token, label_index):
+        if label_index == 44:
+            # DOUBLESTAR
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 8, token)
+
+    def varargslist_9(stack, grammar, token, label_index):
+        if label_index == 47:
+            # COMMA
+            return stack.shift(grammar, 6, token)
+        return None
+
+    def while_stmt_0(stack, grammar, token, label_index):
+        if label_index == 30:
+            # 'while'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def while_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def while_stmt_2(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def while_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(4).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return stack.shift(grammar, 4, token)
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def while_stmt_4(stack, grammar, token, label_index):
+        if label_index == 120:
+            # 'else'
+            return stack.shift(grammar, 5, token)
+        return None
+
+    def while_stmt_5(stack, grammar, token, label_index):
+        if label_index == 71:
+            # COLON
+            return stack.shift(grammar, 6, token)
+        raise bad_input(grammar, stack.dfa, 5, token)
+
+    def while_stmt_6(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(7).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(7).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return pop_finished(stack.shift(grammar, 7, token))
+        raise bad_input(grammar, stack.dfa, 6, token)
+
+    def while_stmt_7(stack, grammar, token, label_index):
+        return None
+
+    def with_item_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(1).push(dfa_test, 1)
+                .push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(1).push(dfa_test, 2)
+                .push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 46:
+            # test
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def with_item_1(stack, grammar, token, label_index):
+        if label_index == 102:
+            # 'as'
+            return stack.shift(grammar, 2, token)
+        return None
+
+    def with_item_2(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(3).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(3).push(dfa_expr, 1)
+                .push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 87:
+            # expr
+            return pop_finished(stack.shift(grammar, 3, token))
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def with_item_3(stack, grammar, token, label_index):
+        return None
+
+    def with_stmt_0(stack, grammar, token, label_index):
+        if label_index == 31:
+            # 'with'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def with_stmt_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_with_item, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_with_item, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_with_item, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_with_item, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 166:
+            # with_item
+            return stack.shift(grammar, 2, token)
+        raise bad_input(grammar, stack.dfa, 1, token)
+
+    def with_stmt_2(stack, grammar, token, label_index):
+        if label_index == 47 or label_index == 71:
+            # COMMA, COLON
+            if label_index == 47:
+                return stack.shift(grammar, 1, token)
+            return stack.shift(grammar, 3, token)
+        raise bad_input(grammar, stack.dfa, 2, token)
+
+    def with_stmt_3(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 1:
+            # NEWLINE
+            stack = stack.switch_state(4).push(dfa_suite, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 11:
+            # 'assert'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_assert_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 12:
+            # 'break'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_break_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 14:
+            # 'continue'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_continue_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 16:
+            # 'del'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_del_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 17:
+            # 'exec'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_exec_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 19:
+            # 'from'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_from, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 20:
+            # 'global'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_global_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 22:
+            # 'import'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_import_stmt, 1).push(dfa_import_name, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_expr_stmt, 1).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 25:
+            # 'pass'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_pass_stmt, 0))
+            return pop_finished(stack.shift(grammar, 1, token))
+        if label_index == 26:
+            # 'print'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_print_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 27:
+            # 'raise'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_raise_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 28:
+            # 'return'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_return_stmt, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 32:
+            # 'yield'
+            stack = (stack.switch_state(4).push(dfa_suite, 2)
+                .push(dfa_simple_stmt, 1).push(dfa_small_stmt, 1)
+                .push(dfa_flow_stmt, 1).push(dfa_yield_stmt, 1)
+                .push(dfa_yield_expr, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 73:
+            # suite
+            return pop_finished(stack.shift(grammar, 4, token))
+        raise bad_input(grammar, stack.dfa, 3, token)
+
+    def with_stmt_4(stack, grammar, token, label_index):
+        return None
+
+    def xor_expr_0(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 167:
+            # and_expr
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def xor_expr_1(stack, grammar, token, label_index):
+        if label_index == 168:
+            # CIRCUMFLEX
+            return stack.shift(grammar, 0, token)
+        return None
+
+    def yield_expr_0(stack, grammar, token, label_index):
+        if label_index == 32:
+            # 'yield'
+            return stack.shift(grammar, 1, token)
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def yield_expr_1(stack, grammar, token, label_index):
+        if label_index in labels_0:
+            # REVDBMETAVAR, LPAR, LSQB, BACKQUOTE, LBRACE, NAME, NUMBER, STRING
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 2).push(dfa_power, 1)
+                .push(dfa_atom, 0))
+            if label_index == 4 or label_index == 36 or label_index == 37:
+                return pop_finished(stack.shift(grammar, 1, token))
+            if label_index == 5:
+                return stack.shift(grammar, 2, token)
+            if label_index == 9:
+                return stack.shift(grammar, 3, token)
+            if label_index == 10:
+                return stack.shift(grammar, 4, token)
+            if label_index == 33:
+                return stack.shift(grammar, 5, token)
+            return stack.shift(grammar, 6, token)
+        if label_index == 6 or label_index == 7 or label_index == 34:
+            # PLUS, MINUS, TILDE
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 2).push(dfa_comparison, 1)
+                .push(dfa_expr, 1).push(dfa_xor_expr, 1).push(dfa_and_expr, 1)
+                .push(dfa_shift_expr, 1).push(dfa_arith_expr, 1)
+                .push(dfa_term, 1).push(dfa_factor, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 23:
+            # 'lambda'
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 1).push(dfa_lambdef, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 24:
+            # 'not'
+            stack = (stack.switch_state(2).push(dfa_testlist, 1)
+                .push(dfa_test, 2).push(dfa_or_test, 1).push(dfa_and_test, 1)
+                .push(dfa_not_test, 0))
+            return stack.shift(grammar, 1, token)
+        if label_index == 72:
+            # testlist
+            return pop_finished(stack.shift(grammar, 2, token))
+        return None
+
+    def yield_expr_2(stack, grammar, token, label_index):
+        return None
+
+    def yield_stmt_0(stack, grammar, token, label_index):
+        if label_index == 32:
+            # 'yield'
+            stack = stack.switch_state(1).push(dfa_yield_expr, 0)
+            return stack.shift(grammar, 1, token)
+        if label_index == 53:
+            # yield_expr
+            return pop_finished(stack.shift(grammar, 1, token))
+        raise bad_input(grammar, stack.dfa, 0, token)
+
+    def yield_stmt_1(stack, grammar, token, label_index):
+        return None
+
+    states = [
+        [single_input_0, single_input_1, single_input_2],
+        [and_expr_0, and_expr_1],
+        [and_test_0, and_test_1],
+        [arglist_0, arglist_1, arglist_2, arglist_3, arglist_4, arglist_5, arglist_6, arglist_7],
+        [argument_0, argument_1, argument_2, argument_3],
+        [arith_expr_0, arith_expr_1],
+        [assert_stmt_0, assert_stmt_1, assert_stmt_2, assert_stmt_3, assert_stmt_4],
+        [atom_0, atom_1, atom_2, atom_3, atom_4, atom_5, atom_6, atom_7, atom_8, atom_9, atom_10],
+        [augassign_0, augassign_1],
+        [break_stmt_0, break_stmt_1],
+        [classdef_0, classdef_1, classdef_2, classdef_3, classdef_4, classdef_5, classdef_6, classdef_7],
+        [comp_for_0, comp_for_1, comp_for_2, comp_for_3, comp_for_4, comp_for_5],
+        [comp_if_0, comp_if_1, comp_if_2, comp_if_3],
+        [comp_iter_0, comp_iter_1],
+        [comp_op_0, comp_op_1, comp_op_2, comp_op_3],
+        [comparison_0, comparison_1],
+        [compound_stmt_0, compound_stmt_1],
+        [continue_stmt_0, continue_stmt_1],
+        [decorated_0, decorated_1, decorated_2],
+        [decorator_0, decorator_1, decorator_2, decorator_3, decorator_4, decorator_5, decorator_6],
+        [decorators_0, decorators_1],
+        [del_stmt_0, del_stmt_1, del_stmt_2],
+        [dictmaker_0, dictmaker_1, dictmaker_2, dictmaker_3, dictmaker_4],
+        [dictorsetmaker_0, dictorsetmaker_1, dictorsetmaker_2, dictorsetmaker_3, dictorsetmaker_4, dictorsetmaker_5, dictorsetmaker_6, dictorsetmaker_7, dictorsetmaker_8, dictorsetmaker_9, dictorsetmaker_10],
+        [dotted_as_name_0, dotted_as_name_1, dotted_as_name_2, dotted_as_name_3],
+        [dotted_as_names_0, dotted_as_names_1],
+        [dotted_name_0, dotted_name_1],
+        [encoding_decl_0, encoding_decl_1],
+        [eval_input_0, eval_input_1, eval_input_2],
+        [except_clause_0, except_clause_1, except_clause_2, except_clause_3, except_clause_4],
+        [exec_stmt_0, exec_stmt_1, exec_stmt_2, exec_stmt_3, exec_stmt_4, exec_stmt_5, exec_stmt_6],
+        [expr_0, expr_1],
+        [expr_stmt_0, expr_stmt_1, expr_stmt_2, expr_stmt_3, expr_stmt_4, expr_stmt_5],
+        [exprlist_0, exprlist_1, exprlist_2],
+        [factor_0, factor_1, factor_2],
+        [fakesuite_0, fakesuite_1, fakesuite_2, fakesuite_3, fakesuite_4, fakesuite_5, fakesuite_6],
+        [file_input_0, file_input_1],
+        [flow_stmt_0, flow_stmt_1],
+        [for_stmt_0, for_stmt_1, for_stmt_2, for_stmt_3, for_stmt_4, for_stmt_5, for_stmt_6, for_stmt_7, for_stmt_8, for_stmt_9],
+        [fpdef_0, fpdef_1, fpdef_2, fpdef_3],
+        [fplist_0, fplist_1, fplist_2],
+        [funcdef_0, funcdef_1, funcdef_2, funcdef_3, funcdef_4, funcdef_5],
+        [global_stmt_0, global_stmt_1, global_stmt_2],
+        [if_stmt_0, if_stmt_1, if_stmt_2, if_stmt_3, if_stmt_4, if_stmt_5, if_stmt_6, if_stmt_7],
+        [import_as_name_0, import_as_name_1, import_as_name_2, import_as_name_3],
+        [import_as_names_0, import_as_names_1, import_as_names_2],
+        [import_from_0, import_from_1, import_from_2, import_from_3, import_from_4, import_from_5, import_from_6, import_from_7],
+        [import_name_0, import_name_1, import_name_2],
+        [import_stmt_0, import_stmt_1],
+        [lambdef_0, lambdef_1, lambdef_2, lambdef_3, lambdef_4],
+        [list_for_0, list_for_1, list_for_2, list_for_3, list_for_4, list_for_5],
+        [list_if_0, list_if_1, list_if_2, list_if_3],
+        [list_iter_0, list_iter_1],
+        [listmaker_0, listmaker_1, listmaker_2, listmaker_3, listmaker_4],
+        [not_test_0, not_test_1, not_test_2],
+        [old_lambdef_0, old_lambdef_1, old_lambdef_2, old_lambdef_3, old_lambdef_4],
+        [old_test_0, old_test_1],
+        [or_test_0, or_test_1],
+        [parameters_0, parameters_1, parameters_2, parameters_3],
+        [pass_stmt_0, pass_stmt_1],
+        [power_0, power_1, power_2, power_3],
+        [print_stmt_0, print_stmt_1, print_stmt_2, print_stmt_3, print_stmt_4, print_stmt_5, print_stmt_6, print_stmt_7, print_stmt_8],
+        [raise_stmt_0, raise_stmt_1, raise_stmt_2, raise_stmt_3, raise_stmt_4, raise_stmt_5, raise_stmt_6],
+        [realorfakesuite_0, realorfakesuite_1, realorfakesuite_2, realorfakesuite_3],
+        [return_stmt_0, return_stmt_1, return_stmt_2],
+        [shift_expr_0, shift_expr_1],
+        [simple_stmt_0, simple_stmt_1, simple_stmt_2, simple_stmt_3],
+        [sliceop_0, sliceop_1, sliceop_2],
+        [small_stmt_0, small_stmt_1],
+        [stmt_0, stmt_1],
+        [subscript_0, subscript_1, subscript_2, subscript_3, subscript_4, subscript_5, subscript_6],
+        [subscriptlist_0, subscriptlist_1, subscriptlist_2],
+        [suite_0, suite_1, suite_2],
+        [term_0, term_1],
+        [test_0, test_1, test_2, test_3, test_4, test_5],
+        [testlist_0, testlist_1, testlist_2],
+        [testlist1_0, testlist1_1],
+        [testlist_comp_0, testlist_comp_1, testlist_comp_2, testlist_comp_3, testlist_comp_4],
+        [testlist_safe_0, testlist_safe_1, testlist_safe_2, testlist_safe_3, testlist_safe_4],
+        [trailer_0, trailer_1, trailer_2, trailer_3, trailer_4, trailer_5, trailer_6],
+        [try_stmt_0, try_stmt_1, try_stmt_2, try_stmt_3, try_stmt_4, try_stmt_5, try_stmt_6, try_stmt_7, try_stmt_8, try_stmt_9, try_stmt_10, try_stmt_11, try_stmt_12],
+        [varargslist_0, varargslist_1, varargslist_2, varargslist_3, varargslist_4, varargslist_5, varargslist_6, varargslist_7, varargslist_8, varargslist_9],
+        [while_stmt_0, while_stmt_1, while_stmt_2, while_stmt_3, while_stmt_4, while_stmt_5, while_stmt_6, while_stmt_7],
+        [with_item_0, with_item_1, with_item_2, with_item_3],
+        [with_stmt_0, with_stmt_1, with_stmt_2, with_stmt_3, with_stmt_4],
+        [xor_expr_0, xor_expr_1],
+        [yield_expr_0, yield_expr_1, yield_expr_2],
+        [yield_stmt_0, yield_stmt_1],
+    ]
+
+    def add_token(stack, grammar, token, label_index):
+        while True:
+            result = states[stack.dfa.symbol_id - 256][stack.state](
+                stack, grammar, token, label_index)
+            if result is not None:
+                return result
+            stack = pop(stack, token)
+
+    return add_token
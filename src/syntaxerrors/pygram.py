@@ -1,7 +1,7 @@
 import os
-import io
 from syntaxerrors import parser, pytoken
 from syntaxerrors.pytoken import tokens
+from syntaxerrors.tokenlabels import TokenLabels
 
 
 class PythonGrammar(parser.Grammar):
@@ -25,15 +25,12 @@ class PythonGrammar(parser.Grammar):
 
 
 def _get_python_grammar():
-    from syntaxerrors import metaparser
+    from syntaxerrors import grammarcache, genparser
     here = os.path.dirname(__file__)
-    fp = io.open(os.path.join(here, "data", "Grammar2.7"), "rb")
-    try:
-        gram_source = fp.read()
-    finally:
-        fp.close()
-    pgen = metaparser.ParserGenerator(gram_source)
-    return pgen.build_grammar(PythonGrammar)
+    path = os.path.join(here, "data", "Grammar2.7")
+    grammar = grammarcache.load_grammar(PythonGrammar, path)
+    genparser.install(grammar, path)
+    return grammar
 
 
 python_grammar = _get_python_grammar()
@@ -52,6 +49,12 @@ metavar_token_id = pytoken.python_tokens['REVDBMETAVAR']
 # dict
 del python_grammar.token_ids[metavar_token_id]
 
+# labels of the tokens in both grammars, computed by the tokenizer. The revdb
+# variants only add REVDBMETAVAR, which is looked up by classify
+token_labels = TokenLabels([python_grammar, python_grammar_no_print])
+python_grammar_revdb.label_slot = python_grammar.label_slot
+python_grammar_no_print_revdb.label_slot = python_grammar_no_print.label_slot
+
 
 class _Symbols(object):
     pass
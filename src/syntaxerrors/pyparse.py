@@ -1,3 +1,7 @@
+import codecs
+import itertools
+import mmap
+
 from syntaxerrors import parsefuture, parser, pytokenizer, pygram, error
 from syntaxerrors import astconsts
 from syntaxerrors.pytokenizer import indexbyte
@@ -54,6 +58,34 @@ def _check_line_for_encoding(line):
     return pytokenizer.match_encoding_declaration(line[i:]), True
 
 
+def _detect_encoding(textsrc, compile_info):
+    """Return a tuple (encoding, bom) for the source starting with textsrc.
+
+    encoding is None if no encoding is declared, bom is True if textsrc starts
+    with a UTF-8 byte order mark.
+    """
+    # only the first two lines can declare an encoding. This also makes
+    # sure that the rest of the source is not copied (e.g. of an mmap)
+    end = textsrc.find(b"\n", textsrc.find(b"\n") + 1)
+    if end >= 0:
+        textsrc = textsrc[:end + 1]
+    else:
+        textsrc = textsrc[:]
+    if textsrc.startswith(b"\xEF\xBB\xBF"):
+        # If an encoding is explicitly given check that it is utf-8.
+        decl_enc = _check_for_encoding(textsrc[3:])
+        if decl_enc and decl_enc != b"utf-8":
+            raise error.SyntaxError("UTF-8 BOM with %s coding cookie" % decl_enc.decode("utf-8"),
+                                    filename=compile_info.filename)
+        return 'utf-8', True
+    elif compile_info.flags & astconsts.PyCF_SOURCE_IS_UTF8:
+        if _check_for_encoding(textsrc) is not None:
+            raise error.SyntaxError("coding declaration in unicode string",
+                                    filename=compile_info.filename)
+        return 'utf-8', False
+    return _normalize_encoding(_check_for_encoding(textsrc)), False
+
+
 class CompileInfo(object):
     """Stores information about the source being compiled.
 
@@ -86,72 +118,139 @@ _targets = {
 class PythonParser(parser.Parser):
 
     def __init__(self, future_flags=parsefuture.futureFlags_2_7,
-                 grammar=pygram.python_grammar):
-        parser.Parser.__init__(self, grammar)
+                 grammar=pygram.python_grammar, compact_tokens=False,
+                 build_tree=True, first_error_only=False, flat_tree=False,
+                 collapse_chains=False, lalr=False, lazy_bodies=False,
+                 check_bodies=False):
+        parser.Parser.__init__(self, grammar, build_tree, first_error_only,
+                               flat_tree, collapse_chains, lalr=lalr)
+        if lazy_bodies and (flat_tree or collapse_chains):
+            raise ValueError("lazy_bodies only builds Node trees")
         self.future_flags = future_flags
+        # store the tokens in a TokenBuffer instead of a list of Tokens
+        self.compact_tokens = compact_tokens
+        # skip the indented bodies of functions and classes and parse them on
+        # first access, see lazy.py. With check_bodies, their syntax is
+        # checked up front (without building a tree for them)
+        self.lazy_bodies = lazy_bodies
+        self.check_bodies = check_bodies
 
     def parse_source(self, textsrc, compile_info):
         """Main entry point for parsing Python source.
 
         Everything from decoding the source to tokenizing to building the parse
-        tree is handled here.
+        tree is handled here. If the parser was created with build_tree=False,
+        only the syntax is checked and None is returned.
         """
-        # Detect source encoding.
-        enc = None
-        if textsrc.startswith(b"\xEF\xBB\xBF"):
+        textsrc = self._decode_source(textsrc, compile_info)
+        return self._parse(textsrc, compile_info)
+
+    def parse_file(self, path, compile_info):
+        """Like parse_source, but for the source in the file at path, which
+        is memory mapped instead of read. The tokenizer scans the mapped
+        file, so apart from the tree only the text of the tokens is copied
+        out of it, unless the source has to be recoded or has \\r line
+        endings, which make one copy of the whole source. The syntax errors
+        look up their lines in the mapped file, so it is only closed when
+        they are gone."""
+        with open(path, "rb") as f:
+            try:
+                source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # an empty file can't be mapped
+                return self.parse_source(b"", compile_info)
+        enc, bom = _detect_encoding(source, compile_info)
+        if not bom and enc is not None and enc not in ('utf-8', 'iso-8859-1'):
+            return self.parse_source(source[:], compile_info)
+        if enc is not None:
+            compile_info.encoding = enc
+        return self._parse(source, compile_info, 3 if bom else 0)
+
+    def _decode_source(self, textsrc, compile_info):
+        """Return textsrc recoded to utf-8 (or latin-1), according to its
+        encoding declaration or BOM."""
+        enc, bom = _detect_encoding(textsrc, compile_info)
+        if bom:
             textsrc = textsrc[3:]
-            enc = 'utf-8'
-            # If an encoding is explicitly given check that it is utf-8.
-            decl_enc = _check_for_encoding(textsrc)
-            if decl_enc and decl_enc != b"utf-8":
-                raise error.SyntaxError("UTF-8 BOM with %s coding cookie" % decl_enc.decode("utf-8"),
-                                        filename=compile_info.filename)
-        elif compile_info.flags & astconsts.PyCF_SOURCE_IS_UTF8:
-            enc = 'utf-8'
-            if _check_for_encoding(textsrc) is not None:
-                raise error.SyntaxError("coding declaration in unicode string",
+        elif enc is not None and enc not in ('utf-8', 'iso-8859-1'):
+            try:
+                textsrc = recode_to_utf8(textsrc, enc) # XXX can raise LookupError?
+            except LookupError:
+                raise error.SyntaxError("Unknown encoding: %s" % enc,
                                         filename=compile_info.filename)
-        else:
-            enc = _normalize_encoding(_check_for_encoding(textsrc))
-            if enc is not None and enc not in ('utf-8', 'iso-8859-1'):
-                try:
-                    textsrc = recode_to_utf8(textsrc, enc) # XXX can raise LookupError?
-                except LookupError:
-                    raise error.SyntaxError("Unknown encoding: %s" % enc,
-                                            filename=compile_info.filename)
-                except UnicodeDecodeError as e:
-                    raise error.SyntaxError(str(e))
-
-                    #if e.match(space, space.w_LookupError):
-                    #    raise error.SyntaxError("Unknown encoding: %s" % enc,
-                    #                            filename=compile_info.filename)
-                    # Transform unicode errors into SyntaxError
-                    #if e.match(space, space.w_UnicodeDecodeError):
-                    #    e.normalize_exception(space)
-                    #    w_message = space.str(e.get_w_value(space))
-                    #    raise error.SyntaxError(space.text_w(w_message))
-                    #raise
+            except UnicodeDecodeError as e:
+                raise error.SyntaxError(str(e))
+
+                #if e.match(space, space.w_LookupError):
+                #    raise error.SyntaxError("Unknown encoding: %s" % enc,
+                #                            filename=compile_info.filename)
+                # Transform unicode errors into SyntaxError
+                #if e.match(space, space.w_UnicodeDecodeError):
+                #    e.normalize_exception(space)
+                #    w_message = space.str(e.get_w_value(space))
+                #    raise error.SyntaxError(space.text_w(w_message))
+                #raise
         if enc is not None:
             compile_info.encoding = enc
-        return self._parse(textsrc, compile_info)
+        return textsrc
 
-    def _parse(self, textsrc, compile_info):
-        flags = compile_info.flags
+    def parse_to_ast(self, textsrc, compile_info):
+        """Like parse_source, but return the tree of the ast module of the
+        running Python, built directly while parsing. See astbuilder for the
+        Python 2 constructs that are rejected."""
+        from syntaxerrors import astbuilder
+        old_builder = self.builder
+        self.builder = astbuilder.ASTBuilder(compile_info)
+        try:
+            return self.parse_source(textsrc, compile_info)
+        finally:
+            self.builder = old_builder
+
+    def parse_outline(self, textsrc, compile_info, check=False):
+        """Return an outline.Outline of the def and class statements in the
+        source, which only needs the tokens, not a parse. The outline is
+        made for broken sources as well. With check=True, the syntax is
+        checked too, the errors are in the errors attribute of the result
+        instead of being raised."""
+        from syntaxerrors import outline
+        textsrc = self._decode_source(textsrc, compile_info)
+        return outline.outline(self, textsrc, compile_info, check)
+
+    def parse_sharded(self, textsrc, compile_info, processes=None):
+        """Like parse_source, but for very large sources: cut the source
+        into shards at top-level statements, which are parsed in parallel
+        by processes worker processes (one per CPU by default). Falls back
+        to parse_source if the source can't be cut. See sharded.py."""
+        from syntaxerrors import sharded
+        return sharded.parse(self, textsrc, compile_info, processes)
 
-        # The tokenizer is very picky about how it wants its input.
-        source_lines = textsrc.splitlines(True)
-        if source_lines and not source_lines[-1].endswith(b"\n"):
-            source_lines[-1] += b'\n'
-        if textsrc and pytokenizer.indexbyte(textsrc, -1) == b"\n":
-            flags &= ~astconsts.PyCF_DONT_IMPLY_DEDENT
+    def parse_incremental(self, textsrc, compile_info):
+        """Like parse_source, but return an incremental.ParseResult, which can
+        be passed to reparse after an edit of the source."""
+        from syntaxerrors import incremental
+        return incremental.parse(self, textsrc, compile_info)
 
+    def reparse(self, result, start, end, replacement):
+        """Return the incremental.ParseResult for the source of result with
+        the bytes from offset start to end replaced by replacement.
+
+        Only the top-level statements touched by the edit are tokenized and
+        parsed again. Raises the same errors as parse_source.
+        """
+        from syntaxerrors import incremental
+        return incremental.reparse(self, result, start, end, replacement)
+
+    def _parse(self, textsrc, compile_info, start=0):
+        flags = source_flags(textsrc, compile_info.flags)
         self.prepare(_targets[compile_info.mode])
         try:
             try:
                 # Note: we no longer pass the CO_FUTURE_* to the tokenizer,
                 # which is expected to work independently of them.  It's
                 # certainly the case for all futures in Python <= 2.7.
-                tokens = pytokenizer.generate_tokens(source_lines, flags)
+                tokens = pytokenizer.generate_source_tokens(
+                    textsrc, flags, compact=self.compact_tokens, start=start,
+                    labels=pygram.token_labels)
             except error.TokenError as e:
                 e.filename = compile_info.filename
                 raise
@@ -159,31 +258,183 @@ class PythonParser(parser.Parser):
                 e.filename = compile_info.filename
                 raise
 
-            newflags, last_future_import = (
-                parsefuture.add_future_flags(self.future_flags, tokens))
-            compile_info.last_future_import = last_future_import
-            compile_info.flags |= newflags
+            self._select_grammar(tokens, compile_info)
+            if self._lazy():
+                return self._parse_lazily(tokens, compile_info)
+            self._add_tokens(self.add_tokens, tokens, compile_info)
+            tree = self.root
+        finally:
+            # Avoid hanging onto the tree.
+            self.root = None
+        return tree
+
+    def _lazy(self):
+        return (self.lazy_bodies and self.build_tree and
+                self.builder is None)
 
-            if compile_info.flags & astconsts.CO_FUTURE_PRINT_FUNCTION:
-                self.grammar = pygram.python_grammar_no_print
-            else:
-                self.grammar = pygram.python_grammar
+    def _parse_lazily(self, tokens, compile_info):
+        from syntaxerrors import lazy
+        if self.compact_tokens:
+            tokens = list(tokens)
+        if self.check_bodies:
+            lazy.check_tokens(self, tokens, compile_info)
+        context = lazy.LazyContext(self, compile_info)
+        return lazy.parse_tokens(context, tokens, self.start)
 
+    def parse_lines(self, lines, compile_info):
+        """Parse Python source given as an iterable of byte strings.
+
+        Every string is one line of the source, e.g. lines can be a file
+        opened in binary mode. In contrast to parse_source, the lines are
+        tokenized and parsed lazily, so apart from the resulting tree and the
+        tokens of the bracket that is currently open, the memory needed does
+        not grow with the size of the source.
+        """
+        lines = iter(lines)
+        head = list(itertools.islice(lines, 2))
+        enc, bom = _detect_encoding(b"".join(head), compile_info)
+        if bom:
+            head[0] = head[0][3:]
+        lines = itertools.chain(head, lines)
+        if enc is not None and enc not in ('utf-8', 'iso-8859-1'):
             try:
-                self.add_tokens(tokens)
-            except parser.SingleParseError as e:
-                raise convert_parse_error(e, compile_info, self.grammar)
-            except parser.MultipleParseError as e:
-                errors = [convert_parse_error(e, compile_info, self.grammar)
-                        for e in e.errors]
-                raise error.MultipleSyntaxErrors(errors)
-            else:
-                tree = self.root
+                decoder = codecs.getincrementaldecoder(enc)()
+            except LookupError:
+                raise error.SyntaxError("Unknown encoding: %s" % enc,
+                                        filename=compile_info.filename)
+            lines = _recode_lines(lines, decoder)
+        if enc is not None:
+            compile_info.encoding = enc
+        return self._parse_lines(lines, compile_info)
+
+    def _parse_lines(self, lines, compile_info):
+        if (compile_info.flags & astconsts.PyCF_DONT_IMPLY_DEDENT or
+                self._lazy()):
+            # whether the flag is used depends on the end of the source, it is
+            # only given for (short) interactive input anyway. The lazy
+            # bodies keep their tokens, so they are all needed anyway
+            return self._parse(b"".join(lines), compile_info)
+        self.prepare(_targets[compile_info.mode])
+        tokens = _BufferedTokens(_read_brackets(pytokenizer.iter_tokens(
+            _source_lines(lines), compile_info.flags)))
+        try:
+            try:
+                self._select_grammar(tokens, compile_info)
+                self._add_tokens(self.add_token_stream, iter(tokens),
+                                 compile_info)
+            except error.TokenError as e:
+                e.filename = compile_info.filename
+                raise
+            except error.TokenIndentationError as e:
+                e.filename = compile_info.filename
+                raise
+            tree = self.root
         finally:
-            # Avoid hanging onto the tree.
             self.root = None
         return tree
 
+    def _select_grammar(self, tokens, compile_info):
+        newflags, last_future_import = (
+            parsefuture.add_future_flags(self.future_flags, tokens))
+        compile_info.last_future_import = last_future_import
+        compile_info.flags |= newflags
+
+        if compile_info.flags & astconsts.CO_FUTURE_PRINT_FUNCTION:
+            self.grammar = pygram.python_grammar_no_print
+        else:
+            self.grammar = pygram.python_grammar
+
+    def _add_tokens(self, add_tokens, tokens, compile_info):
+        try:
+            add_tokens(tokens)
+        except parser.SingleParseError as e:
+            raise convert_parse_error(e, compile_info, self.grammar)
+        except parser.MultipleParseError as e:
+            errors = [convert_parse_error(e, compile_info, self.grammar)
+                    for e in e.errors]
+            raise error.MultipleSyntaxErrors(errors)
+
+
+class _BufferedTokens(object):
+    """Wraps a token iterator to give parsefuture.add_future_flags random
+    access to the first few tokens."""
+
+    def __init__(self, tokens):
+        self.buffer = []
+        self.tokens = tokens
+
+    def __getitem__(self, index):
+        while index >= len(self.buffer):
+            self.buffer.append(next(self.tokens))
+        return self.buffer[index]
+
+    def __iter__(self):
+        return itertools.chain(self.buffer, self.tokens)
+
+
+_OPENING_BRACKETS = (pygram.tokens.LPAR, pygram.tokens.LSQB,
+                     pygram.tokens.LBRACE)
+_CLOSING_BRACKETS = (pygram.tokens.RPAR, pygram.tokens.RSQB,
+                     pygram.tokens.RBRACE)
+
+def _read_brackets(tokens):
+    """Yield the tokens of the iterator tokens, but read ahead to the closing
+    bracket whenever a bracket is opened.
+
+    The tokenizer raises a TokenError at the end of the source if a bracket is
+    never closed. parse_source tokenizes everything first, so it reports that
+    error. Reading ahead does the same for the streamed tokens, instead of
+    letting the parser try to recover from the errors in the rest of the
+    source, which is only inside the bracket because it is not closed."""
+    for token in tokens:
+        if token.token_type not in _OPENING_BRACKETS:
+            yield token
+            continue
+        pending = [token]
+        depth = 1
+        for token in tokens:
+            pending.append(token)
+            if token.token_type in _OPENING_BRACKETS:
+                depth += 1
+            elif token.token_type in _CLOSING_BRACKETS:
+                depth -= 1
+                if depth == 0:
+                    break
+        for token in pending:
+            yield token
+
+def source_flags(textsrc, flags):
+    """Return the flags to tokenize textsrc with."""
+    if textsrc[-1:] == b"\n":
+        flags &= ~astconsts.PyCF_DONT_IMPLY_DEDENT
+    return flags
+
+def _source_lines(lines):
+    """Split the byte strings in lines at every kind of line ending and make
+    sure the last line ends with a newline, like _parse does."""
+    prev = None
+    for line in lines:
+        if b"\r" in line:
+            pieces = line.splitlines(True)
+        else:
+            pieces = (line, )
+        for piece in pieces:
+            if prev is not None:
+                yield prev
+            prev = piece
+    if prev is not None:
+        if not prev.endswith(b"\n"):
+            prev += b"\n"
+        yield prev
+
+def _recode_lines(lines, decoder):
+    for line in lines:
+        try:
+            text = decoder.decode(line)
+        except UnicodeDecodeError as e:
+            raise error.SyntaxError(str(e))
+        yield text.encode("utf-8")
+
 def convert_parse_error(e, compile_info, grammar):
     # Catch parse errors, pretty them up and reraise them as a
     # SyntaxError.
@@ -200,8 +451,14 @@ def convert_parse_error(e, compile_info, grammar):
 
     # parser.ParseError(...).column is 0-based, but the offsets in the
     # exceptions in the error module are 1-based, hence the '+ 1'
-    return new_err(msg, e.token.lineno, e.token.column + 1, e.token.line,
-                   compile_info.filename)
+    token = e.token
+    lines = getattr(token, "lines", None)
+    if lines is not None:
+        text = token.line_index
+    else:
+        text = token.line
+    return new_err(msg, token.lineno, token.column + 1, text,
+                   compile_info.filename, lines=lines)
 
 def format_messages(e):
     if isinstance(e, error.SyntaxError):
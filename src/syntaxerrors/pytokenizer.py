@@ -2,6 +2,8 @@ import six
 
 from syntaxerrors import automata
 from syntaxerrors.parser import Token
+from syntaxerrors.linetable import LineTable, StreamedLineTable
+from syntaxerrors.tokenbuffer import TokenBuffer
 from syntaxerrors.pytoken import python_opmap_bytes
 from syntaxerrors.pytoken import tokens
 from syntaxerrors.error import TokenError, TokenIndentationError
@@ -63,17 +65,241 @@ def token_decode(token_type, value, lineno, column, line):
             line)
 
 
-def generate_tokens(lines, flags):
+def generate_tokens(lines, flags, lineno=1):
+    """Tokenize a list of lines and return the list of all Token instances.
+
+    See iter_tokens for details. On errors, the tokens produced so far are
+    attached to the raised TokenError.
+    """
+    token_list = []
+    append = token_list.append
+    try:
+        for token in iter_tokens(lines, flags, lineno=lineno):
+            append(token)
+    except (TokenError, TokenIndentationError) as e:
+        e.tokens = token_list
+        raise
+    return token_list
+
+
+def generate_token_buffer(lines, flags):
+    """Like generate_tokens, but return the tokens in a compact
+    tokenbuffer.TokenBuffer instead of a list of Token instances."""
+    buf = TokenBuffer()
+    try:
+        for _ in iter_tokens(lines, flags, buf.append_token):
+            pass
+    except (TokenError, TokenIndentationError) as e:
+        e.tokens = buf
+        raise
+    return buf
+
+
+def iter_tokens(lines, flags, make_token=token_decode, lineno=1):
+    """Tokenize lines, which can be any iterable of byte strings, with
+    iter_source_tokens. The lines are consumed lazily, one line per step
+    (except in brackets and strings that span lines), so the whole source
+    never needs to be in memory. The TokenErrors raised here don't carry the
+    previous tokens, use generate_tokens for that.
+
+    For every token make_token(token_type, value, lineno, column, line) is
+    called and its result is yielded. value is a byte string, line the
+    decoded line. lineno is the number of the first line.
+    """
+    table = StreamedLineTable(_checked_lines(lines, lineno))
+    def make_line_token(token_type, value, lineno, column, line_index):
+        return make_token(token_type, value, lineno, column,
+                          table[line_index])
+    return iter_source_tokens(table, flags, make_line_token, lineno)
+
+
+def _checked_lines(lines, lineno):
+    """Normalize the line endings of lines and raise the TokenError of
+    check_utf8 at the first line that is not valid utf-8, like for a whole
+    source. lineno is the number of the first line."""
+    for line in lines:
+        line = universal_newline(line)
+        try:
+            line.decode("utf-8")
+        except UnicodeDecodeError:
+            check_utf8(line, lineno=lineno)
+        lineno += 1
+        yield line
+
+
+class _Decoded(object):
+    """The value of a LazyToken, which is decoded from the utf-8 byte string
+    in _value the first time it is read. The text is then stored in the
+    instance, which hides this descriptor."""
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        text = obj.__dict__.pop("_value").decode("utf-8")
+        obj.__dict__["value"] = text
+        return text
+
+
+class LazyToken(Token):
+    """A Token whose value can be given as a utf-8 encoded byte string, it
+    is only decoded if it is used. The parser only looks at the values of
+    the NAME tokens if it doesn't build a tree. The line is the one at
+    line_index in lines, a linetable.LineTable. labels are the ones of
+    tokenlabels.TokenLabels, or None."""
+
+    value = _Decoded()
+
+    def __init__(self, token_type, value, lineno, column, lines, line_index,
+                 labels=None):
+        self.token_type = token_type
+        if isinstance(value, bytes):
+            self._value = value
+        else:
+            self.value = value
+        self.lineno = lineno
+        self.column = column
+        self.lines = lines
+        self.line_index = line_index
+        self.label_index = -1
+        self.grammar = None
+        self.labels = labels
+
+    @property
+    def line(self):
+        return self.lines[self.line_index]
+
+
+def ascii_text(source):
+    """Return the byte string source decoded as text if it is pure ASCII,
+    None otherwise."""
+    try:
+        return source.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+
+
+# the size of the pieces that check_utf8 decodes, so that checking an mmap
+# doesn't decode all of it at once
+CHECK_CHUNK_SIZE = 1 << 20
+
+def check_utf8(source, start=0, lineno=1):
+    """Raise a TokenError at the first byte of the byte string or mmap source
+    (from the offset start on) that is not valid utf-8. lineno is the number
+    of the line at start.
+
+    The values and lines of the tokens are only decoded when they are used,
+    which for most of them is never, so invalid bytes would go unnoticed
+    without this check."""
+    pos = start
+    while pos < len(source):
+        # the pieces end after a newline, so that no character is cut in
+        # two and the error is the same as for decoding the whole source
+        end = source.find(b"\n", pos + CHECK_CHUNK_SIZE) + 1
+        if end == 0:
+            end = len(source)
+        try:
+            source[pos:end].decode("utf-8")
+        except UnicodeDecodeError as e:
+            offset = pos + e.start
+            lnum = source[start:offset].count(b"\n") + lineno
+            line_start = source.rfind(b"\n", start, offset) + 1
+            line_end = source.find(b"\n", offset) + 1
+            if line_end == 0:
+                line_end = len(source)
+            line = source[line_start:line_end].decode("utf-8", "replace")
+            msg = ("(unicode error) 'utf-8' codec can't decode byte 0x%02x: "
+                   "%s" % (six.indexbytes(source[offset:offset + 1], 0),
+                           e.reason))
+            raise TokenError(msg, line, lnum, offset - line_start + 1, [])
+        pos = end
+
+def source_lines(source, start=0, as_text=True):
+    """Return an empty LineTable for tokenizing source (from the offset
+    start on) with iter_source_tokens.
+
+    The line endings are normalized once for the whole buffer, if it
+    contains any carriage return, and a newline is added at the end if
+    there is none. If as_text is true and the source is a pure ASCII byte
+    string (checked once for the whole buffer), it is decoded as a whole,
+    so that the values and lines of the tokens are text slices of it, which
+    never need to be decoded one by one. Decoding anything else (e.g. an
+    mmap) as a whole would copy it, it is only checked to be valid utf-8.
     """
-    This is a rewrite of pypy.module.parser.pytokenize.generate_tokens since
-    the original function is not RPYTHON (uses yield)
-    It was also slightly modified to generate Token instances instead
-    of the original 5-tuples -- it's now a 4-tuple of
+    if source.find(b"\r") != -1:
+        source = source[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if len(source) > start and source[len(source) - 1:] != b"\n":
+        source = source[:] + b"\n"
+    text = None
+    if as_text and isinstance(source, bytes):
+        text = ascii_text(source)
+    if text is None:
+        check_utf8(source, start)
+    return LineTable(source, text)
 
-    * the Token instance
-    * the whole line as a string
-    * the line number (the real one, counting continuation lines)
-    * the position on the line of the end of the token.
+
+def generate_source_tokens(source, flags, lineno=1, compact=False, start=0,
+                           labels=None):
+    """Like generate_tokens (or generate_token_buffer if compact is true),
+    but tokenize the whole source, a byte string or an mmap, with
+    iter_source_tokens. The tokens in the list are LazyTokens, all of them
+    share one LineTable, like the ones in the TokenBuffer. If labels, a
+    tokenlabels.TokenLabels, is given, the tokens in the list get their
+    labels from it, and the values of the NAME tokens are interned."""
+    lines = source_lines(source, start, as_text=not compact)
+    if compact:
+        result = TokenBuffer(lines)
+        make_token = result.append_token
+    elif labels is not None:
+        result = []
+        names = labels.names
+        add_name = labels.add_name
+        type_labels = labels.types
+        def make_token(token_type, value, lineno, column, line_index):
+            if token_type == tokens.NAME:
+                entry = names.get(value)
+                if entry is None:
+                    entry = add_name(value)
+                value, token_labels = entry
+            else:
+                token_labels = type_labels[token_type]
+            return LazyToken(token_type, value, lineno, column, lines,
+                             line_index, token_labels)
+    else:
+        result = []
+        def make_token(token_type, value, lineno, column, line_index):
+            return LazyToken(token_type, value, lineno, column, lines,
+                             line_index)
+    append = result.append
+    try:
+        for token in iter_source_tokens(lines, flags, make_token, lineno,
+                                        start):
+            if not compact:
+                append(token)
+    except (TokenError, TokenIndentationError) as e:
+        e.tokens = result
+        raise
+    return result
+
+
+def iter_source_tokens(lines, flags, make_token, lineno=1, start=0):
+    """
+    This is a rewrite of pypy.module.parser.pytokenize.generate_tokens.
+    It was modified to call make_token(token_type, value, lineno, column,
+    line) for every token and yield its result instead of the original
+    5-tuples, and to scan the whole source in one buffer: a byte string, or
+    anything else that can be sliced and searched like one (e.g. an mmap),
+    in the LineTable lines made by source_lines. Tokenizing starts at the
+    offset start, e.g. after a byte order mark.
+
+    Instead of copying every line out of the source, the lines are found
+    with find and scanned at their offsets in the buffer, and the tokens
+    are sliced directly out of it. Triple-quoted strings that span lines
+    are recognized in one go instead of line by line. The lines are added
+    to lines as they are reached, the line passed to make_token is the
+    index of the line in it. Nothing is decoded here, the value passed to
+    make_token is a byte string, or text if lines has the source as text.
+    When the end of the buffer is reached, lines can read more of the
+    source into it, see linetable.StreamedLineTable and iter_tokens.
 
     Original docstring ::
 
@@ -89,169 +315,214 @@ def generate_tokens(lines, flags):
         and the line on which the token was found. The line passed is the
         logical line; continuation lines are included.
     """
-    token_list = []
-    lnum = continued = 0
+    source = lines.source
+    size = len(source)
+    # the values of the tokens are sliced out of text
+    text = lines.text
+    if text is None:
+        text = source
+    last_token_type = -1
+    lnum = lineno - 1
+    continued = 0
     namechars = NAMECHARS
     numchars = NUMCHARS
-    contstr, needcont = '', 0
-    contline = None
+    # the offset of a single-quoted string continued on the next line
+    contstart, needcont = -1, 0
     indents = [0]
     last_comment = b''
+    # (bracket, lnum, column, offset of the line)
     parenstack = []
 
     # make the annotator happy
     endDFA = DUMMY_DFA
-    # make the annotator happy
-    line = ''
+    strstart = (0, 0, b"")
     pos = 0
-    lines.append(b"")
-    strstart = (0, 0, "")
-    for line in lines:
-        assert isinstance(line, bytes)
-        lnum = lnum + 1
-        line = universal_newline(line)
-        assert isinstance(line, bytes)
-        pos, max = 0, len(line)
-        uni_line = line.decode("utf-8")
-
-        if contstr:
-            if not line:
-                raise TokenError(
-                    "end of file (EOF) while scanning triple-quoted string literal",
-                    strstart[2], strstart[0], strstart[1]+1,
-                    token_list, lnum-1)
-            endmatch = endDFA.recognize(line)
-            if endmatch >= 0:
-                pos = end = endmatch
-                tok = token_decode(tokens.STRING, contstr + line[:end], strstart[0],
-                       strstart[1], uni_line)
-                token_list.append(tok)
-                last_comment = b''
-                contstr, needcont = '', 0
-                contline = None
-            elif (needcont and not line.endswith(b'\\\n') and
-                               not line.endswith(b'\\\r\n')):
-                tok = token_decode(tokens.ERRORTOKEN, contstr + line, strstart[0],
-                       strstart[1], uni_line)
-                token_list.append(tok)
-                last_comment = b''
-                contstr = ''
-                contline = None
-                continue
-            else:
-                contstr = contstr + line
-                contline = contline + line
-                continue
-
-        elif not parenstack and not continued:  # new statement
-            if not line: break
-            column = 0
-            while pos < max:                   # measure leading whitespace
-                if indexbyte(line, pos) == b' ': column = column + 1
-                elif indexbyte(line, pos) == b'\t': column = (column/tabsize + 1)*tabsize
-                elif indexbyte(line, pos) == b'\f': column = 0
-                else: break
-                pos = pos + 1
-            if pos == max: break
+    # the offsets of the current line and of the next one
+    line_start = next_start = start
+    # the offset to continue the current line at, after a triple-quoted
+    # string that ended on it
+    resume = -1
+    while True:
+        if resume >= 0:
+            pos = resume
+            resume = -1
+        else:
+            if next_start >= size:
+                # nothing before the next line is needed any more, unless
+                # it is in a bracket or string
+                clean = contstart < 0 and not parenstack
+                if not lines.read_more(clean):
+                    break
+                # the source of a StreamedLineTable is never decoded as a
+                # whole
+                source = text = lines.source
+                size = len(source)
+                if clean:
+                    next_start = 0
+            line_start = next_start
+            next_start = source.find(b"\n", line_start) + 1
+            if next_start == 0:
+                # only the lines given to iter_tokens can lack a newline
+                next_start = size
+            lnum = lnum + 1
+            pos = line_start
+            line_index = lines.add(line_start)
 
-            if indexbyte(line, pos) in b'#\r\n':
-                # skip comments or blank lines
-                continue
+            if contstart >= 0:
+                line = source[line_start:next_start]
+                endmatch = endDFA.recognize(line)
+                if endmatch >= 0:
+                    pos = line_start + endmatch
+                    last_token_type = tokens.STRING
+                    yield make_token(tokens.STRING, text[contstart:pos],
+                                     strstart[0], strstart[1], line_index)
+                    last_comment = b''
+                    contstart, needcont = -1, 0
+                elif needcont and not line.endswith(b'\\\n'):
+                    last_token_type = tokens.ERRORTOKEN
+                    yield make_token(tokens.ERRORTOKEN,
+                                     text[contstart:next_start],
+                                     strstart[0], strstart[1], line_index)
+                    last_comment = b''
+                    contstart = -1
+                    continue
+                else:
+                    continue
 
-            if column > indents[-1]:           # count indents or dedents
-                indents.append(column)
-                token_list.append(token_decode(tokens.INDENT, line[:pos], lnum, 0, uni_line))
-                last_comment = b''
-            while column < indents[-1]:
-                indents.pop()
-                token_list.append(token_decode(tokens.DEDENT, b'', lnum, pos, uni_line))
-                last_comment = b''
-            if column != indents[-1]:
-                err = "unindent does not match any outer indentation level"
-                raise TokenIndentationError(err, line, lnum, column+1, token_list)
-
-        else:                                  # continued statement
-            if not line:
-                if parenstack:
-                    _, lnum1, start1, line1 = parenstack[0]
-                    raise TokenError("parenthesis is never closed", line1,
-                                     lnum1, start1 + 1, token_list, lnum)
-                raise TokenError("end of file (EOF) in multi-line statement", line,
-                                 lnum, 0, token_list) # XXX why is the offset 0 here?
-            continued = 0
+            elif not parenstack and not continued:  # new statement
+                column = 0
+                while pos < next_start:          # measure leading whitespace
+                    char = source[pos:pos + 1]
+                    if char == b' ': column = column + 1
+                    elif char == b'\t': column = (column/tabsize + 1)*tabsize
+                    elif char == b'\f': column = 0
+                    else: break
+                    pos = pos + 1
+
+                if source[pos:pos + 1] in b'#\n':
+                    # skip comments or blank lines
+                    continue
 
+                if column > indents[-1]:           # count indents or dedents
+                    indents.append(column)
+                    last_token_type = tokens.INDENT
+                    yield make_token(tokens.INDENT, text[line_start:pos],
+                                     lnum, 0, line_index)
+                    last_comment = b''
+                while column < indents[-1]:
+                    indents.pop()
+                    last_token_type = tokens.DEDENT
+                    yield make_token(tokens.DEDENT, b'', lnum,
+                                     pos - line_start, line_index)
+                    last_comment = b''
+                if column != indents[-1]:
+                    err = "unindent does not match any outer indentation level"
+                    raise TokenIndentationError(
+                        err, source[line_start:next_start], lnum, column+1,
+                        [])
+
+            else:                                  # continued statement
+                continued = 0
+
+        max = next_start
         while pos < max:
-            pseudomatch = pseudoDFA.recognize(line, pos)
+            pseudomatch = pseudoDFA.recognize(source, pos)
             if pseudomatch >= 0:                            # scan for tokens
                 # JDR: Modified
-                start = whiteSpaceDFA.recognize(line, pos)
+                start = whiteSpaceDFA.recognize(source, pos)
                 if start < 0:
                     start = pos
                 end = pseudomatch
 
                 if start == end:
-                    raise TokenError("Unknown character", line,
-                                     lnum, start + 1, token_list)
+                    raise TokenError("Unknown character",
+                                     source[line_start:next_start], lnum,
+                                     start - line_start + 1, [])
 
                 pos = end
-                token, initial = line[start:end], indexbyte(line, start)
+                token, initial = source[start:end], source[start:start + 1]
                 if initial in numchars or \
                    (initial == b'.' and token != b'.'):      # ordinary number
-                    token_list.append(token_decode(tokens.NUMBER, token, lnum, start, uni_line))
+                    last_token_type = tokens.NUMBER
+                    yield make_token(tokens.NUMBER, text[start:end], lnum,
+                                     start - line_start, line_index)
                     last_comment = b''
-                elif initial in b'\r\n':
+                elif initial == b'\n':
                     if not parenstack:
-                        tok = token_decode(tokens.NEWLINE, last_comment, lnum, start, uni_line)
-                        token_list.append(tok)
+                        last_token_type = tokens.NEWLINE
+                        yield make_token(tokens.NEWLINE, last_comment, lnum,
+                                         start - line_start, line_index)
                     last_comment = b''
                 elif initial == b'#':
                     # skip comment
-                    last_comment = token
+                    last_comment = text[start:end]
                 elif token in triple_quoted:
                     endDFA = endDFAs[token]
-                    endmatch = endDFA.recognize(line, pos)
-                    if endmatch >= 0:                     # all on one line
-                        pos = endmatch
-                        token = line[start:pos]
-                        tok = token_decode(tokens.STRING, token, lnum, start, uni_line)
-                        token_list.append(tok)
-                        last_comment = b''
-                    else:
-                        strstart = (lnum, start, line)
-                        contstr = line[start:]
-                        contline = line
+                    endmatch = endDFA.recognize(source, pos)
+                    while endmatch < 0 and lines.read_more(False):
+                        source = text = lines.source
+                        size = len(source)
+                        endmatch = endDFA.recognize(source, pos)
+                    if endmatch < 0:
+                        raise TokenError(
+                            "end of file (EOF) while scanning triple-quoted string literal",
+                            source[line_start:next_start], lnum,
+                            start - line_start + 1, [],
+                            lnum + source[next_start:].count(b"\n"))
+                    string_lnum, column = lnum, start - line_start
+                    if endmatch > max:
+                        # the string ends on a later line, continue there
+                        lnum += source[start:endmatch].count(b"\n")
+                        line_start = source.rfind(b"\n", 0, endmatch) + 1
+                        next_start = source.find(b"\n", endmatch) + 1
+                        line_index = lines.add(line_start)
+                        resume = endmatch
+                    last_token_type = tokens.STRING
+                    yield make_token(tokens.STRING, text[start:endmatch],
+                                     string_lnum, column, line_index)
+                    last_comment = b''
+                    if resume >= 0:
                         break
+                    pos = endmatch
                 elif initial in single_quoted or \
                     token[:2] in single_quoted or \
                     token[:3] in single_quoted:
-                    if indexbyte(token, -1) == b'\n':                  # continued string
-                        strstart = (lnum, start, line)
-                        endDFA = (endDFAs[initial] or endDFAs[indexbyte(token, 1)] or
-                                   endDFAs[indexbyte(token, 2)])
-                        contstr, needcont = line[start:], 1
-                        contline = line
+                    if token[len(token) - 1:] == b'\n':       # continued string
+                        strstart = (lnum, start - line_start,
+                                    source[line_start:next_start])
+                        endDFA = (endDFAs[initial] or
+                                  endDFAs[token[1:2]] or
+                                  endDFAs[token[2:3]])
+                        contstart, needcont = start, 1
                         break
                     else:                                  # ordinary string
-                        tok = token_decode(tokens.STRING, token, lnum, start, uni_line)
-                        token_list.append(tok)
+                        last_token_type = tokens.STRING
+                        yield make_token(tokens.STRING, text[start:end], lnum,
+                                         start - line_start, line_index)
                         last_comment = b''
                 elif initial in namechars:                 # ordinary name
-                    token_list.append(token_decode(tokens.NAME, token, lnum, start, uni_line))
+                    last_token_type = tokens.NAME
+                    yield make_token(tokens.NAME, text[start:end], lnum,
+                                     start - line_start, line_index)
                     last_comment = b''
                 elif initial == b'\\':                      # continued stmt
                     continued = 1
                 elif initial == '$':
-                    token_list.append(Token(tokens.REVDBMETAVAR, token,
-                                       lnum, start, line))
+                    last_token_type = tokens.REVDBMETAVAR
+                    yield Token(tokens.REVDBMETAVAR, token, lnum,
+                                start - line_start,
+                                source[line_start:next_start])
                     last_comment = ''
                 else:
                     if initial in b'([{':
-                        parenstack.append((initial, lnum, start, line))
+                        parenstack.append((initial, lnum, start - line_start,
+                                           line_start))
                     elif initial in b')]}':
+                        line = source[line_start:next_start]
                         if not parenstack:
                             raise TokenError("unmatched '%s'" % initial.decode("utf-8"), line,
-                                             lnum, start + 1, token_list)
-                        opening, lnum1, start1, line1 = parenstack.pop()
+                                             lnum, start - line_start + 1, [])
+                        opening, lnum1, start1, line_start1 = parenstack.pop()
                         if not ((opening == b"(" and initial == b")") or
                                 (opening == b"[" and initial == b"]") or
                                 (opening == b"{" and initial == b"}")):
@@ -261,37 +532,54 @@ def generate_tokens(lines, flags):
                             if lnum1 != lnum:
                                 msg += " on line " + str(lnum1)
                             raise TokenError(
-                                    msg, line, lnum, start + 1, token_list)
+                                    msg, line, lnum, start - line_start + 1,
+                                    [])
                     if token in python_opmap_bytes:
                         punct = python_opmap_bytes[token]
                     else:
                         punct = tokens.OP
-                    token_list.append(token_decode(punct, token, lnum, start, uni_line))
+                    last_token_type = punct
+                    yield make_token(punct, text[start:end], lnum,
+                                     start - line_start, line_index)
                     last_comment = b''
             else:
-                start = whiteSpaceDFA.recognize(line, pos)
+                start = whiteSpaceDFA.recognize(source, pos)
                 if start < 0:
                     start = pos
-                if start<max and indexbyte(line, start) in single_quoted:
+                if start < max and source[start:start + 1] in single_quoted:
                     raise TokenError("end of line (EOL) while scanning string literal",
-                             line, lnum, start+1, token_list)
-                tok = token_decode(tokens.ERRORTOKEN, indexbyte(line, pos), lnum, pos, uni_line)
-                token_list.append(tok)
+                             source[line_start:next_start], lnum,
+                             start - line_start + 1, [])
+                last_token_type = tokens.ERRORTOKEN
+                yield make_token(tokens.ERRORTOKEN, text[pos:pos + 1], lnum,
+                                 pos - line_start, line_index)
                 last_comment = b''
                 pos = pos + 1
 
+    # the end of the source, iter_tokens sees an empty line here
+    lnum += 1
+    if contstart >= 0:
+        raise TokenError(
+            "end of file (EOF) while scanning triple-quoted string literal",
+            strstart[2], strstart[0], strstart[1]+1, [], lnum-1)
+    if parenstack:
+        _, lnum1, start1, line_start1 = parenstack[0]
+        raise TokenError("parenthesis is never closed",
+                         source[line_start1:source.find(b"\n", line_start1) + 1],
+                         lnum1, start1 + 1, [], lnum)
+    if continued:
+        raise TokenError("end of file (EOF) in multi-line statement", b"",
+                         lnum, 0, [])
     lnum -= 1
+    newline = lines.add_text(u'\n')
+    empty = lines.add_text(u'')
     if not (flags & astconsts.PyCF_DONT_IMPLY_DEDENT):
-        if token_list and token_list[-1].token_type != tokens.NEWLINE:
-            tok = token_decode(tokens.NEWLINE, b'\n', lnum, 0, u'\n')
-            token_list.append(tok)
+        if last_token_type != -1 and last_token_type != tokens.NEWLINE:
+            yield make_token(tokens.NEWLINE, b'\n', lnum, 0, newline)
         for indent in indents[1:]:                # pop remaining indent levels
-            token_list.append(token_decode(tokens.DEDENT, b'', lnum, pos, uni_line))
-    tok = token_decode(tokens.NEWLINE, b'\n', lnum, 0, u'\n')
-    token_list.append(tok)
-
-    token_list.append(token_decode(tokens.ENDMARKER, b'', lnum, pos, uni_line))
-    return token_list
+            yield make_token(tokens.DEDENT, b'', lnum, 0, empty)
+    yield make_token(tokens.NEWLINE, b'\n', lnum, 0, newline)
+    yield make_token(tokens.ENDMARKER, b'', lnum, 0, empty)
 
 
 def universal_newline(line):
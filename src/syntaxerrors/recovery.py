@@ -1,5 +1,6 @@
 from __future__ import print_function
 from collections import deque
+import heapq
 
 from syntaxerrors import parser
 
@@ -19,6 +20,14 @@ NUMBER_DELETES = 3
 # number of repair attempts to try
 ATTEMPTS_LIMIT = 100000
 
+# search strategies of try_recover
+BREADTH_FIRST = "breadth-first"
+# cheapest repair first, where inserts and deletes cost 1 and existing tokens
+# are free
+BEST_FIRST = "best-first"
+
+STRATEGY = BEST_FIRST
+
 class Repair(object):
     def __init__(self, stack, index, name='', reprtokens=None):
         self.stack = stack
@@ -27,6 +36,8 @@ class Repair(object):
         if reprtokens is None:
             reprtokens = []
         self.reprtokens = reprtokens
+        # number of inserts and deletes
+        self.cost = len(name) - name.count("e")
 
     def __repr__(self):
         l = []
@@ -41,7 +52,7 @@ class Repair(object):
             token = tokens[i]
             label_index = grammar.classify(token)
             try:
-                stack = parser.add_token(stack, grammar, token, label_index)
+                stack = stack.add_token(grammar, token, label_index)
             except parser.ParseError:
                 return False
             except parser.Done:
@@ -54,7 +65,7 @@ class Repair(object):
         if self.name and self.name.count("e") < NUMBER_EXISTING:
             label_index = grammar.classify(token)
             try:
-                stack = parser.add_token(self.stack, grammar, token, label_index)
+                stack = self.stack.add_token(grammar, token, label_index)
             except parser.ParseError:
                 pass
             else:
@@ -71,45 +82,155 @@ class Repair(object):
                 token = parser.Token(tp, value, -1, -1, u"fake line")
                 label_index = grammar.classify(token)
                 try:
-                    stack = parser.add_token(self.stack, grammar, token, label_index)
+                    stack = self.stack.add_token(grammar, token, label_index)
                 except parser.ParseError:
                     continue
                 yield Repair(stack, self.index, self.name + 'i', self.reprtokens + [token])
 
     def key(self):
-        return (self.index, self.stack.next, self.stack.state, self.stack.dfa)
+        return (self.index, self.stack.configuration())
+
+    def covers(self, other):
+        """Return whether every sequence of changes that can be added to other
+        can also be added to self."""
+        name = self.name
+        return (name.count("i") <= other.name.count("i") and
+                name.count("d") <= other.name.count("d") and
+                name.count("e") <= other.name.count("e") and
+                # no deletes directly after an insert
+                (name[-1:] != "i" or other.name[-1:] == "i") and
+                # no existing tokens before the first change
+                (name != "" or other.name == ""))
+
+    def changes_left(self):
+        """Return whether more inserts or deletes can be added."""
+        return (self.name.count("i") < NUMBER_INSERTS or
+                self.name.count("d") < NUMBER_DELETES)
+
+
+class RepairMemo(object):
+    """Remembers the configurations (see Repair.key) that the repairs of one
+    search reached, and the result of checking them.
+
+    Two repairs with the same key parse the following tokens in the same way,
+    so only one of them has to be checked, and a repair can be dropped if an
+    earlier one with the same key allows at least the same further changes.
+    """
+
+    def __init__(self):
+        self.repairs = {}
+        self.results = {}
+
+    def add(self, repair, key):
+        """Return False if repair does not need to be explored, because an
+        earlier repair covers it, otherwise remember it."""
+        repairs = self.repairs.get(key, None)
+        if repairs is None:
+            self.repairs[key] = [repair]
+            return True
+        for earlier in repairs:
+            if earlier.covers(repair):
+                return False
+        repairs.append(repair)
+        return True
 
 
 def initial_queue(stack, index):
     return [Repair(stack, index)]
 
-def try_recover(grammar, stack, tokens, index):
+def try_recover(grammar, stack, tokens, index, strategy=None):
+    """Search for a repair of the error at tokens[index]. Returns a tuple
+    (tokens, index, stack) to continue parsing with."""
+    repair, _, _ = find_repair(grammar, stack, tokens, index, strategy)
+    return tokens, repair.index, repair.stack
+
+def find_repair(grammar, stack, tokens, index, strategy=None):
+    """Return a tuple (repair, attempts, replays) of the repair that the
+    search strategy finds, the number of repairs it generated and the number
+    of repairs whose tokens it parsed."""
+    if strategy is None:
+        strategy = STRATEGY
+    if strategy == BEST_FIRST:
+        return find_repair_best_first(grammar, stack, tokens, index)
+    elif strategy == BREADTH_FIRST:
+        return find_repair_breadth_first(grammar, stack, tokens, index)
+    raise ValueError("unknown recovery strategy %r" % (strategy, ))
+
+def find_repair_breadth_first(grammar, stack, tokens, index):
     queue = initial_queue(stack, index)
     endindex = compute_endindex(tokens, index)
     attempts = 0
-    unexplored = 0
-    seen = {}
+    replays = 0
+    memo = RepairMemo()
     while queue:
         newqueue = []
         for element in queue:
             for repair in element.further_changes(tokens, grammar):
-                if repair.key() in seen:
-                    unexplored += 1
-                else:
-                    seen[repair.key()] = repair
                 attempts += 1
                 if attempts > ATTEMPTS_LIMIT:
                     break
-                if attempts % 10000 == 0:
-                    print(attempts, len(newqueue))
-                if repair.parses_successfully(tokens, grammar, endindex):
+                key = repair.key()
+                if not memo.add(repair, key):
+                    continue
+                success = memo.results.get(key, None)
+                if success is None:
+                    replays += 1
+                    success = repair.parses_successfully(tokens, grammar, endindex)
+                    memo.results[key] = success
+                if success:
                     assert repair.name
-                    print('=====', unexplored, attempts, repair.name, repair)
-                    return tokens, repair.index, repair.stack
+                    return repair, attempts, replays
                 newqueue.append(repair)
         queue = newqueue
     assert 0, "no recovery found! despite trying %s" % (attempts, )
 
+def find_repair_best_first(grammar, stack, tokens, index):
+    """A* search over the repairs, by their cost plus a lower bound of the
+    cost that is still needed, which is 1 for a repair that fails: consuming
+    existing tokens cannot get past the token where it fails. The queue only
+    contains failing repairs, the cheapest one is extended next. Its inserts
+    and deletes cost one more, which is the lowest estimate of any repair
+    left, so the first one of them that parses successfully is a repair with
+    the fewest inserts and deletes."""
+    endindex = compute_endindex(tokens, index)
+    attempts = 0
+    replays = 0
+    memo = RepairMemo()
+    # entries are (cost, length, insertion order, repair), repairs with the
+    # same cost are extended in breadth first order
+    queue = []
+    for repair in initial_queue(stack, index):
+        heapq.heappush(queue, (repair.cost, 0, len(queue), repair))
+    order = len(queue)
+    while queue:
+        _, _, _, element = heapq.heappop(queue)
+        for repair in element.further_changes(tokens, grammar):
+            attempts += 1
+            if attempts > ATTEMPTS_LIMIT:
+                break
+            key = repair.key()
+            if not memo.add(repair, key):
+                continue
+            if repair.cost == element.cost:
+                # consuming an existing token after a failing repair fails
+                # again
+                memo.results[key] = False
+            else:
+                success = memo.results.get(key, None)
+                if success is None:
+                    replays += 1
+                    success = repair.parses_successfully(tokens, grammar, endindex)
+                    memo.results[key] = success
+                if success:
+                    return repair, attempts, replays
+            if repair.changes_left():
+                heapq.heappush(queue, (repair.cost, len(repair.name), order,
+                                       repair))
+                order += 1
+        if attempts > ATTEMPTS_LIMIT:
+            break
+    assert 0, "no recovery found! despite trying %s" % (attempts, )
+
 def compute_endindex(tokens, index):
     endindex = index
     lineno = tokens[index].lineno
@@ -119,3 +240,25 @@ def compute_endindex(tokens, index):
             break
     endindex += SUCCESS_NUMBER_TOKENS
     return min(len(tokens), endindex)
+
+
+def fill_lookahead(window, index, tokens):
+    """Append tokens from the iterator tokens to the list window, until it
+    contains all the tokens after index that a recovery can look at."""
+    lineno = window[index].lineno
+    needed = -1
+    for i in range(index, len(window)):
+        if window[i].lineno > lineno:
+            needed = i
+            break
+    # repairs can consume or delete some tokens beyond endindex
+    slack = SUCCESS_NUMBER_TOKENS + NUMBER_EXISTING + NUMBER_DELETES
+    if needed != -1:
+        needed += slack
+    while needed == -1 or len(window) < needed:
+        token = next(tokens, None)
+        if token is None:
+            return
+        window.append(token)
+        if needed == -1 and token.lineno > lineno:
+            needed = len(window) - 1 + slack
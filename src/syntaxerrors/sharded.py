@@ -0,0 +1,213 @@
+"""
+Parsing a very large module in parallel, in a pool of processes.
+
+The source is cut into shards at the beginnings of top-level statements: at
+lines that start in column 0 outside of any bracket or string, found by a
+pre-scan with a regular expression that only looks at brackets, strings,
+comments and line ends. A line doesn't start a statement if it continues
+the previous one (else, elif, except and finally) or if the previous one is
+a decorator. The future imports at the beginning are never cut.
+
+Every shard is tokenized and parsed as a file_input on its own, in a worker
+process, which sends back the tree in the compact postorder form of
+flattree.FlatTree. The children of the file_input nodes are then joined into
+one tree, which is the same as the one of parse_source. Like in
+incremental.py, whenever that is not obviously the case (no cut points, a
+shard doesn't tokenize or parse, a flat tree or an AST builder), the whole
+source is parsed sequentially, which also gives the proper errors.
+"""
+
+import io
+import multiprocessing
+import re
+
+from syntaxerrors import error, parser, pygram, pytokenizer
+from syntaxerrors import astconsts
+from syntaxerrors.incremental import _move_final_dedents
+
+# shards smaller than this are not worth sending to another process
+MIN_SHARD_SIZE = 1 << 20
+
+# the things the pre-scan needs to look at. The string literals only up to
+# the opening quotes, the rest is matched with _STRING_ENDS
+_SCAN = re.compile(br"""
+    (\#[^\n]*)                      # 1: comment
+  | ("{3}|'{3}|"|')                 # 2: string
+  | ([(\[{])                        # 3: open bracket
+  | ([)\]}])                        # 4: close bracket
+  | (\\\r?\n)                       # 5: explicit line continuation
+  | \n(?=[^\s\#])                   # a line that starts in column 0
+""", re.VERBOSE)
+
+_STRING_ENDS = {
+    b'"""': re.compile(br'(?:[^\\"]|\\.|"(?!""))*"""', re.DOTALL),
+    b"'''": re.compile(br"(?:[^\\']|\\.|'(?!''))*'''", re.DOTALL),
+    b'"': re.compile(br'(?:[^\\"\n]|\\.)*"', re.DOTALL),
+    b"'": re.compile(br"(?:[^\\'\n]|\\.)*'", re.DOTALL),
+}
+
+# lines in column 0 that continue the statement before them
+_CONTINUATION = re.compile(br"(?:else|elif|except|finally)\b")
+
+
+def find_cut_points(source, num_shards, start=0):
+    """Return the offsets at which source can be cut into (at most)
+    num_shards shards of roughly the same size, all of them after start.
+    Returns an empty list if the pre-scan doesn't understand the source."""
+    cut_points = []
+    step = len(source) // num_shards
+    target = max(start, step)
+    depth = 0
+    # the previous line that started in column 0 was a decorator
+    after_decorator = False
+    pos = 0
+    match = _SCAN.search(source, pos)
+    while match is not None and len(cut_points) < num_shards - 1:
+        pos = match.end()
+        group = match.lastindex
+        if group == 2:
+            end = _STRING_ENDS[match.group(2)].match(source, pos)
+            if end is None:
+                # an unterminated string, the tokenizer complains about it
+                return []
+            pos = end.end()
+        elif group == 3:
+            depth += 1
+        elif group == 4:
+            depth -= 1
+        elif group is None and depth == 0:
+            if (pos >= target and not after_decorator and
+                    not _CONTINUATION.match(source, pos)):
+                cut_points.append(pos)
+                target = max(pos + 1, target + step)
+            after_decorator = source[pos:pos + 1] == b"@"
+        match = _SCAN.search(source, pos)
+    return cut_points
+
+
+def parse(python_parser, textsrc, compile_info, processes=None):
+    """Parse textsrc like parse_source, in processes worker processes (by
+    default one per CPU). See PythonParser.parse_sharded."""
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    textsrc = python_parser._decode_source(textsrc, compile_info)
+    shards = _split(python_parser, textsrc, compile_info, processes)
+    if shards is None:
+        return python_parser._parse(textsrc, compile_info)
+    pool = multiprocessing.Pool(min(processes, len(shards)))
+    try:
+        results = pool.map(_parse_shard, shards)
+    finally:
+        pool.close()
+        pool.join()
+    if None in results:
+        return python_parser._parse(textsrc, compile_info)
+    if not python_parser.build_tree:
+        return None
+    grammar = python_parser.grammar
+    children = []
+    for result in results:
+        tree = _build_tree(grammar, result)
+        children.extend([tree.get_child(i)
+                         for i in range(tree.num_children())])
+        # the tokenizer ends every shard with a NEWLINE and the ENDMARKER,
+        # only the last ones are in the source
+        del children[-2:]
+    children.append(tree.get_child(tree.num_children() - 2))
+    children.append(tree.get_child(tree.num_children() - 1))
+    return parser.Nonterminal(grammar, tree.type, children)
+
+
+def _split(python_parser, textsrc, compile_info, processes):
+    """Return the arguments of _parse_shard for the shards of textsrc, or
+    None if it should be parsed sequentially."""
+    from syntaxerrors import pyparse
+    if (processes < 2 or len(textsrc) < 2 * MIN_SHARD_SIZE or
+            compile_info.mode != "exec" or
+            compile_info.flags & astconsts.PyCF_DONT_IMPLY_DEDENT or
+            python_parser.flat_tree or python_parser.collapse_chains or
+            python_parser.builder is not None):
+        return None
+    num_shards = min(processes, len(textsrc) // MIN_SHARD_SIZE)
+    # tokenize the beginning, as far as needed to find the future imports
+    python_parser.prepare(pyparse._targets["exec"])
+    tokens = pytokenizer.iter_tokens(
+        pyparse._source_lines(io.BytesIO(textsrc)), 0)
+    try:
+        python_parser._select_grammar(pyparse._BufferedTokens(tokens),
+                                      compile_info)
+    except (error.TokenError, error.TokenIndentationError):
+        return None
+    start = textsrc.rfind(b"__future__")
+    cut_points = find_cut_points(textsrc, num_shards, start + 1)
+    if not cut_points:
+        return None
+    print_function = python_parser.grammar is pygram.python_grammar_no_print
+    offsets = [0] + cut_points + [len(textsrc)]
+    shards = []
+    lineno = 1
+    for i in range(len(offsets) - 1):
+        chunk = textsrc[offsets[i]:offsets[i + 1]]
+        next_lineno = lineno + chunk.count(b"\n")
+        if i == len(offsets) - 2:
+            next_lineno = 0
+        shards.append((chunk, lineno, next_lineno, print_function,
+                       python_parser.build_tree))
+        lineno = next_lineno
+    return shards
+
+
+def _parse_shard(args):
+    """Parse a shard in a worker. Returns the arrays of the flat tree and
+    the values, line numbers and columns of its tokens, True if no tree is
+    built, or None if the shard doesn't parse on its own."""
+    from syntaxerrors import pyparse
+    chunk, lineno, next_lineno, print_function, build_tree = args
+    if print_function:
+        grammar = pygram.python_grammar_no_print
+    else:
+        grammar = pygram.python_grammar
+    flags = pyparse.source_flags(chunk, 0)
+    try:
+        tokens = pytokenizer.generate_source_tokens(
+            chunk, flags, lineno=lineno, labels=pygram.token_labels)
+    except (error.TokenError, error.TokenIndentationError):
+        return None
+    if next_lineno:
+        _move_final_dedents(tokens, next_lineno)
+    shard_parser = parser.Parser(grammar, build_tree=build_tree,
+                                 first_error_only=True, flat_tree=build_tree)
+    shard_parser.prepare(grammar.symbol_ids["file_input"])
+    try:
+        shard_parser.add_tokens(tokens)
+    except parser.ParseError:
+        return None
+    if not build_tree:
+        return True
+    tree = shard_parser.root.tree
+    tokens = tree.tokens
+    return (tree.types, tree.counts, [token.value for token in tokens],
+            [token.lineno for token in tokens],
+            [token.column for token in tokens])
+
+
+def _build_tree(grammar, result):
+    """Build the Node tree from the result of _parse_shard."""
+    types, counts, values, linenos, columns = result
+    stack = []
+    token_index = 0
+    for i in range(len(types)):
+        count = counts[i]
+        if count == 0:
+            stack.append(parser.Terminal(grammar, types[i],
+                                         values[token_index],
+                                         linenos[token_index],
+                                         columns[token_index]))
+            token_index += 1
+        elif count == 1:
+            stack[-1] = parser.Nonterminal1(grammar, types[i], stack[-1])
+        else:
+            children = stack[-count:]
+            del stack[-count:]
+            stack.append(parser.Nonterminal(grammar, types[i], children))
+    return stack[0]
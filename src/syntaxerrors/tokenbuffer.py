@@ -0,0 +1,167 @@
+"""
+Compact storage for the tokens of a source file.
+
+A TokenBuffer stores every token as one entry in a couple of parallel arrays
+instead of as a parser.Token instance. The token values live back to back in
+one shared bytearray, every distinct source line is stored once (or only
+its index, if the lines are in a linetable.LineTable). Indexing a
+buffer gives a lightweight TokenView that behaves like a Token, so the buffer
+can be passed to Parser.add_tokens and recovery.try_recover in place of a list
+of tokens.
+"""
+
+from array import array
+
+from syntaxerrors.parser import Token
+
+
+class TokenBuffer(object):
+
+    def __init__(self, lines=None):
+        self.token_types = array("B")
+        # offsets of the utf-8 encoded value in self.text
+        self.starts = array("i")
+        self.ends = array("i")
+        self.linenos = array("i")
+        self.columns = array("i")
+        # indexes into self.lines
+        self.line_indexes = array("i")
+        # label_index in the grammar, -1 until the token was classified
+        self.label_indexes = array("h")
+        self.text = bytearray()
+        # the lines are added by append_token, unless a LineTable is given
+        self.line_table = lines is not None
+        if lines is None:
+            lines = []
+        self.lines = lines
+        self._last_line = None
+
+    def append_token(self, token_type, value, lineno, column, line):
+        """Add a token. Has the signature pytokenizer.iter_tokens expects
+        from make_token. If the buffer has a LineTable, line is the index
+        of the line in it, like pytokenizer.iter_source_tokens passes it."""
+        start = len(self.text)
+        self.text += value
+        self.token_types.append(token_type)
+        self.starts.append(start)
+        self.ends.append(len(self.text))
+        self.linenos.append(lineno)
+        self.columns.append(column)
+        if self.line_table:
+            self.line_indexes.append(line)
+        else:
+            if line is not self._last_line:
+                self._last_line = line
+                self.lines.append(line)
+            self.line_indexes.append(len(self.lines) - 1)
+        self.label_indexes.append(-1)
+
+    def append(self, token):
+        """Add a Token instance."""
+        line = token.line
+        if self.line_table:
+            line = self.lines.add_text(line)
+        self.append_token(token.token_type, token.value.encode("utf-8"),
+                          token.lineno, token.column, line)
+
+    def __len__(self):
+        return len(self.token_types)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.token_types)
+        if not 0 <= index < len(self.token_types):
+            raise IndexError(index)
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.token_types)):
+            yield TokenView(self, index)
+
+    def get_value(self, index):
+        return self.text[self.starts[index]:self.ends[index]].decode("utf-8")
+
+    def get_line(self, index):
+        return self.lines[self.line_indexes[index]]
+
+    def token(self, index):
+        """Materialize the token at index as a Token instance."""
+        token = Token(self.token_types[index], self.get_value(index),
+                      self.linenos[index], self.columns[index],
+                      self.get_line(index))
+        token.label_index = self.label_indexes[index]
+        return token
+
+    def tokens(self):
+        """Materialize all the tokens as a list of Token instances."""
+        return [self.token(index) for index in range(len(self.token_types))]
+
+
+class TokenView(object):
+    """A reference to one token in a TokenBuffer, with the interface of
+    parser.Token."""
+
+    __slots__ = ("buffer", "index", "grammar")
+
+    # the buffer doesn't store the labels of tokenlabels.TokenLabels
+    labels = None
+
+    def __init__(self, buffer, index):
+        self.buffer = buffer
+        self.index = index
+        self.grammar = None
+
+    @property
+    def token_type(self):
+        return self.buffer.token_types[self.index]
+
+    @property
+    def value(self):
+        return self.buffer.get_value(self.index)
+
+    @property
+    def lineno(self):
+        return self.buffer.linenos[self.index]
+
+    @property
+    def column(self):
+        return self.buffer.columns[self.index]
+
+    @property
+    def line(self):
+        return self.buffer.get_line(self.index)
+
+    @property
+    def lines(self):
+        return self.buffer.lines
+
+    @property
+    def line_index(self):
+        return self.buffer.line_indexes[self.index]
+
+    def _get_label_index(self):
+        return self.buffer.label_indexes[self.index]
+
+    def _set_label_index(self, label_index):
+        self.buffer.label_indexes[self.index] = label_index
+
+    label_index = property(_get_label_index, _set_label_index)
+
+    def __repr__(self):
+        if self.grammar is None:
+            return "Token(%s, %r)" % (self.token_type, self.value)
+        return "Token(%s, %r)" % (self.grammar.TOKEN_NAMES[self.token_type],
+                                  self.value)
+
+    def __eq__(self, other):
+        # for tests
+        return (
+            self.token_type == other.token_type and
+            self.value == other.value and
+            self.lineno == other.lineno and
+            self.column == other.column and
+            self.line == other.line
+        )
+
+    def __ne__(self, other):
+        return not self == other
@@ -0,0 +1,58 @@
+"""
+Classifying the tokens while tokenizing.
+
+Grammar.classify finds the label of a token with dict lookups. A TokenLabels
+does that work once per NAME value and once per token type, for several
+variants of a grammar at the same time, e.g. python_grammar and
+python_grammar_no_print, which only disagree about print. The tokenizer
+attaches the labels of all the variants to every token, classify then only
+has to index them with the label_slot of its grammar. The NAME values are
+interned: all the tokens with the same name share one string, also across
+the sources parsed with the same TokenLabels, e.g. all the files of a batch.
+The table of names is cleared when it gets bigger than MAX_NAMES, so that
+long running processes don't keep every name they ever saw.
+"""
+
+# the number of entries of TokenLabels.names (two per name that was seen as
+# bytes and as text) after which it is cleared
+MAX_NAMES = 20000
+
+
+class TokenLabels(object):
+
+    def __init__(self, grammars):
+        self.grammars = grammars
+        for slot, grammar in enumerate(grammars):
+            grammar.label_slot = slot
+        self.keyword_token = grammars[0].KEYWORD_TOKEN
+        # NAME value (bytes or text) -> (value as text, labels)
+        self.names = {}
+        # token type -> labels, None for the types that no grammar knows
+        self.types = [None] * (max(grammars[0].TOKEN_NAMES) + 1)
+        for token_type in range(len(self.types)):
+            labels = tuple([grammar.token_ids.get(token_type, -1)
+                            for grammar in grammars])
+            if labels.count(-1) != len(labels):
+                self.types[token_type] = labels
+
+    def add_name(self, value):
+        """Compute the entry of self.names for the NAME value, a text or a
+        utf-8 encoded byte string."""
+        text = value
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+        labels = []
+        for grammar in self.grammars:
+            label_index = grammar.keyword_ids.get(text, -1)
+            if label_index == -1:
+                label_index = grammar.token_ids.get(self.keyword_token, -1)
+            labels.append(label_index)
+        if len(self.names) >= MAX_NAMES:
+            # the tokenizer keeps a reference to the dict, so clear it
+            self.names.clear()
+        # the text of both spellings of the name is the same string
+        entry = self.names.get(text)
+        if entry is None:
+            entry = self.names[text] = (text, tuple(labels))
+        self.names[value] = entry
+        return entry
@@ -0,0 +1,132 @@
+import ast
+import sys
+
+import pytest
+
+from syntaxerrors import pyparse, astbuilder, astconsts
+from syntaxerrors.error import SyntaxError
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 9),
+                                reason="needs the ast of Python >= 3.9")
+
+UNICODE = astconsts.CO_FUTURE_UNICODE_LITERALS
+PY3_FUTURES = UNICODE | astconsts.CO_FUTURE_PRINT_FUNCTION
+
+
+def parse_to_ast(source, flags=0, mode="exec", **kwargs):
+    info = pyparse.CompileInfo("<test>", mode, flags)
+    return pyparse.PythonParser(**kwargs).parse_to_ast(source, info)
+
+def positions(tree):
+    return [(type(node).__name__, getattr(node, "lineno", None),
+             getattr(node, "col_offset", None)) for node in ast.walk(tree)]
+
+def check_same(source, flags=PY3_FUTURES):
+    tree = parse_to_ast(source.encode("utf-8"), flags)
+    expected = ast.parse(source)
+    assert ast.dump(tree) == ast.dump(expected)
+    assert positions(tree) == positions(expected)
+    compile(tree, "<test>", "exec")
+
+
+@pytest.mark.parametrize("source", [
+    "x = 1\n",
+    "a, b = c, d = f(1, *a, **k)\n",
+    "del a, b\ndel (a, b)\ndel x[1], y.z\n",
+    "x[1:2, ::3, ...]\nx[a,]\nx[:]\nx[a:b:c]\n",
+    "def f(a, b=1, *c, **d):\n    return lambda x=1: (yield)\n",
+    "class A(B, C):\n    @d.e(1)\n    @f\n    def f(self): pass\nclass B: pass\n",
+    "if a: pass\nelif b: pass\nelif c:\n    x\nelse: y\n",
+    "try:\n    pass\nexcept E as e:\n    pass\nexcept:\n    pass\n"
+    "else: x\nfinally: y\n",
+    "try:\n    pass\nfinally:\n    y\n",
+    "with a as b, c: pass\n",
+    "for x, y in z: pass\nelse: pass\nwhile 1: break\nelse: pass\n",
+    "import a.b as c, d\nfrom . import x\nfrom ..a.b import (c as d, e,)\n"
+    "from m import *\n",
+    "global a, b\nassert x, y\nraise\nraise E\n",
+    "x = [i for i in a if i if j for j in k]\n",
+    "x = {a: b for a in c}; y = {a for a in b}; z = {1, 2}\n"
+    "w = {1: 2, 3: 4}; v = {}\n",
+    "f(x for x in y)\nf((x for x in y), 1)\n",
+    "x = (1, 2); y = ((1, 2)); z = (); w = 1,\n",
+    "a if b else c\nnot a and b or c and d\na < b <= c is not d not in e\n",
+    "-a ** -b + c * d // e % f | g ^ h & i << j >> k\n",
+    "x += 1; y[0] -= 2; z.a **= 3\n",
+    "x = 0x1f + 10 + 1.5 + 1e3 + 2j + .5 + 0o17\n",
+    "x = b'a\\n' + b'c'\nx = u'a\\u1234' u'b'\nx = 'a' \"b\" '''c'''\n",
+    "x = a.b[c](d)(e=1)\n(a).b\n(a + b) * c\n((a), b) = c\n",
+    "def f():\n    yield 1\n    x = yield\n",
+    "print(1, 2)\n",
+    "x = None, True, False\n",
+])
+def test_same_as_ast_parse(source):
+    check_same(source)
+
+def test_python2_literals():
+    tree = parse_to_ast(b"x = 010 + 10L + 0xfL\n")
+    assert ast.dump(tree) == ast.dump(ast.parse("x = 8 + 10 + 15\n"))
+    tree = parse_to_ast(b"x = 'a\\n' + u'\\xe4' + ur'\\u1234\\n' + r'\\n'\n")
+    expected = ast.parse("x = b'a\\n' + u'\\xe4' + u'\\u1234\\\\n' + b'\\\\n'\n")
+    assert ast.dump(tree) == ast.dump(expected)
+    tree = parse_to_ast(b"x = 'a'\n", UNICODE)
+    assert ast.dump(tree) == ast.dump(ast.parse("x = 'a'\n"))
+
+def test_python2_syntax_with_equivalent():
+    tree = parse_to_ast(b"try:\n    a <> b\nexcept E, e:\n    pass\n")
+    expected = ast.parse("try:\n    a != b\nexcept E as e:\n    pass\n")
+    assert ast.dump(tree) == ast.dump(expected)
+
+@pytest.mark.parametrize("source, lineno", [
+    (b"print 1\n", 1),
+    (b"x = 1\nexec 'x'\n", 2),
+    (b"x = `1`\n", 1),
+    (b"def f(a, (b, c)):\n    pass\n", 1),
+    (b"raise E, 1\n", 1),
+    (b"try:\n    pass\nexcept E, e.x:\n    pass\n", 3),
+    (b"f() = 1\n", 1),
+    (b"x + 1 += 1\n", 1),
+    (b"del f()\n", 1),
+    (b"f(a=1, b)\n", 1),
+    (b"def f(a=1, b):\n    pass\n", 1),
+])
+def test_unsupported(source, lineno):
+    with pytest.raises(SyntaxError) as excinfo:
+        parse_to_ast(source)
+    assert excinfo.value.lineno == lineno
+
+def test_modes():
+    tree = parse_to_ast(b"1 + 2", mode="eval")
+    assert ast.dump(tree) == ast.dump(ast.parse("1 + 2", mode="eval"))
+    tree = parse_to_ast(b"x = 1\n", mode="single")
+    assert ast.dump(tree) == ast.dump(ast.parse("x = 1\n", mode="single"))
+
+def test_same_as_tree_to_ast():
+    source = b"""\
+import os
+
+def f(a, b=1, *args):
+    if a:
+        return [x for x in b]
+    return a.b.c(1, 2)
+
+class A(object):
+    x = f(1, 2) + (3)
+"""
+    tree = parse_to_ast(source)
+    info = pyparse.CompileInfo("<test>", "exec")
+    converted = astbuilder.tree_to_ast(
+            pyparse.PythonParser().parse_source(source, info), info)
+    assert ast.dump(converted) == ast.dump(tree)
+    assert positions(converted) == positions(tree)
+    compact = parse_to_ast(source, compact_tokens=True)
+    assert ast.dump(compact) == ast.dump(tree)
+    assert positions(compact) == positions(tree)
+
+def test_parser_still_builds_trees():
+    python_parser = pyparse.PythonParser()
+    info = pyparse.CompileInfo("<test>", "exec")
+    python_parser.parse_to_ast(b"x = 1\n", info)
+    info = pyparse.CompileInfo("<test>", "exec")
+    tree = python_parser.parse_source(b"x = 1\n", info)
+    assert tree.type == pyparse.pygram.syms.file_input
@@ -0,0 +1,86 @@
+import six
+
+from syntaxerrors import batch, error
+
+
+def make_files(tmpdir):
+    tmpdir.join("good.py").write("x = 1\n")
+    sub = tmpdir.mkdir("sub")
+    sub.join("bad.py").write("x = 1\ny = = 2\n")
+    sub.join("twice.py").write("if x\n    pass\nx = 1\nif y\n    pass\n")
+    sub.join("notes.txt").write("not python")
+    return sorted(batch.find_python_files([str(tmpdir)]))
+
+def test_find_python_files(tmpdir):
+    filenames = make_files(tmpdir)
+    assert [f[len(str(tmpdir)):] for f in filenames] == [
+        "/good.py", "/sub/bad.py", "/sub/twice.py"]
+
+def test_check_source():
+    result = batch.check_source(b"x = 1\n", "a.py")
+    assert result.ok()
+    assert result.size == 6
+    result = batch.check_source(b"if x\n    pass\nx = 1\nif y\n    pass\n",
+                                "a.py")
+    assert not result.ok()
+    assert [e.lineno for e in result.errors] == [1, 4]
+    assert [e.filename for e in result.errors] == ["a.py", "a.py"]
+
+def test_check_source_token_error():
+    result = batch.check_source(b"x = (1,\n", "a.py")
+    [e] = result.errors
+    assert e.msg == "parenthesis is never closed"
+    assert e.tokens is None
+
+def test_check_source_internal_error(monkeypatch):
+    from syntaxerrors import pyparse
+    def parse_source(self, source, info):
+        assert 0, "no recovery found!"
+    monkeypatch.setattr(pyparse.PythonParser, "parse_source", parse_source)
+    result = batch.check_source(b"x = 1\n", "a.py")
+    assert not result.ok()
+    assert result.errors == []
+    assert result.internal_error.startswith("AssertionError: no recovery")
+    stats = batch.BatchStats()
+    stats.add(result)
+    assert stats.failed_files == 1
+
+def test_check_file_missing(tmpdir):
+    result = batch.check_file(str(tmpdir.join("missing.py")))
+    assert not result.ok()
+    assert result.read_error is not None
+
+def check_results(filenames, results):
+    assert [r.filename for r in results] == filenames
+    good, bad, twice = results
+    assert good.ok()
+    assert len(bad.errors) == 1
+    assert isinstance(bad.errors[0], error.SyntaxError)
+    assert bad.errors[0].lineno == 2
+    assert [e.lineno for e in twice.errors] == [1, 4]
+
+def test_check_files_in_process(tmpdir):
+    filenames = make_files(tmpdir)
+    check_results(filenames, list(batch.check_files(filenames, processes=1)))
+
+def test_check_files_pool(tmpdir):
+    filenames = make_files(tmpdir)
+    results = list(batch.check_files(filenames, processes=2, chunksize=1))
+    check_results(filenames, results)
+
+def test_main(tmpdir):
+    make_files(tmpdir)
+    out = six.StringIO()
+    assert batch.main(["-j", "1", str(tmpdir)], out) == 1
+    lines = out.getvalue().splitlines()
+    assert lines[0].endswith("bad.py:2:5: invalid syntax")
+    assert lines[-1].startswith("3 files (2 with errors, 3 errors)")
+    out = six.StringIO()
+    assert batch.main(["-q", str(tmpdir.join("good.py"))], out) == 0
+    assert out.getvalue() == ""
+
+def test_first_error_only(tmpdir):
+    filenames = make_files(tmpdir)
+    results = list(batch.check_files(filenames, processes=1,
+                                     first_error_only=True))
+    assert [len(r.errors) for r in results] == [0, 1, 1]
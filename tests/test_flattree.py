@@ -0,0 +1,68 @@
+import pytest
+
+from syntaxerrors import pyparse, parser, flattree
+from syntaxerrors.error import SyntaxError, MultipleSyntaxErrors
+from syntaxerrors.tokenbuffer import TokenBuffer
+
+source = b"""\
+import os
+
+def f(a, b=1, *args):
+    if a:
+        return [x for x in b]
+    return a.b.c(1, 2)
+
+class A(object):
+    x = f(1, 2) + 3
+"""
+
+def parse(source, **kwargs):
+    info = pyparse.CompileInfo("<test>", "exec")
+    return pyparse.PythonParser(**kwargs).parse_source(source, info)
+
+def compare(node, flat):
+    assert flat.type == node.type
+    assert flat.num_children() == node.num_children()
+    assert flat.get_value() == node.get_value()
+    assert flat.get_lineno() == node.get_lineno()
+    assert flat.get_column() == node.get_column()
+    for i in range(node.num_children()):
+        compare(node.get_child(i), flat.get_child(i))
+
+@pytest.mark.parametrize("compact_tokens", [False, True])
+def test_same_as_tree(compact_tokens):
+    tree = parse(source)
+    flat = parse(source, flat_tree=True, compact_tokens=compact_tokens)
+    assert isinstance(flat, flattree.FlatNode)
+    assert flat == tree
+    assert flat.to_node() == tree
+    compare(tree, flat)
+    if compact_tokens:
+        assert isinstance(flat.tree.tokens, TokenBuffer)
+    else:
+        assert isinstance(flat.tree.tokens, list)
+
+def test_postorder():
+    flat = parse(b"x = 1\n", flat_tree=True)
+    tree = flat.tree
+    assert flat.index == len(tree) - 1
+    assert tree.sizes[flat.index] == len(tree)
+    # the first node is the first terminal
+    assert tree.token_indexes[0] == 0
+    assert tree.tokens[0].value == u"x"
+    for index in range(len(tree)):
+        node = tree.node(index)
+        if node.is_terminal():
+            assert node.num_children() == 0
+        else:
+            assert node.get_child(-1).index == index - 1
+            assert tree.sizes[index] == 1 + sum(
+                [tree.sizes[child] for child in node.children_indexes()])
+
+def test_errors():
+    with pytest.raises(SyntaxError) as excinfo:
+        parse(b"x = = 1\n", flat_tree=True)
+    assert excinfo.value.lineno == 1
+    with pytest.raises(MultipleSyntaxErrors) as excinfo:
+        parse(b"if x\n    pass\nx = 1\nif y\n    pass\n", flat_tree=True)
+    assert [e.lineno for e in excinfo.value.errors] == [1, 4]
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from syntaxerrors import genparser, metaparser, parser, pygram, pyparse
+from syntaxerrors.error import SyntaxError, MultipleSyntaxErrors
+
+from tests.test_metaparser import MyGrammar
+from tests.test_parser import SimpleParser
+
+source = b"""\
+import os
+
+def f(a, b=1, *args):
+    if a:
+        return [x for x in b if x]
+    return a.b.c(1, 2) ** -3
+
+class A(object):
+    x = f(1, 2) + `3`
+    print >> x, 1,
+"""
+
+bad_source = b"""\
+def f(a, b=1 *args):
+    x = = 1
+    return a.b.c(1, 2
+class A(object):
+    x f(1, 2)
+"""
+
+
+@pytest.fixture
+def interpreted(monkeypatch):
+    for grammar in (pygram.python_grammar, pygram.python_grammar_no_print):
+        monkeypatch.setattr(grammar, "generated_add_token", None)
+
+
+def parse(source):
+    info = pyparse.CompileInfo("<test>", "exec")
+    try:
+        return pyparse.PythonParser().parse_source(source, info)
+    except MultipleSyntaxErrors as e:
+        return [(e.lineno, e.offset, e.msg) for e in e.errors]
+    except SyntaxError as e:
+        return [(e.lineno, e.offset, e.msg)]
+
+def test_generated_module_is_current():
+    here = os.path.dirname(pygram.__file__)
+    with open(os.path.join(here, "data", "Grammar2.7"), "rb") as f:
+        key = genparser.grammar_key(pygram.PythonGrammar, f.read())
+    with open(os.path.join(here, "parser_generated.py")) as f:
+        generated = f.read()
+    assert generated == genparser.generate(pygram.python_grammar, key)
+    assert pygram.python_grammar.generated_add_token is not None
+    assert pygram.python_grammar_no_print.generated_add_token is not None
+
+@pytest.mark.parametrize("source", [source, bad_source])
+def test_same_as_interpreted(source, request):
+    generated = parse(source)
+    request.getfixturevalue("interpreted")
+    assert parse(source) == generated
+
+def test_small_grammar():
+    gram = b"""foo: NAME bar STRING NEWLINE+ ENDMARKER
+bar: NAME [bar] NUMBER\n"""
+    g = metaparser.ParserGenerator(gram).build_grammar(MyGrammar)
+    p = SimpleParser(g)
+    input = b"hi hello a_name 32 42 'string'"
+    expected = p.parse(input)
+    with pytest.raises(parser.SingleParseError) as excinfo:
+        p.parse(b"hi hello 42 42 'string'")
+    expected_error = excinfo.value
+
+    d = {}
+    exec(genparser.generate(g, "test"), d)
+    assert d["GRAMMAR_KEY"] == "test"
+    g.generated_add_token = d["build"](g.dfas)
+    assert p.parse(input) == expected
+    with pytest.raises(parser.SingleParseError) as excinfo:
+        p.parse(b"hi hello 42 42 'string'")
+    assert excinfo.value.token == expected_error.token
+    assert excinfo.value.expected == expected_error.expected
+
+def test_not_installed_for_other_numbering():
+    here = os.path.dirname(pygram.__file__)
+    path = os.path.join(here, "data", "Grammar2.7")
+    with open(path, "rb") as f:
+        gram_source = f.read()
+    g = metaparser.ParserGenerator(gram_source).build_grammar(
+        pygram.PythonGrammar)
+    assert genparser.install(g, path)
+    g = metaparser.ParserGenerator(gram_source).build_grammar(
+        pygram.PythonGrammar)
+    # the same grammar, with two labels numbered the other way round
+    g.labels[1], g.labels[2] = g.labels[2], g.labels[1]
+    assert not genparser.install(g, path)
+    assert g.generated_add_token is None
@@ -0,0 +1,60 @@
+import os
+
+from syntaxerrors import grammarcache, pygram, parser
+
+
+grammar_path = os.path.join(os.path.dirname(pygram.__file__), "data", "Grammar2.7")
+
+def test_roundtrip():
+    gram = pygram.python_grammar
+    s = grammarcache.dumps(gram, "key")
+    new = grammarcache.loads(pygram.PythonGrammar, s, "key")
+    assert new.start == gram.start
+    assert new.symbol_ids == gram.symbol_ids
+    assert new.symbol_names == gram.symbol_names
+    assert new.labels == gram.labels
+    assert new.token_to_error_string == gram.token_to_error_string
+    assert len(new.dfas) == len(gram.dfas)
+    for dfa, newdfa in zip(gram.dfas, new.dfas):
+        assert newdfa.grammar is new
+        assert newdfa.symbol_id == dfa.symbol_id
+        assert [(list(arcs), final) for arcs, final in newdfa.states] == \
+                [(list(arcs), final) for arcs, final in dfa.states]
+        assert newdfa.first == dfa.first
+        assert newdfa.action_base == dfa.action_base
+    assert len(new.actions) == len(gram.actions)
+    for entry, newentry in zip(gram.actions, new.actions):
+        assert entry[:2] == newentry[:2]
+        if entry[0] == parser.REDUCE:
+            assert [(state, dfa.symbol_id) for state, dfa in entry[2]] == \
+                    [(state, dfa.symbol_id) for state, dfa in newentry[2]]
+            assert newentry[2][0][1] in new.dfas
+
+def test_stale_key():
+    s = grammarcache.dumps(pygram.python_grammar, "key")
+    assert grammarcache.loads(pygram.PythonGrammar, s, "otherkey") is None
+    assert grammarcache.loads(pygram.PythonGrammar, b"garbage", "key") is None
+
+def test_load_grammar_writes_cache(tmpdir):
+    cachedir = tmpdir.join("cache")
+    gram = grammarcache.load_grammar(
+        pygram.PythonGrammar, grammar_path, [str(cachedir)])
+    filename = cachedir.join(grammarcache.cache_filename(grammar_path))
+    assert filename.check()
+    cached = grammarcache.load_grammar(
+        pygram.PythonGrammar, grammar_path, [str(cachedir)])
+    assert cached.symbol_ids == gram.symbol_ids
+    assert cached.labels == gram.labels
+
+def test_unwritable_dir_falls_back(tmpdir):
+    notadir = tmpdir.join("file")
+    notadir.write("")
+    cachedir = tmpdir.join("cache")
+    grammarcache.load_grammar(
+        pygram.PythonGrammar, grammar_path, [str(notadir), str(cachedir)])
+    assert cachedir.join(grammarcache.cache_filename(grammar_path)).check()
+
+def test_source_hash_depends_on_source():
+    key1 = grammarcache.source_hash(pygram.PythonGrammar, b"foo: NAME\n")
+    key2 = grammarcache.source_hash(pygram.PythonGrammar, b"foo: NUMBER\n")
+    assert key1 != key2
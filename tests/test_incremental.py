@@ -0,0 +1,165 @@
+import pytest
+
+from syntaxerrors import pyparse, parser, incremental
+from syntaxerrors.error import SyntaxError
+
+source = b"""\
+# some module
+import os
+
+x = 1
+
+def f(a, b):
+    if a:
+        return b
+    return [a,
+            b]
+
+class A(object):
+    def method(self):
+        '''docstring
+        '''
+        pass
+
+y = f(x, 2)
+print y
+"""
+
+def leaves(node, result=None):
+    if result is None:
+        result = []
+    if isinstance(node, parser.Terminal):
+        result.append((node.type, node.value, node.lineno, node.column))
+    else:
+        for i in range(node.num_children()):
+            leaves(node.get_child(i), result)
+    return result
+
+def nodes(node, result=None):
+    if result is None:
+        result = []
+    kind = type(node)
+    if kind is incremental.ShiftedNonterminal:
+        kind = parser.Nonterminal
+    result.append((kind, node.type, getattr(node, "chain", None)))
+    for i in range(node.num_children()):
+        nodes(node.get_child(i), result)
+    return result
+
+def full_parse(source):
+    info = pyparse.CompileInfo("<test>", "exec")
+    return pyparse.PythonParser().parse_source(source, info)
+
+def edit(source, old, new):
+    start = source.index(old)
+    result = pyparse.PythonParser().parse_incremental(
+        source, pyparse.CompileInfo("<test>", "exec"))
+    p = pyparse.PythonParser()
+    new_result = p.reparse(result, start, start + len(old), new)
+    expected_source = source.replace(old, new, 1)
+    assert new_result.source == expected_source
+    expected = full_parse(expected_source)
+    assert new_result.tree == expected
+    assert leaves(new_result.tree) == leaves(expected)
+    return result, new_result
+
+def test_edit_in_body():
+    result, new_result = edit(source, b"return b", b"return b + 1")
+    assert new_result.reparsed == (6, 11)
+    # the statements before and after are reused
+    assert new_result.tree.get_child(0) is result.tree.get_child(0)
+    assert new_result.tree.get_child(4) is result.tree.get_child(4)
+
+def test_add_lines():
+    result, new_result = edit(source, b"        pass\n", b"        pass\n        x = 2\n\n")
+    assert new_result.reparsed[0] == 12
+    assert new_result.tree.get_child(1) is result.tree.get_child(1)
+
+def test_shifted_statements_are_not_copied():
+    p = pyparse.PythonParser()
+    result = p.parse_incremental(source, pyparse.CompileInfo("<test>", "exec"))
+    start = source.index(b"    return [a,")
+    new_result = p.reparse(result, start, start, b"    z = 0\n\n")
+    # stmt -> compound_stmt -> classdef
+    shifted = new_result.tree.get_child(3).get_child(0).get_child(0)
+    assert isinstance(shifted, incremental.ShiftedNonterminal)
+    assert shifted.node is result.tree.get_child(3).get_child(0).get_child(0)
+    assert shifted.get_lineno() == 14
+    assert shifted._children is None
+    # another edit that adds lines only adds up the deltas
+    start = new_result.source.index(b"    z = 0")
+    newer = p.reparse(new_result, start, start, b"    w = 0\n")
+    assert newer.tree.get_child(3).get_child(0).get_child(0).delta == 3
+    assert shifted._children is None
+    expected = full_parse(newer.source)
+    assert newer.tree == expected
+    assert leaves(newer.tree) == leaves(expected)
+
+def test_remove_lines():
+    edit(source, b"    if a:\n        return b\n", b"")
+
+def test_new_statement():
+    edit(source, b"x = 1\n", b"x = 1\nz = 3\n")
+
+def test_edit_merges_statements():
+    # the class becomes part of the body of f
+    start = source.index(b"class A")
+    end = source.index(b"y = f")
+    block = source[start:end]
+    indented = b"".join([b"    " + line if line.strip() else line
+                         for line in block.splitlines(True)])
+    result, new_result = edit(source, block, indented)
+    assert new_result.tree.num_children() == 7
+
+def test_edit_at_start():
+    result, new_result = edit(source, b"# some module", b"import sys")
+    assert new_result.reparsed == (1, 19)
+
+def test_edit_at_end():
+    edit(source, b"print y\n", b"print y, 1\n")
+    edit(source, b"print y\n", b"")
+
+def test_syntax_error():
+    result = pyparse.PythonParser().parse_incremental(
+        source, pyparse.CompileInfo("<test>", "exec"))
+    start = source.index(b"return b")
+    with pytest.raises(SyntaxError):
+        pyparse.PythonParser().reparse(result, start, start + 1, b"")
+
+def test_validate_only():
+    p = pyparse.PythonParser(build_tree=False)
+    result = p.parse_incremental(source, pyparse.CompileInfo("<test>", "exec"))
+    assert result.tree is None
+    start = source.index(b"return b")
+    new_result = p.reparse(result, start, start + len(b"return b"),
+                           b"return b + 1")
+    assert new_result.tree is None
+    with pytest.raises(SyntaxError):
+        p.reparse(new_result, start, start + 1, b"")
+    # a tree from another parser is not reused either
+    result = pyparse.PythonParser().parse_incremental(
+        source, pyparse.CompileInfo("<test>", "exec"))
+    new_result = p.reparse(result, start, start + 1, b"r")
+    assert new_result.tree is None
+
+@pytest.mark.parametrize("options", [{"collapse_chains": True},
+                                     {"lalr": True}])
+def test_parser_options(options):
+    p = pyparse.PythonParser(**options)
+    result = p.parse_incremental(source, pyparse.CompileInfo("<test>", "exec"))
+    for old, new in [(b"return b", b"return b + 1"),
+                     (b"        pass\n", b"        pass\n        x = 2\n\n")]:
+        start = source.index(old)
+        new_result = p.reparse(result, start, start + len(old), new)
+        assert new_result.reparsed != (1, 19)
+        expected = p.parse_source(source.replace(old, new, 1),
+                                  pyparse.CompileInfo("<test>", "exec"))
+        assert nodes(new_result.tree) == nodes(expected)
+        assert leaves(new_result.tree) == leaves(expected)
+
+def test_flat_tree():
+    p = pyparse.PythonParser(flat_tree=True)
+    result = p.parse_incremental(source, pyparse.CompileInfo("<test>", "exec"))
+    start = source.index(b"return b")
+    new_result = p.reparse(result, start, start + 1, b"r")
+    assert new_result.reparsed == (1, 19)
@@ -0,0 +1,133 @@
+import io
+
+import pytest
+
+from syntaxerrors import lazy, parser, pygram, pyparse
+from syntaxerrors.error import SyntaxError, MultipleSyntaxErrors
+
+source = b"""\
+import os
+
+@decorator
+def f(a, b=1, *args):
+    if a:
+        def g():
+            return [x for x in b if x]
+        return g
+    return a.b.c(1, 2) ** -3
+
+class A(object):
+    x = f(1, 2) + `3`
+    def m(self): return 1
+    class B:
+        pass
+
+if os:
+    def h():
+        pass
+"""
+
+bad_source = b"""\
+import os
+def f(a):
+    x = = 1
+class A(object):
+    def m(self):
+        x f(1, 2)
+"""
+
+
+def parse(source, **kwargs):
+    info = pyparse.CompileInfo("<test>", "exec")
+    return pyparse.PythonParser(**kwargs).parse_source(source, info)
+
+def errors(e):
+    if isinstance(e, MultipleSyntaxErrors):
+        return [(e.lineno, e.offset, e.msg) for e in e.errors]
+    return [(e.lineno, e.offset, e.msg)]
+
+def lazy_suites(node):
+    if isinstance(node, lazy.LazySuite) and not node.is_parsed():
+        return [node]
+    if isinstance(node, parser.Terminal):
+        return []
+    result = []
+    for i in range(node.num_children()):
+        result.extend(lazy_suites(node.get_child(i)))
+    return result
+
+
+@pytest.mark.parametrize("lalr", [False, True])
+def test_same_tree(lalr):
+    tree = parse(source, lazy_bodies=True, lalr=lalr)
+    # f, A and h, the bodies in them are skipped when they are parsed
+    suites = lazy_suites(tree)
+    assert [suite.get_lineno() for suite in suites] == [4, 11, 18]
+    assert tree == parse(source, lalr=lalr)
+    assert [suite.get_lineno() for suite in lazy_suites(tree)] == []
+
+def test_nested_bodies_are_lazy():
+    tree = parse(source, lazy_bodies=True)
+    suite_f, suite_a, suite_h = lazy_suites(tree)
+    assert suite_f.get_child(0).type == pygram.tokens.NEWLINE
+    # g, and the class B in A, m has no indented body
+    assert [suite.get_lineno()
+            for suite in lazy_suites(suite_f.parse())] == [6]
+    assert [suite.get_lineno()
+            for suite in lazy_suites(suite_a.parse())] == [14]
+    assert not suite_h.is_parsed()
+
+def test_one_line_bodies_are_not_skipped():
+    tree = parse(b"def f(): pass\nclass A: x = 1\n", lazy_bodies=True)
+    assert lazy_suites(tree) == []
+    assert tree == parse(b"def f(): pass\nclass A: x = 1\n")
+
+@pytest.mark.parametrize("lalr", [False, True])
+def test_errors_in_bodies(lalr):
+    tree = parse(bad_source, lazy_bodies=True, lalr=lalr)
+    suite_f, suite_a = lazy_suites(tree)
+    with pytest.raises(SyntaxError) as excinfo:
+        suite_f.num_children()
+    assert errors(excinfo.value) == [(3, 9, "invalid syntax")]
+    # m is parsed fine, the error is in its body
+    suite_m, = lazy_suites(suite_a.parse())
+    with pytest.raises(SyntaxError) as excinfo:
+        suite_m.get_child(0)
+    assert errors(excinfo.value) == [(6, 11, "invalid syntax")]
+
+@pytest.mark.parametrize("first_error_only", [False, True])
+def test_check_bodies(first_error_only):
+    with pytest.raises((SyntaxError, MultipleSyntaxErrors)) as excinfo:
+        parse(bad_source, first_error_only=first_error_only)
+    expected = errors(excinfo.value)
+    with pytest.raises((SyntaxError, MultipleSyntaxErrors)) as excinfo:
+        parse(bad_source, lazy_bodies=True, check_bodies=True,
+              first_error_only=first_error_only)
+    assert errors(excinfo.value) == expected
+
+def test_errors_outside_bodies():
+    with pytest.raises(SyntaxError) as excinfo:
+        parse(b"def f(a b):\n    pass\n", lazy_bodies=True)
+    assert errors(excinfo.value) == [(1, 9, "invalid syntax (expected ')')")]
+    with pytest.raises(SyntaxError) as excinfo:
+        parse(b"def f():\npass\n", lazy_bodies=True)
+    assert excinfo.value.msg == "expected an indented block"
+
+def test_parse_lines_and_compact_tokens():
+    expected = parse(source)
+    info = pyparse.CompileInfo("<test>", "exec")
+    tree = pyparse.PythonParser(lazy_bodies=True).parse_lines(
+        io.BytesIO(source), info)
+    assert len(lazy_suites(tree)) == 3
+    assert tree == expected
+    tree = parse(source, lazy_bodies=True, compact_tokens=True)
+    assert len(lazy_suites(tree)) == 3
+    assert tree == expected
+
+def test_only_node_trees():
+    with pytest.raises(ValueError):
+        pyparse.PythonParser(lazy_bodies=True, flat_tree=True)
+    # checking the syntax only parses everything
+    assert parse(source, lazy_bodies=True, build_tree=False) is None
+    with pytest.raises(MultipleSyntaxErrors):
+        parse(bad_source, lazy_bodies=True, build_tree=False)
@@ -0,0 +1,68 @@
+import pytest
+
+from syntaxerrors import pyparse, pytokenizer
+from syntaxerrors.error import SyntaxError
+from syntaxerrors.linetable import LineTable
+
+
+def test_lines():
+    lines = LineTable(b"a = 1\n\nb = u'\xc3\xa4'\n")
+    assert lines.add(0) == 0
+    assert lines.add(7) == 1
+    assert lines.add_text(u"") == 2
+    assert len(lines) == 3
+    assert lines[1] == u"b = u'\xe4'\n"
+    assert lines[1] is lines[1]
+    assert lines[0] == u"a = 1\n"
+    assert lines[2] == u""
+
+def test_tokens_share_lines():
+    tks = pytokenizer.generate_source_tokens(
+        b"x = '''a\nb''' + c\ny\n", 0)
+    lines = tks[0].lines
+    assert all(token.lines is lines for token in tks)
+    assert [token.line_index for token in tks] == [0, 0, 1, 1, 1, 1, 2, 2,
+                                                    3, 4]
+    assert [lines[i] for i in range(len(lines))] == [
+        u"x = '''a\n", u"b''' + c\n", u"y\n", u"\n", u""]
+
+def test_error_text():
+    info = pyparse.CompileInfo("<test>", "exec")
+    error = pytest.raises(SyntaxError, pyparse.PythonParser().parse_source,
+                          b"x = 1\nif x\n    y\n", info)
+    e = error.value
+    assert isinstance(e.lines, LineTable)
+    assert e.text == u"if x\n"
+    e.text = u"changed"
+    assert e.lines is None
+    assert e.text == u"changed"
+
+def test_error_text_invalid_utf8():
+    lines = LineTable(b"x = 1\ny = '\xff'\n")
+    lines.add(0)
+    index = lines.add(6)
+    e = SyntaxError("invalid syntax", 2, 5, index, lines=lines)
+    assert e.text == u"y = '\ufffd'\n"
+    assert "y = '" in str(e)
+    import pickle
+    assert pickle.loads(pickle.dumps(e, 2)).text == e.text
+
+def test_pickle_error():
+    import pickle
+    from syntaxerrors.error import IndentationError, TokenError
+    source = b"x = 1\n" * 10000 + b"if x\n    y\n"
+    info = pyparse.CompileInfo("<test>", "exec")
+    error = pytest.raises(SyntaxError, pyparse.PythonParser().parse_source,
+                          source, info)
+    data = pickle.dumps(error.value, 2)
+    assert len(data) < 1000
+    e = pickle.loads(data)
+    assert type(e) is SyntaxError
+    assert e.lines is None
+    assert e.text == u"if x\n"
+    assert (e.msg, e.lineno, e.offset) == (error.value.msg, 10001, 5)
+    for e in [IndentationError("unexpected indent", 1, 3, u"  x\n"),
+              TokenError("parenthesis is never closed", u"(\n", 1, 1, [])]:
+        copy = pickle.loads(pickle.dumps(e, 2))
+        assert type(copy) is type(e)
+        assert copy.__dict__ == e.__dict__
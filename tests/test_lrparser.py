@@ -0,0 +1,140 @@
+import io
+
+import pytest
+
+from syntaxerrors import lrparser, metaparser, parser, pygram, pyparse
+from syntaxerrors.error import SyntaxError, MultipleSyntaxErrors
+
+from tests.test_metaparser import MyGrammar
+from tests.test_parser import SimpleParser
+
+source = b"""\
+import os
+
+def f(a, b=1, *args):
+    if a:
+        return [x for x in b if x]
+    return a.b.c(1, 2) ** -3
+
+class A(object):
+    x = f(1, 2) + `3`
+    print >> x, 1,
+"""
+
+bad_source = b"""\
+def f(a, b=1 *args):
+    x = = 1
+    return a.b.c(1, 2
+class A(object):
+    x f(1, 2)
+"""
+
+
+def parse(source, mode="exec", **kwargs):
+    info = pyparse.CompileInfo("<test>", mode)
+    try:
+        return pyparse.PythonParser(**kwargs).parse_source(source, info)
+    except MultipleSyntaxErrors as e:
+        return [(e.lineno, e.offset, e.msg) for e in e.errors]
+    except SyntaxError as e:
+        return [(e.lineno, e.offset, e.msg)]
+
+def gram_for(grammar_source):
+    return metaparser.ParserGenerator(grammar_source).build_grammar(MyGrammar)
+
+
+def test_python_grammar_is_lalr1():
+    tables = metaparser.build_lr_tables(pygram.python_grammar)
+    assert tables.conflicts == 0
+    num_labels = tables.num_labels
+    for state in range(tables.num_states):
+        # every state that can find an error knows its DFA state
+        actions = tables.actions[state * num_labels:(state + 1) * num_labels]
+        if (tables.default_reductions[state] == -1 and
+                actions != [-1] * num_labels):
+            assert tables.positions[state] is not None
+    assert lrparser.get_tables(pygram.python_grammar) is lrparser.get_tables(
+        pygram.python_grammar_no_print)
+
+@pytest.mark.parametrize("source", [source, bad_source, b"", b"x = (1,\n"])
+def test_same_as_dfa_parser(source):
+    expected = parse(source)
+    assert parse(source, lalr=True) == expected
+    assert parse(source, lalr=True, first_error_only=True) == parse(
+        source, first_error_only=True)
+    if isinstance(expected, list):
+        assert parse(source, lalr=True, build_tree=False) == expected
+    else:
+        assert parse(source, lalr=True, build_tree=False) is None
+
+@pytest.mark.parametrize("source, mode", [
+    (b"1 + 2\n", "eval"),
+    (b"1 2\n", "eval"),
+    (b"x = 1\n", "single"),
+    (b"if x:\n    pass\n\n", "single"),
+    (b"x = 1\ny = 2\n", "single"),
+])
+def test_modes(source, mode):
+    assert parse(source, mode, lalr=True) == parse(source, mode)
+
+def parse_lines(source, **kwargs):
+    info = pyparse.CompileInfo("<test>", "exec")
+    try:
+        return pyparse.PythonParser(**kwargs).parse_lines(
+            io.BytesIO(source), info)
+    except MultipleSyntaxErrors as e:
+        return [(e.lineno, e.offset, e.msg) for e in e.errors]
+
+def test_parse_lines():
+    bad_lines = b"def f(a, b=1 *args):\n    x = = 1\nclass A:\n    x f(1)\n"
+    for text in [source, bad_lines]:
+        assert parse_lines(text, lalr=True) == parse_lines(text)
+    assert isinstance(parse_lines(bad_lines), list)
+
+def test_recovery_stack_is_unchanged():
+    python_parser = pyparse.PythonParser(lalr=True)
+    python_parser.prepare(pygram.syms.file_input)
+    grammar = pygram.python_grammar
+    stack = python_parser.initial_stack().without_nodes()
+    tokens = pyparse.pytokenizer.generate_tokens([b"x = a\n"], 0)
+    for token in tokens[:3]:
+        stack = stack.add_token(grammar, token, grammar.classify(token))
+    before = stack.configuration()
+    # a shifts, but the default reductions before the error are not kept
+    token = parser.Token(pygram.tokens.NAME, u"b", 1, 6, u"x = a b\n")
+    with pytest.raises(parser.SingleParseError):
+        lrparser.add_token(stack, grammar, token, grammar.classify(token))
+    assert stack.configuration() == before
+    newline = tokens[3]
+    stack.add_token(grammar, newline, grammar.classify(newline))
+    assert stack.configuration() == before
+
+def test_small_grammar():
+    g = gram_for(b"foo: NAME bar STRING NEWLINE+ ENDMARKER\n"
+                 b"bar: NAME [bar] NUMBER\n")
+    input = b"hi hello a_name 32 42 'string'"
+    expected = SimpleParser(g).parse(input)
+    assert SimpleParser(g, lalr=True).parse(input) == expected
+    with pytest.raises(parser.SingleParseError) as excinfo:
+        SimpleParser(g).parse(b"hi hello 42 42 'string'")
+    expected_error = excinfo.value
+    with pytest.raises(parser.SingleParseError) as excinfo:
+        SimpleParser(g, lalr=True).parse(b"hi hello 42 42 'string'")
+    assert excinfo.value.token == expected_error.token
+    assert excinfo.value.expected == expected_error.expected
+
+def test_conflicts_resolved_like_dfa_parser():
+    # the else belongs to the innermost if, because the DFA parser takes an
+    # arc whenever it can
+    g = gram_for(b"file: (s | NEWLINE)+ ENDMARKER\n"
+                 b"s: 'if' NAME s ['else' s] | NAME NEWLINE\n")
+    assert metaparser.build_lr_tables(g).conflicts > 0
+    input = b"if a if b x\nelse y\n"
+    expected = SimpleParser(g).parse(input)
+    assert SimpleParser(g, lalr=True).parse(input) == expected
+    inner = expected.get_child(0).get_child(2)
+    assert inner.num_children() == 5
+
+def test_only_node_trees():
+    with pytest.raises(ValueError):
+        pyparse.PythonParser(lalr=True, flat_tree=True)
@@ -116,3 +116,27 @@ class TestParserGenerator:
 
     def test_comments_and_whitespace(self):
         self.gram_for(b"\n\n# comment\nrule: NAME # comment")
+
+def test_python_grammar_is_built_the_same_every_time():
+    # the generated parser and the cached tables rely on the numbering
+    path = os.path.join(os.path.dirname(parser.__file__), "data", "Grammar2.7")
+    with open(path, "rb") as f:
+        source = f.read()
+    from syntaxerrors.pygram import PythonGrammar
+    grams = [ParserGenerator(source).build_grammar(PythonGrammar)
+             for i in range(2)]
+    assert grams[0].labels == grams[1].labels
+    assert ([dfa.states for dfa in grams[0].dfas] ==
+            [dfa.states for dfa in grams[1].dfas])
+    assert ([dfa.first for dfa in grams[0].dfas] ==
+            [dfa.first for dfa in grams[1].dfas])
+
+def test_python_grammar_numbering_matches_generated_parser():
+    # on every interpreter, otherwise the generated parser is not used
+    from syntaxerrors import genparser, parser_generated
+    from syntaxerrors.pygram import PythonGrammar
+    path = os.path.join(os.path.dirname(parser.__file__), "data", "Grammar2.7")
+    with open(path, "rb") as f:
+        gram = ParserGenerator(f.read()).build_grammar(PythonGrammar)
+    assert (genparser.grammar_fingerprint(gram) ==
+            parser_generated.GRAMMAR_FINGERPRINT)
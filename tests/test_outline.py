@@ -0,0 +1,70 @@
+from syntaxerrors import error, pyparse
+
+source = b"""\
+import os
+
+@decorator
+@a.b.c(1)
+def f(a, b=1,
+      *args):
+    if a:
+        def g():
+            return [x for x in b if x]
+        return g
+
+    # a comment
+    return a.b.c(1, 2) ** -3
+
+class A(object):
+    x = f(1, 2) + `3`
+    def m(self): return 1
+    class B:
+        pass
+if os:
+    def h():
+        pass
+"""
+
+
+def spans(source, **kwargs):
+    info = pyparse.CompileInfo("<test>", "exec")
+    result = pyparse.PythonParser().parse_outline(source, info, **kwargs)
+    return [(span.kind, span.name, span.lineno, span.end_lineno, span.depth,
+             span.decorators) for span in result.spans], result.errors
+
+
+def test_outline():
+    result, errors = spans(source)
+    assert result == [
+        (u"def", u"f", 3, 13, 0, [u"decorator", u"a.b.c"]),
+        (u"def", u"g", 8, 9, 1, []),
+        (u"class", u"A", 15, 19, 0, []),
+        (u"def", u"m", 17, 17, 1, []),
+        (u"class", u"B", 18, 19, 1, []),
+        (u"def", u"h", 21, 22, 0, []),
+    ]
+    assert errors == []
+
+def test_broken_source():
+    broken = source.replace(b"return g", b"return = g").replace(
+        b"x = f(1, 2)", b"x f(1, 2)")
+    result, errors = spans(broken)
+    assert result == spans(source)[0]
+    assert errors == []
+    result, errors = spans(broken, check=True)
+    assert result == spans(source)[0]
+    assert [(e.lineno, e.msg) for e in errors] == [
+        (10, "invalid syntax"), (16, "invalid syntax")]
+
+def test_tokenizer_gives_up():
+    result, errors = spans(b"class A:\n    def f(self):\n        x = (1,\n"
+                           b"def g(): pass\n")
+    assert result == [(u"class", u"A", 1, 4, 0, []),
+                      (u"def", u"f", 2, 4, 1, [])]
+    assert len(errors) == 1
+    assert isinstance(errors[0], error.TokenError)
+
+def test_missing_name():
+    result, errors = spans(b"def (x):\n    pass\n", check=True)
+    assert result == [(u"def", None, 1, 2, 0, [])]
+    assert len(errors) == 1
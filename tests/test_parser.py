@@ -8,9 +8,9 @@ from tests.test_metaparser import MyGrammar
 
 
 def test_char_set():
-    first = {5: None, 9: None, 100: None, 255:None}
+    first = {5: None, 9: None, 100: None, 255:None, 256: None, 1000: None}
     p = parser.DFA(None, None, None, first)
-    for i in range(256):
+    for i in range(1100):
         assert p.could_match_token(i) == (i in first)
 
 class SimpleParser(parser.Parser):
@@ -349,3 +349,110 @@ baz: NUMBER
         info = pytest.raises(parser.ParseError, p.parse, b"if 42 42")
         info.value.expected_str == '+'
 
+
+
+def test_action_table_matches_find_action():
+    gram = pygram.python_grammar
+    for dfa in gram.dfas:
+        for state_index in range(len(dfa.states)):
+            for label_index in range(len(gram.labels)):
+                stack = parser.StackEntry(None, dfa, state_index)
+                action, next_state, reductions = gram.actions[
+                    dfa.action_base[state_index] + label_index]
+                expected = parser.find_action(stack, gram, None, label_index)
+                if action == parser.REDUCE:
+                    assert expected[0] == parser.REDUCE
+                    assert reductions[0] == (expected[1], expected[2])
+                    # follow the chain to the final shift
+                    for reduce_state, sub_node_dfa in reductions:
+                        stack = stack.reduce(sub_node_dfa, reduce_state)
+                    expected = parser.find_action(stack, gram, None, label_index)
+                    assert expected == (parser.SHIFT, next_state, None)
+                else:
+                    assert action == expected[0]
+                    if action == parser.SHIFT:
+                        assert next_state == expected[1]
+
+def test_more_than_256_labels():
+    keywords = ["'k%d'" % (i, ) for i in range(300)]
+    gram_source = "foo: bar+ NEWLINE* ENDMARKER\nbar: %s\n" % (
+        " | ".join(keywords), )
+    gram = metaparser.ParserGenerator(
+        gram_source.encode("ascii")).build_grammar(MyGrammar)
+    assert len(gram.labels) > 300
+    tree = SimpleParser(gram).parse(b"k299 k0 k257")
+    assert [tree.get_child(i).get_child(0).value
+            for i in range(3)] == [u"k299", u"k0", u"k257"]
+    with pytest.raises(parser.ParseError):
+        SimpleParser(gram, first_error_only=True).parse(b"k299 k300")
+
+def test_stack_frames_are_interned():
+    gram = pygram.python_grammar
+    dfa1, dfa2 = gram.dfas[0], gram.dfas[1]
+    node = parser.Terminal(gram, 1, u"x", 1, 0)
+    stack1 = parser.StackEntry(None, dfa1, 0).push(dfa2, 1)
+    stack2 = parser.StackEntry(None, dfa1, 0, node).push(dfa2, 1)
+    frame = stack1.frame()
+    assert frame is stack2.frame()
+    assert frame.depth == 2
+    assert frame.dfa is dfa2 and frame.state == 1
+    assert frame.next is stack1.next.frame()
+    assert stack1.switch_state(0).frame() is not frame
+    assert stack1.switch_state(0).switch_state(1).frame() is frame
+    assert stack1.node_append_child(node).frame() is frame
+
+def test_nonterminal_append_child_shares_list():
+    gram = pygram.python_grammar
+    def t(value):
+        return parser.Terminal(gram, 1, value, 1, 0)
+    n0 = parser.Nonterminal(gram, 300, [t(u"a")])
+    n1 = n0.append_child(t(u"b"))
+    n2 = n1.append_child(t(u"c"))
+    assert n2._children is n0._children
+    assert n0.num_children() == 1
+    assert n1.num_children() == 2
+    assert n2.num_children() == 3
+    assert [n2.get_child(i).value for i in range(3)] == [u"a", u"b", u"c"]
+    assert n2.get_child(-1).value == u"c"
+    assert n1.get_child(-1).value == u"b"
+    with pytest.raises(IndexError):
+        n1.get_child(2)
+    # appending to a node that is not the last one copies the children
+    other = n1.append_child(t(u"d"))
+    assert other._children is not n2._children
+    assert [other.get_child(i).value for i in range(3)] == [u"a", u"b", u"d"]
+    assert [n2.get_child(i).value for i in range(3)] == [u"a", u"b", u"c"]
+    assert n1 == parser.Nonterminal(gram, 300, [t(u"a"), t(u"b")])
+
+def test_collapse_chains():
+    from syntaxerrors import pyparse
+    info = pyparse.CompileInfo("<test>", "exec")
+    source = b"x = [1, 2, (3 + 4)]\n"
+    tree = pyparse.PythonParser().parse_source(source, info)
+    info = pyparse.CompileInfo("<test>", "exec")
+    collapsed = pyparse.PythonParser(collapse_chains=True).parse_source(
+        source, info)
+    assert parser.expand_chains(collapsed) == tree
+    syms = pygram.syms
+    # stmt, simple_stmt and small_stmt have more than one descendant with
+    # several children, they stay
+    stmt = collapsed.get_child(0)
+    assert type(stmt) is parser.Nonterminal1
+    simple_stmt = stmt.get_child(0)
+    assert simple_stmt.type == syms.simple_stmt
+    small_stmt = simple_stmt.get_child(0)
+    assert type(small_stmt) is parser.Nonterminal1
+    expr_stmt = small_stmt.get_child(0)
+    assert expr_stmt.type == syms.expr_stmt
+    target = expr_stmt.get_child(0)
+    assert isinstance(target, parser.ChainNonterminal)
+    assert target.type == syms.testlist
+    assert target.chain[0] == syms.test
+    assert target.chain[-1] == syms.atom
+    assert target.get_child(0).get_value() == u"x"
+    # all the chains of the same symbols share one tuple
+    listmaker = expr_stmt.get_child(2).get_child(0).get_child(1)
+    assert listmaker.get_child(0).chain is listmaker.get_child(2).chain
+    expanded = target.expand()
+    assert expanded.type == syms.testlist
+    assert [expanded.get_child(0).type] == [syms.test]
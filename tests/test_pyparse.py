@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import io
+
 import py
 import six
 from syntaxerrors import pyparse
@@ -187,3 +189,128 @@ pass"""
         info = py.test.raises(SyntaxError, self.parse, "def f:\n print 1")
         assert "(expected '(')" in info.value.msg
 
+
+    def test_parse_lines(self):
+        sources = [
+            "x = 1\n",
+            "if x:\n    y = '''a\nb'''\nelse:\n    pass",
+            "# -*- coding: cp1252 -*-\nx = 'caf\xe9'\n",
+            "\xef\xbb\xbfx = 1\r\ny = 2\r\n",
+            "stuff = \"\"\"hello\rworld\"\"\"\n",
+        ]
+        for source in sources:
+            if not isinstance(source, bytes):
+                source = source.encode("latin-1")
+            expected = self.parse(source)
+            info = pyparse.CompileInfo("<test>", "exec")
+            lines = iter(io.BytesIO(source))
+            tree = self.parser.parse_lines(lines, info)
+            assert tree == expected
+
+    def test_parse_file(self, tmpdir):
+        sources = [
+            "",
+            "x = 1",
+            "if x:\n    y = '''a\nb'''\nelse:\n    pass\n",
+            "# -*- coding: cp1252 -*-\nx = 'caf\xe9'\n",
+            "\xef\xbb\xbfx = 1\r\ny = 2\r\n",
+            "\xef\xbb\xbf",
+            "x = '\xc3\xa4'\n",
+        ]
+        path = tmpdir.join("source.py")
+        for source in sources:
+            if not isinstance(source, bytes):
+                source = source.encode("latin-1")
+            expected_info = pyparse.CompileInfo("<test>", "exec")
+            expected = self.parse(source, info=expected_info)
+            path.write_binary(source)
+            info = pyparse.CompileInfo("<test>", "exec")
+            tree = self.parser.parse_file(str(path), info)
+            assert tree == expected
+            assert info.encoding == expected_info.encoding
+        path.write_binary(b"x = (1,\n")
+        info = pyparse.CompileInfo("<test>", "exec")
+        exc = py.test.raises(SyntaxError, self.parser.parse_file, str(path),
+                             info)
+        assert exc.value.msg == "parenthesis is never closed"
+
+    def test_parse_lines_errors(self):
+        info = pyparse.CompileInfo("<test>", "exec")
+        lines = [b"if 1\n", b"    print 4\n"]
+        exc = py.test.raises(SyntaxError, self.parser.parse_lines, lines, info)
+        assert "(expected ':')" in exc.value.msg
+        lines = [b"x = (1,\n", b"2\n"]
+        exc = py.test.raises(SyntaxError, self.parser.parse_lines, lines, info)
+        assert exc.value.msg == "parenthesis is never closed"
+        assert exc.value.filename == "<test>"
+        # the rest of the source is inside the bracket, which is reported
+        # instead of recovering from the errors in it
+        source = b"""\
+if hasattr(sys, "exitfunc"):
+    register(sys.exitf(nc)
+sys.exitfunc = _run_exitfuncs
+
+if __name__ == "__main__":
+    def x1():
+        print "running x1"
+    def x2(n):
+        print "running x2(%r)" % (n,)
+    def x3(n, kwd=None):
+        print "running x3(%r, kwd=%r)" % (n, kwd)
+
+    register(x1)
+    register(x2, 12)
+    register(x3, 5, "bar")
+    register(x3, "no kwd args")
+"""
+        lines = source.splitlines(True)
+        exc = py.test.raises(SyntaxError, self.parser.parse_lines, lines, info)
+        expected = py.test.raises(SyntaxError, self.parse, b"".join(lines))
+        assert exc.value.msg == expected.value.msg
+        assert exc.value.lineno == expected.value.lineno == 2
+
+    def test_validate_only(self):
+        p = pyparse.PythonParser(build_tree=False)
+        info = pyparse.CompileInfo("<test>", "exec")
+        assert p.parse_source(b"def f(x):\n    return x + 1\n", info) is None
+        info = pyparse.CompileInfo("<test>", "exec")
+        assert p.parse_lines([b"x = [1,\n", b"2]\n"], info) is None
+        for source in ["if 1\n    pass\n", "x = = 1\n", "x = (1,\n",
+                       "  x = 1\n", "if 1:\npass\n"]:
+            exc1 = py.test.raises(SyntaxError, self.parse, source)
+            info = pyparse.CompileInfo("<test>", "exec")
+            exc2 = py.test.raises(SyntaxError, p.parse_source,
+                                  source.encode("ascii"), info)
+            assert type(exc1.value) is type(exc2.value)
+            assert exc1.value.msg == exc2.value.msg
+            assert exc1.value.lineno == exc2.value.lineno
+            assert exc1.value.offset == exc2.value.offset
+
+    def test_invalid_utf8(self, tmpdir):
+        source = b'x = 1\ny = "\xe4"\n'
+        path = tmpdir.join("source.py")
+        path.write_binary(source)
+        info = pyparse.CompileInfo("<test>", "exec")
+        for p in [self.parser, pyparse.PythonParser(build_tree=False)]:
+            for parse in [lambda: p.parse_source(source, info),
+                          lambda: p.parse_file(str(path), info)]:
+                exc = py.test.raises(SyntaxError, parse).value
+                assert "can't decode byte 0xe4" in exc.msg
+                assert exc.lineno == 2
+                assert exc.offset == 6
+                assert exc.filename == "<test>"
+        # parse_lines checks the lines as they are read
+        for source in [b'x = 1\ny = "\xe4"\n',
+                       b'# coding: iso-8859-1\ny = "\xe4"\n',
+                       b'x = (1,\ny, "\xe4")\n']:
+            info = pyparse.CompileInfo("<test>", "exec")
+            expected = py.test.raises(SyntaxError, self.parse, source).value
+            exc = py.test.raises(SyntaxError, self.parser.parse_lines,
+                                 source.splitlines(True), info).value
+            assert type(exc) is type(expected)
+            assert exc.msg == expected.msg
+            assert "can't decode byte 0xe4" in exc.msg
+            assert exc.lineno == expected.lineno == 2
+            assert exc.offset == expected.offset
+            assert exc.text == expected.text
+            assert exc.filename == "<test>"
@@ -3,8 +3,8 @@ import os
 
 import pytest
 
-from syntaxerrors import pyparse
-from syntaxerrors.error import MultipleSyntaxErrors
+from syntaxerrors import pyparse, recovery
+from syntaxerrors.error import MultipleSyntaxErrors, SyntaxError
 
 def test_find_four_errors():
     info = pyparse.CompileInfo("<string>", "exec")
@@ -333,3 +333,140 @@ if x
         assert len(e.errors) == 2
         assert [x.lineno for x in e.errors] == [2, 8]
         print(pyparse.format_messages(e))
+
+
+def test_parse_lines_recovers():
+    source = b"""
+if a
+    print 2
+
+x +=
+
+print 4
+
+x * * * * x
+
+for i in range(10):
+    print i
+
+i += 1
+
+if a
+    print 5
+
+"""
+    info = pyparse.CompileInfo("<string>", "exec")
+    p = pyparse.PythonParser()
+    with pytest.raises(MultipleSyntaxErrors) as excinfo:
+        p.parse_lines(source.splitlines(True), info)
+    assert [x.lineno for x in excinfo.value.errors] == [2, 5, 9, 16]
+
+@pytest.mark.parametrize("strategy", [recovery.BREADTH_FIRST,
+                                      recovery.BEST_FIRST])
+def test_recovery_strategies(monkeypatch, strategy):
+    monkeypatch.setattr(recovery, "STRATEGY", strategy)
+    source = b"""
+if a
+    print 2
+
+x +=
+
+print 4
+
+x * * * * x
+
+for i in range(10):
+    print i
+
+i += 1
+
+if a
+    print 5
+
+"""
+    info = pyparse.CompileInfo("<string>", "exec")
+    p = pyparse.PythonParser()
+    with pytest.raises(MultipleSyntaxErrors) as excinfo:
+        p.parse_source(source, info)
+    assert [x.lineno for x in excinfo.value.errors] == [2, 5, 9, 16]
+
+def test_unknown_recovery_strategy():
+    with pytest.raises(ValueError):
+        recovery.try_recover(None, None, [], 0, "depth-first")
+
+def find_repairs(monkeypatch, source):
+    """Parse source and return the repairs both strategies find for each
+    error, as tuples (name, cost, attempts, replays)."""
+    found = []
+    try_recover = recovery.try_recover
+    def compare(grammar, stack, tokens, index):
+        results = {}
+        for strategy in (recovery.BREADTH_FIRST, recovery.BEST_FIRST):
+            repair, attempts, replays = recovery.find_repair(
+                grammar, stack, tokens, index, strategy)
+            results[strategy] = (repair.name, repair.cost, attempts, replays)
+        found.append(results)
+        return try_recover(grammar, stack, tokens, index)
+    monkeypatch.setattr(recovery, "try_recover", compare)
+    info = pyparse.CompileInfo("<string>", "exec")
+    with pytest.raises((SyntaxError, MultipleSyntaxErrors)):
+        pyparse.PythonParser().parse_source(source, info)
+    return found
+
+def test_best_first_finds_cheaper_repair(monkeypatch):
+    [found] = find_repairs(monkeypatch, b"s = (f'a' f'b')\nx = 1\n")
+    # breadth first finds "ddd" first, which has the same length
+    assert found[recovery.BREADTH_FIRST][:2] == ("ddd", 3)
+    assert found[recovery.BEST_FIRST][:2] == ("ied", 2)
+    assert (found[recovery.BEST_FIRST][3] <=
+            found[recovery.BREADTH_FIRST][3])
+
+def test_best_first_tries_fewer_repairs(monkeypatch):
+    source = b"""\
+print(f"U: {u!r} ({e(u)})")
+print(f"S: {s!r} ({e(s)})")
+print(f"E: {E!r}")
+sys.exit(0)
+"""
+    found = find_repairs(monkeypatch, source)
+    assert len(found) == 2
+    breadth_first = found[0][recovery.BREADTH_FIRST]
+    best_first = found[0][recovery.BEST_FIRST]
+    # the repair consumes four existing tokens, breadth first search has to
+    # try all shorter repairs before
+    assert breadth_first[:2] == best_first[:2] == ("deeeed", 2)
+    assert best_first[2] * 10 < breadth_first[2]
+    assert best_first[3] * 10 < breadth_first[3]
+    assert found[1][recovery.BREADTH_FIRST] == found[1][recovery.BEST_FIRST]
+
+def test_validate_only_finds_all_errors():
+    source = b"""
+if a
+    print 2
+
+x +=
+
+print 4
+
+x * * * * x
+
+for i in range(10):
+    print i
+
+i += 1
+
+if a
+    print 5
+
+"""
+    info = pyparse.CompileInfo("<string>", "exec")
+    p = pyparse.PythonParser(build_tree=False)
+    with pytest.raises(MultipleSyntaxErrors) as excinfo:
+        p.parse_source(source, info)
+    assert [x.lineno for x in excinfo.value.errors] == [2, 5, 9, 16]
+
+    info = pyparse.CompileInfo("<string>", "exec")
+    p = pyparse.PythonParser(build_tree=False, first_error_only=True)
+    with pytest.raises(SyntaxError) as excinfo:
+        p.parse_source(source, info)
+    assert excinfo.value.lineno == 2
@@ -86,3 +86,112 @@ class TestTokenizer(object):
 
     def test_eof_triple_quoted(self):
         check_token_error(b"'''", pos=1, line=1)
+
+def test_iter_tokens_is_lazy():
+    consumed = []
+    def lines():
+        for line in [b"a = 1\n", b"b = 2\n", b"c = 3\n"]:
+            consumed.append(line)
+            yield line
+    it = pytokenizer.iter_tokens(lines(), 0)
+    assert next(it).value == u"a"
+    assert consumed == [b"a = 1\n"]
+    tks = [tok.value for tok in it]
+    assert tks[-6:] == [u"c", u"=", u"3", u"", u"\n", u""]
+    assert len(consumed) == 3
+
+def test_iter_tokens_reads_ahead_in_brackets():
+    consumed = []
+    def lines():
+        for line in [b"a = (1,\n", b"2)\n", b"b = 1\n", b"c = 3\n",
+                     b"d = 4\n"]:
+            consumed.append(line)
+            yield line
+    it = pytokenizer.iter_tokens(lines(), 0)
+    assert next(it).value == u"a"
+    assert len(consumed) == 1
+    # the lines in the bracket are read as many at a time as there are
+    # in the buffer already
+    assert [next(it).value for i in range(5)] == [u"=", u"(", u"1", u",", u"2"]
+    assert len(consumed) == 3
+    assert [next(it).value for i in range(7)][-1] == u"c"
+    assert len(consumed) == 4
+
+def test_generate_tokens_error_carries_tokens():
+    error = pytest.raises(TokenError, tokenize, b"a = (1,\n")
+    assert [tok.value for tok in error.value.tokens] == [u"a", u"=", u"(", u"1", u","]
+
+def source_tokens(s, **kwargs):
+    try:
+        result = pytokenizer.generate_source_tokens(s, 0, **kwargs)
+    except TokenError as e:
+        return e.msg, e.lineno, e.offset, e.text, [
+            (tok.token_type, tok.value, tok.lineno, tok.column)
+            for tok in e.tokens]
+    return [(tok.token_type, tok.value, tok.lineno, tok.column, tok.line)
+            for tok in result]
+
+@pytest.mark.parametrize("s", [
+    b"",
+    b"x = 1",
+    b"if x:\r\n    y = 2\r\n  # comment\r\n    z\r\n",
+    b"a\rb\r",
+    b"s = '''a\nb\nc''' + 1; t = '''d\ne'''\nx\n",
+    b"def f():\n    '''doc\r\n    more'''\n    return 1\n",
+    b"x = [\n'''a\nb''',\n]\n",
+    b"s = 'a\\\nb'\n",
+    b"s = 'a\\\nb\n",
+    b"s = '''abc\n\n",
+    b"x = (1,\n2\n",
+    b"x = \\\n",
+    b"(\n]\n",
+    b"x = 'abc\n",
+    b"x = [\n" + b"    1,\n" * 50 + b"]\ny = '''\n" + b"a\n" * 50 + b"'''\n",
+    b"x = (\n" + b"    1,\n" * 50 + b"y = '''\n" + b"a\n" * 50,
+])
+def test_source_tokens_same_as_lines(s):
+    expected = source_tokens(s)
+    lines = s.splitlines(True)
+    if lines and not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"
+    try:
+        result = pytokenizer.generate_tokens(lines, 0)
+    except TokenError as e:
+        assert expected == (e.msg, e.lineno, e.offset, e.text, [
+            (tok.token_type, tok.value, tok.lineno, tok.column)
+            for tok in e.tokens])
+    else:
+        assert expected == [(tok.token_type, tok.value, tok.lineno,
+                             tok.column, tok.line) for tok in result]
+    assert source_tokens(s, compact=True) == expected
+
+def test_source_tokens_lineno():
+    tks = pytokenizer.generate_source_tokens(b"x = '''\n'''\ny\n", 0,
+                                             lineno=10)
+    assert [(tok.value, tok.lineno) for tok in tks] == [
+        (u"x", 10), (u"=", 10), (u"'''\n'''", 10), (u"", 11), (u"y", 12),
+        (u"", 12), (u"\n", 12), (u"", 12)]
+
+def test_source_tokens_are_decoded_lazily():
+    tks = pytokenizer.generate_source_tokens(u"x = '\xe4'\n".encode("utf-8"), 0)
+    assert tks[2]._value == u"'\xe4'".encode("utf-8")
+    assert tks[2].value == u"'\xe4'"
+    assert not hasattr(tks[2], "_value")
+    assert tks[2] == Token(tokens.STRING, u"'\xe4'", 1, 4, u"x = '\xe4'\n")
+    # pure ASCII sources are decoded as a whole
+    tks = pytokenizer.generate_source_tokens(b"x = 'a'\n", 0)
+    assert not hasattr(tks[2], "_value")
+    assert tks[2] == Token(tokens.STRING, u"'a'", 1, 4, u"x = 'a'\n")
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 20])
+def test_source_tokens_invalid_utf8(monkeypatch, chunk_size):
+    monkeypatch.setattr(pytokenizer, "CHECK_CHUNK_SIZE", chunk_size)
+    s = u"x = '\xe4'\ny = '\xe4".encode("utf-8") + b"\xe4'\nz\n"
+    for compact in (False, True):
+        error = pytest.raises(TokenError, pytokenizer.generate_source_tokens,
+                              s, 0, compact=compact).value
+        assert error.msg == ("(unicode error) 'utf-8' codec can't decode "
+                             "byte 0xe4: invalid continuation byte")
+        assert error.lineno == 2
+        assert error.offset == 8
+        assert error.text == u"y = '\xe4\ufffd'\n"
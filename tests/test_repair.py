@@ -14,3 +14,30 @@ def test_blacklist_token():
     gram.token_ids[3] = 5
     gram.never_generate_as_fake = {3}
     assert gram.repair_fake_tokens() == [(1, "fake")]
+
+def test_repair_covers():
+    def covers(name1, name2):
+        return recovery.Repair(None, 0, name1).covers(
+            recovery.Repair(None, 0, name2))
+    assert covers("d", "d")
+    assert covers("d", "dd")
+    assert covers("ie", "iie")
+    assert not covers("dd", "d")
+    assert covers("ie", "ei")
+    assert not covers("ei", "ie")
+    assert not covers("di", "id")
+    assert not covers("", "d")
+
+def test_repair_memo():
+    gram = parser.Grammar()
+    dfa = parser.DFA(gram, 256, [([], True)], {})
+    stack1 = parser.StackEntry(None, dfa, 0)
+    stack2 = parser.StackEntry(None, dfa, 0, parser.Terminal(gram, 1, "x", 1, 0))
+    memo = recovery.RepairMemo()
+    r1 = recovery.Repair(stack1, 1, "d")
+    r2 = recovery.Repair(stack2, 1, "dd")
+    r3 = recovery.Repair(stack2, 1, "i")
+    assert r1.key() == r2.key()
+    assert memo.add(r1, r1.key())
+    assert not memo.add(r2, r2.key())
+    assert memo.add(r3, r3.key())
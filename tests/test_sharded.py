@@ -0,0 +1,102 @@
+import pytest
+
+from syntaxerrors import parser, pyparse, sharded
+from syntaxerrors.error import SyntaxError, MultipleSyntaxErrors
+
+source = b'''\
+import os
+
+def f(a, b=1, *args):
+    if a:
+        return [x for x in b if x]
+    return a.b.c(1, 2) ** -3
+x = (1,
+2)
+s = """
+not = a statement
+"""
+if x:
+    pass
+else:
+    print x
+y = 1 + \\
+2
+@decorator
+# comment
+def g():
+    pass
+class A(object):
+    x = f(1, 2) + `3`
+# a comment at the end
+'''
+
+
+@pytest.fixture
+def small_shards(monkeypatch):
+    monkeypatch.setattr(sharded, "MIN_SHARD_SIZE", 10)
+
+
+def starts(source, cut_points):
+    return [source[pos:pos + 4] for pos in cut_points]
+
+def test_find_cut_points():
+    cut_points = sharded.find_cut_points(source, 100)
+    assert starts(source, cut_points) == [
+        b"def ", b"x = ", b"s = ", b"if x", b"y = ", b"@dec", b"clas"]
+    # the shards have roughly the same size
+    assert sharded.find_cut_points(source, 2) == [
+        source.index(b"\nif x") + 1]
+    assert sharded.find_cut_points(source, 100, start=source.index(
+        b"x = (") + 1) == cut_points[2:]
+
+def test_find_cut_points_unterminated_string():
+    assert sharded.find_cut_points(b"x = 1\ny = 'abc\nz = 2\n", 3) == []
+
+
+def terminals(node, result):
+    if isinstance(node, parser.Terminal):
+        result.append((node.type, node.value, node.lineno, node.column))
+    else:
+        result.append(node.type)
+        for i in range(node.num_children()):
+            terminals(node.get_child(i), result)
+    return result
+
+def parse(source, sharded=False, **kwargs):
+    python_parser = pyparse.PythonParser(**kwargs)
+    info = pyparse.CompileInfo("<test>", "exec")
+    try:
+        if sharded:
+            return python_parser.parse_sharded(source, info, processes=4)
+        return python_parser.parse_source(source, info)
+    except MultipleSyntaxErrors as e:
+        return [(e.lineno, e.offset, e.msg) for e in e.errors]
+    except SyntaxError as e:
+        return [(e.lineno, e.offset, e.msg)]
+
+def test_same_tree(small_shards):
+    expected = parse(source)
+    tree = parse(source, sharded=True)
+    assert terminals(tree, []) == terminals(expected, [])
+    assert parse(source, sharded=True, build_tree=False) is None
+
+def test_future_imports(small_shards):
+    text = (b"from __future__ import division\n"
+            b"from __future__ import with_statement\nx = 1 / 2\n")
+    info = pyparse.CompileInfo("<test>", "exec")
+    tree = pyparse.PythonParser().parse_sharded(text, info, processes=4)
+    assert terminals(tree, []) == terminals(parse(text), [])
+    assert info.last_future_import == (2, 23)
+    assert sharded.find_cut_points(text, 4, text.rfind(b"__future__")) == [
+        text.index(b"x = ")]
+
+@pytest.mark.parametrize("text", [
+    source.replace(b"if x:", b"if x"),
+    source.replace(b"x = (1,", b"x = (1,)"),
+    source.replace(b"x = (1,", b"x = [1,"),
+])
+def test_errors(small_shards, text):
+    errors = parse(text, sharded=True)
+    assert isinstance(errors, list)
+    assert errors == parse(text)
+    assert parse(text, sharded=True, build_tree=False) == errors
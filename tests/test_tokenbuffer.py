@@ -0,0 +1,82 @@
+import pytest
+
+from syntaxerrors import pytokenizer, pyparse, recovery
+from syntaxerrors.parser import Token
+from syntaxerrors.error import TokenError, MultipleSyntaxErrors
+from syntaxerrors.pytoken import tokens
+from syntaxerrors.linetable import LineTable
+from syntaxerrors.tokenbuffer import TokenBuffer
+
+source = b"""\
+def f(a, b=u'\xc3\xa4'):
+    '''doc
+    string'''
+    return [a,
+            b] # comment
+"""
+
+def test_same_tokens_as_list():
+    lines = source.splitlines(True)
+    expected = pytokenizer.generate_tokens(lines, 0)
+    buf = pytokenizer.generate_token_buffer(lines, 0)
+    assert len(buf) == len(expected)
+    assert list(buf) == expected
+    assert buf.tokens() == expected
+    assert buf[-1] == expected[-1]
+    with pytest.raises(IndexError):
+        buf[len(expected)]
+
+def test_lines_are_shared():
+    buf = pytokenizer.generate_token_buffer([b"a = b + c\n", b"d\n"], 0)
+    assert buf.lines[0] == u"a = b + c\n"
+    assert list(buf.line_indexes[:5]) == [0] * 5
+    assert buf[0].line is buf[4].line
+
+def test_source_lines_in_line_table():
+    buf = pytokenizer.generate_source_tokens(source, 0, compact=True)
+    assert isinstance(buf.lines, LineTable)
+    assert list(buf.line_indexes[:3]) == [0] * 3
+    assert buf[0].line == u"def f(a, b=u'\xe4'):\n"
+    assert buf[0].line is buf[2].line
+    assert list(buf) == pytokenizer.generate_tokens(source.splitlines(True), 0)
+
+def test_label_index():
+    buf = TokenBuffer()
+    buf.append(Token(tokens.NAME, u"x", 1, 0, u"x\n"))
+    view = buf[0]
+    assert view.label_index == -1
+    view.label_index = 5
+    assert buf[0].label_index == 5
+    assert buf.token(0).label_index == 5
+
+def test_error_carries_buffer():
+    error = pytest.raises(TokenError, pytokenizer.generate_token_buffer,
+                          [b"a = (1,\n"], 0)
+    assert isinstance(error.value.tokens, TokenBuffer)
+    assert [tok.value for tok in error.value.tokens] == [u"a", u"=", u"(", u"1", u","]
+
+def test_parse():
+    info = pyparse.CompileInfo("<string>", "exec")
+    expected = pyparse.PythonParser().parse_source(source, info)
+    info = pyparse.CompileInfo("<string>", "exec")
+    p = pyparse.PythonParser(compact_tokens=True)
+    assert p.parse_source(source, info) == expected
+
+def test_recovery():
+    info = pyparse.CompileInfo("<string>", "exec")
+    p = pyparse.PythonParser(compact_tokens=True)
+    with pytest.raises(MultipleSyntaxErrors) as excinfo:
+        p.parse_source(b"""
+if a
+    print 2
+
+x +=
+
+print 4
+
+if a
+    print 5
+
+""", info)
+    assert [x.lineno for x in excinfo.value.errors] == [2, 5, 9]
+    assert excinfo.value.errors[0].text == u"if a\n"
@@ -0,0 +1,60 @@
+from syntaxerrors import pygram, pytokenizer
+from syntaxerrors.parser import Token
+from syntaxerrors.pytoken import tokens
+from syntaxerrors.tokenlabels import TokenLabels
+
+source = b"""\
+print x
+if x:
+    y = u'\xc3\xa4' + x
+"""
+
+
+def slow_classify(grammar, token):
+    token = Token(token.token_type, token.value, token.lineno, token.column,
+                  token.line)
+    return grammar.classify(token)
+
+def test_same_labels_as_classify():
+    labels = TokenLabels([pygram.python_grammar,
+                          pygram.python_grammar_no_print])
+    tks = pytokenizer.generate_source_tokens(source, 0, labels=labels)
+    for grammar in [pygram.python_grammar, pygram.python_grammar_no_print]:
+        for token in tks:
+            assert token.labels[grammar.label_slot] == slow_classify(
+                grammar, token)
+    assert tks[0].labels == (pygram.python_grammar.keyword_ids[u"print"],
+                             pygram.python_grammar.token_ids[tokens.NAME])
+
+def test_classify():
+    tks = pytokenizer.generate_source_tokens(source, 0,
+                                             labels=pygram.token_labels)
+    for grammar in [pygram.python_grammar_no_print,
+                    pygram.python_grammar_no_print_revdb]:
+        token = tks[0]
+        token.label_index = -1
+        assert grammar.classify(token) == slow_classify(grammar, token)
+
+def test_names_are_interned():
+    labels = TokenLabels([pygram.python_grammar])
+    tks1 = pytokenizer.generate_source_tokens(source, 0, labels=labels)
+    # pure ASCII, so the values are sliced as text instead of bytes
+    tks2 = pytokenizer.generate_source_tokens(source.replace(
+        b"u'\xc3\xa4'", b"1"), 0, labels=labels)
+    names = [token for token in tks1 + tks2 if token.value == u"x"]
+    assert len(names) == 6
+    assert all(token.value is names[0].value for token in names)
+    assert tks2[8].value == u"y"
+    assert tks2[8].labels == (pygram.python_grammar.token_ids[tokens.NAME], )
+
+def test_names_are_bounded(monkeypatch):
+    from syntaxerrors import tokenlabels
+    monkeypatch.setattr(tokenlabels, "MAX_NAMES", 10)
+    labels = TokenLabels([pygram.python_grammar])
+    source = b"".join([b"x%d = 1\n" % (i, ) for i in range(30)])
+    tks = pytokenizer.generate_source_tokens(source, 0, labels=labels)
+    assert len(labels.names) <= 10
+    names = [token for token in tks if token.token_type == tokens.NAME]
+    assert [token.value for token in names] == [u"x%d" % (i, )
+                                                for i in range(30)]
+    assert names[-1].labels == (pygram.python_grammar.token_ids[tokens.NAME], )